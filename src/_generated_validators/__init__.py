@@ -0,0 +1,4 @@
+"""
+Ahead-of-time compiled fastjsonschema validators, one module per schema.
+Generated by `python -m src.regen_validators`; do not edit by hand.
+"""
@@ -0,0 +1,198 @@
+"""Generated by `python -m src.regen_validators` from the "item" schema. Do not edit."""
+SCHEMA_HASH = "366650decb9e311f320a83a4985d94d2ee185d885014568377421f32c1dbdfcc"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'ClothingItem', 'description': 'A single clothing item in the catalog', 'type': 'object', 'required': ['item_id', 'title', 'role', 'color', 'style'], 'properties': {'item_id': {'type': 'string', 'description': 'Unique identifier for the item'}, 'title': {'type': 'string', 'description': "Human-readable name (e.g., '白色棉質襯衫')"}, 'description': {'type': 'string', 'description': 'Detailed description for embedding'}, 'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory'], 'description': 'Position/role in outfit'}, 'color': {'type': 'string', 'description': "Primary color (e.g., 'white', 'navy')"}, 'colors_secondary': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Secondary colors'}, 'style': {'type': 'array', 'items': {'type': 'string', 'enum': ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']}, 'description': 'Style categories'}, 'material': {'type': 'array', 'items': {'type': 'string'}, 'description': "Material composition (e.g., ['cotton', 'polyester'])"}, 'pattern': {'type': 'array', 'items': {'type': 'string'}, 'description': "Pattern types (e.g., ['plain', 'stripe', 'floral'])"}, 'season': {'type': 'array', 'items': {'type': 'string', 'enum': ['spring', 'summer', 'fall', 'winter']}, 'description': 'Suitable seasons'}, 'fit': {'type': 'string', 'enum': ['slim', 'regular', 'relaxed', 'oversized'], 'description': 'Fit type'}, 'length': {'type': 'string', 'enum': ['short', 'knee', 'midi', 'long'], 'description': 'Length category'}, 'gender': {'type': 'string', 'enum': ['male', 'female', 'unisex'], 'description': 'Target gender'}, 'age_range': {'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2, 'maxItems': 2, 'description': '[min_age, max_age]'}, 'brand': {'type': 'string', 'description': 'Brand name (optional)'}, 'price_usd': {'type': 'number', 'description': 'Price in USD'}, 'popularity': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Popularity score (0-1)'}, 'available': {'type': 'boolean', 'default': True, 'description': 'In-stock status'}, 'image_url': {'type': 'string', 'format': 'uri', 'description': 'Product image URL'}, 'embedding': {'type': 'array', 'items': {'type': 'number'}, 'description': 'Text/visual embedding vector'}, 'tags': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Searchable tags'}, 'metadata': {'type': 'object', 'description': 'Additional metadata'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['item_id', 'title', 'role', 'color', 'style']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'ClothingItem', 'description': 'A single clothing item in the catalog', 'type': 'object', 'required': ['item_id', 'title', 'role', 'color', 'style'], 'properties': {'item_id': {'type': 'string', 'description': 'Unique identifier for the item'}, 'title': {'type': 'string', 'description': "Human-readable name (e.g., '白色棉質襯衫')"}, 'description': {'type': 'string', 'description': 'Detailed description for embedding'}, 'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory'], 'description': 'Position/role in outfit'}, 'color': {'type': 'string', 'description': "Primary color (e.g., 'white', 'navy')"}, 'colors_secondary': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Secondary colors'}, 'style': {'type': 'array', 'items': {'type': 'string', 'enum': ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']}, 'description': 'Style categories'}, 'material': {'type': 'array', 'items': {'type': 'string'}, 'description': "Material composition (e.g., ['cotton', 'polyester'])"}, 'pattern': {'type': 'array', 'items': {'type': 'string'}, 'description': "Pattern types (e.g., ['plain', 'stripe', 'floral'])"}, 'season': {'type': 'array', 'items': {'type': 'string', 'enum': ['spring', 'summer', 'fall', 'winter']}, 'description': 'Suitable seasons'}, 'fit': {'type': 'string', 'enum': ['slim', 'regular', 'relaxed', 'oversized'], 'description': 'Fit type'}, 'length': {'type': 'string', 'enum': ['short', 'knee', 'midi', 'long'], 'description': 'Length category'}, 'gender': {'type': 'string', 'enum': ['male', 'female', 'unisex'], 'description': 'Target gender'}, 'age_range': {'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2, 'maxItems': 2, 'description': '[min_age, max_age]'}, 'brand': {'type': 'string', 'description': 'Brand name (optional)'}, 'price_usd': {'type': 'number', 'description': 'Price in USD'}, 'popularity': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Popularity score (0-1)'}, 'available': {'type': 'boolean', 'default': True, 'description': 'In-stock status'}, 'image_url': {'type': 'string', 'format': 'uri', 'description': 'Product image URL'}, 'embedding': {'type': 'array', 'items': {'type': 'number'}, 'description': 'Text/visual embedding vector'}, 'tags': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Searchable tags'}, 'metadata': {'type': 'object', 'description': 'Additional metadata'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "item_id" in data_keys:
+            data_keys.remove("item_id")
+            data__itemid = data["item_id"]
+            if not isinstance(data__itemid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".item_id must be string", value=data__itemid, name="" + (name_prefix or "data") + ".item_id", definition={'type': 'string', 'description': 'Unique identifier for the item'}, rule='type')
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': "Human-readable name (e.g., '白色棉質襯衫')"}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Detailed description for embedding'}, rule='type')
+        if "role" in data_keys:
+            data_keys.remove("role")
+            data__role = data["role"]
+            if not isinstance(data__role, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".role must be string", value=data__role, name="" + (name_prefix or "data") + ".role", definition={'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory'], 'description': 'Position/role in outfit'}, rule='type')
+            if not (isinstance(data__role, str) and data__role == 'top' or isinstance(data__role, str) and data__role == 'bottom' or isinstance(data__role, str) and data__role == 'outer' or isinstance(data__role, str) and data__role == 'shoes' or isinstance(data__role, str) and data__role == 'accessory'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".role must be one of ['top', 'bottom', 'outer', 'shoes', 'accessory']", value=data__role, name="" + (name_prefix or "data") + ".role", definition={'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory'], 'description': 'Position/role in outfit'}, rule='enum')
+        if "color" in data_keys:
+            data_keys.remove("color")
+            data__color = data["color"]
+            if not isinstance(data__color, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".color must be string", value=data__color, name="" + (name_prefix or "data") + ".color", definition={'type': 'string', 'description': "Primary color (e.g., 'white', 'navy')"}, rule='type')
+        if "colors_secondary" in data_keys:
+            data_keys.remove("colors_secondary")
+            data__colorssecondary = data["colors_secondary"]
+            if not isinstance(data__colorssecondary, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".colors_secondary must be array", value=data__colorssecondary, name="" + (name_prefix or "data") + ".colors_secondary", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Secondary colors'}, rule='type')
+            data__colorssecondary_is_list = isinstance(data__colorssecondary, (list, tuple))
+            if data__colorssecondary_is_list:
+                data__colorssecondary_len = len(data__colorssecondary)
+                for data__colorssecondary_x, data__colorssecondary_item in enumerate(data__colorssecondary):
+                    if not isinstance(data__colorssecondary_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".colors_secondary[{data__colorssecondary_x}]".format(**locals()) + " must be string", value=data__colorssecondary_item, name="" + (name_prefix or "data") + ".colors_secondary[{data__colorssecondary_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "style" in data_keys:
+            data_keys.remove("style")
+            data__style = data["style"]
+            if not isinstance(data__style, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".style must be array", value=data__style, name="" + (name_prefix or "data") + ".style", definition={'type': 'array', 'items': {'type': 'string', 'enum': ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']}, 'description': 'Style categories'}, rule='type')
+            data__style_is_list = isinstance(data__style, (list, tuple))
+            if data__style_is_list:
+                data__style_len = len(data__style)
+                for data__style_x, data__style_item in enumerate(data__style):
+                    if not isinstance(data__style_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".style[{data__style_x}]".format(**locals()) + " must be string", value=data__style_item, name="" + (name_prefix or "data") + ".style[{data__style_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']}, rule='type')
+                    if not (isinstance(data__style_item, str) and data__style_item == 'casual' or isinstance(data__style_item, str) and data__style_item == 'formal' or isinstance(data__style_item, str) and data__style_item == 'sporty' or isinstance(data__style_item, str) and data__style_item == 'boho' or isinstance(data__style_item, str) and data__style_item == 'street' or isinstance(data__style_item, str) and data__style_item == 'smart-casual' or isinstance(data__style_item, str) and data__style_item == 'elegant' or isinstance(data__style_item, str) and data__style_item == 'vintage' or isinstance(data__style_item, str) and data__style_item == 'minimalist' or isinstance(data__style_item, str) and data__style_item == 'professional' or isinstance(data__style_item, str) and data__style_item == 'romantic'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".style[{data__style_x}]".format(**locals()) + " must be one of ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']", value=data__style_item, name="" + (name_prefix or "data") + ".style[{data__style_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['casual', 'formal', 'sporty', 'boho', 'street', 'smart-casual', 'elegant', 'vintage', 'minimalist', 'professional', 'romantic']}, rule='enum')
+        if "material" in data_keys:
+            data_keys.remove("material")
+            data__material = data["material"]
+            if not isinstance(data__material, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".material must be array", value=data__material, name="" + (name_prefix or "data") + ".material", definition={'type': 'array', 'items': {'type': 'string'}, 'description': "Material composition (e.g., ['cotton', 'polyester'])"}, rule='type')
+            data__material_is_list = isinstance(data__material, (list, tuple))
+            if data__material_is_list:
+                data__material_len = len(data__material)
+                for data__material_x, data__material_item in enumerate(data__material):
+                    if not isinstance(data__material_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".material[{data__material_x}]".format(**locals()) + " must be string", value=data__material_item, name="" + (name_prefix or "data") + ".material[{data__material_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "pattern" in data_keys:
+            data_keys.remove("pattern")
+            data__pattern = data["pattern"]
+            if not isinstance(data__pattern, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".pattern must be array", value=data__pattern, name="" + (name_prefix or "data") + ".pattern", definition={'type': 'array', 'items': {'type': 'string'}, 'description': "Pattern types (e.g., ['plain', 'stripe', 'floral'])"}, rule='type')
+            data__pattern_is_list = isinstance(data__pattern, (list, tuple))
+            if data__pattern_is_list:
+                data__pattern_len = len(data__pattern)
+                for data__pattern_x, data__pattern_item in enumerate(data__pattern):
+                    if not isinstance(data__pattern_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".pattern[{data__pattern_x}]".format(**locals()) + " must be string", value=data__pattern_item, name="" + (name_prefix or "data") + ".pattern[{data__pattern_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "season" in data_keys:
+            data_keys.remove("season")
+            data__season = data["season"]
+            if not isinstance(data__season, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".season must be array", value=data__season, name="" + (name_prefix or "data") + ".season", definition={'type': 'array', 'items': {'type': 'string', 'enum': ['spring', 'summer', 'fall', 'winter']}, 'description': 'Suitable seasons'}, rule='type')
+            data__season_is_list = isinstance(data__season, (list, tuple))
+            if data__season_is_list:
+                data__season_len = len(data__season)
+                for data__season_x, data__season_item in enumerate(data__season):
+                    if not isinstance(data__season_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".season[{data__season_x}]".format(**locals()) + " must be string", value=data__season_item, name="" + (name_prefix or "data") + ".season[{data__season_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['spring', 'summer', 'fall', 'winter']}, rule='type')
+                    if not (isinstance(data__season_item, str) and data__season_item == 'spring' or isinstance(data__season_item, str) and data__season_item == 'summer' or isinstance(data__season_item, str) and data__season_item == 'fall' or isinstance(data__season_item, str) and data__season_item == 'winter'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".season[{data__season_x}]".format(**locals()) + " must be one of ['spring', 'summer', 'fall', 'winter']", value=data__season_item, name="" + (name_prefix or "data") + ".season[{data__season_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['spring', 'summer', 'fall', 'winter']}, rule='enum')
+        if "fit" in data_keys:
+            data_keys.remove("fit")
+            data__fit = data["fit"]
+            if not isinstance(data__fit, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fit must be string", value=data__fit, name="" + (name_prefix or "data") + ".fit", definition={'type': 'string', 'enum': ['slim', 'regular', 'relaxed', 'oversized'], 'description': 'Fit type'}, rule='type')
+            if not (isinstance(data__fit, str) and data__fit == 'slim' or isinstance(data__fit, str) and data__fit == 'regular' or isinstance(data__fit, str) and data__fit == 'relaxed' or isinstance(data__fit, str) and data__fit == 'oversized'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fit must be one of ['slim', 'regular', 'relaxed', 'oversized']", value=data__fit, name="" + (name_prefix or "data") + ".fit", definition={'type': 'string', 'enum': ['slim', 'regular', 'relaxed', 'oversized'], 'description': 'Fit type'}, rule='enum')
+        if "length" in data_keys:
+            data_keys.remove("length")
+            data__length = data["length"]
+            if not isinstance(data__length, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".length must be string", value=data__length, name="" + (name_prefix or "data") + ".length", definition={'type': 'string', 'enum': ['short', 'knee', 'midi', 'long'], 'description': 'Length category'}, rule='type')
+            if not (isinstance(data__length, str) and data__length == 'short' or isinstance(data__length, str) and data__length == 'knee' or isinstance(data__length, str) and data__length == 'midi' or isinstance(data__length, str) and data__length == 'long'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".length must be one of ['short', 'knee', 'midi', 'long']", value=data__length, name="" + (name_prefix or "data") + ".length", definition={'type': 'string', 'enum': ['short', 'knee', 'midi', 'long'], 'description': 'Length category'}, rule='enum')
+        if "gender" in data_keys:
+            data_keys.remove("gender")
+            data__gender = data["gender"]
+            if not isinstance(data__gender, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".gender must be string", value=data__gender, name="" + (name_prefix or "data") + ".gender", definition={'type': 'string', 'enum': ['male', 'female', 'unisex'], 'description': 'Target gender'}, rule='type')
+            if not (isinstance(data__gender, str) and data__gender == 'male' or isinstance(data__gender, str) and data__gender == 'female' or isinstance(data__gender, str) and data__gender == 'unisex'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".gender must be one of ['male', 'female', 'unisex']", value=data__gender, name="" + (name_prefix or "data") + ".gender", definition={'type': 'string', 'enum': ['male', 'female', 'unisex'], 'description': 'Target gender'}, rule='enum')
+        if "age_range" in data_keys:
+            data_keys.remove("age_range")
+            data__agerange = data["age_range"]
+            if not isinstance(data__agerange, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".age_range must be array", value=data__agerange, name="" + (name_prefix or "data") + ".age_range", definition={'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2, 'maxItems': 2, 'description': '[min_age, max_age]'}, rule='type')
+            data__agerange_is_list = isinstance(data__agerange, (list, tuple))
+            if data__agerange_is_list:
+                data__agerange_len = len(data__agerange)
+                if data__agerange_len < 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".age_range must contain at least 2 items", value=data__agerange, name="" + (name_prefix or "data") + ".age_range", definition={'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2, 'maxItems': 2, 'description': '[min_age, max_age]'}, rule='minItems')
+                if data__agerange_len > 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".age_range must contain less than or equal to 2 items", value=data__agerange, name="" + (name_prefix or "data") + ".age_range", definition={'type': 'array', 'items': {'type': 'integer'}, 'minItems': 2, 'maxItems': 2, 'description': '[min_age, max_age]'}, rule='maxItems')
+                for data__agerange_x, data__agerange_item in enumerate(data__agerange):
+                    if not isinstance(data__agerange_item, (int)) and not (isinstance(data__agerange_item, float) and data__agerange_item.is_integer()) or isinstance(data__agerange_item, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".age_range[{data__agerange_x}]".format(**locals()) + " must be integer", value=data__agerange_item, name="" + (name_prefix or "data") + ".age_range[{data__agerange_x}]".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+        if "brand" in data_keys:
+            data_keys.remove("brand")
+            data__brand = data["brand"]
+            if not isinstance(data__brand, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".brand must be string", value=data__brand, name="" + (name_prefix or "data") + ".brand", definition={'type': 'string', 'description': 'Brand name (optional)'}, rule='type')
+        if "price_usd" in data_keys:
+            data_keys.remove("price_usd")
+            data__priceusd = data["price_usd"]
+            if not isinstance(data__priceusd, (int, float, Decimal)) or isinstance(data__priceusd, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".price_usd must be number", value=data__priceusd, name="" + (name_prefix or "data") + ".price_usd", definition={'type': 'number', 'description': 'Price in USD'}, rule='type')
+        if "popularity" in data_keys:
+            data_keys.remove("popularity")
+            data__popularity = data["popularity"]
+            if not isinstance(data__popularity, (int, float, Decimal)) or isinstance(data__popularity, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".popularity must be number", value=data__popularity, name="" + (name_prefix or "data") + ".popularity", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Popularity score (0-1)'}, rule='type')
+            if isinstance(data__popularity, (int, float, Decimal)):
+                if data__popularity < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".popularity must be bigger than or equal to 0", value=data__popularity, name="" + (name_prefix or "data") + ".popularity", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Popularity score (0-1)'}, rule='minimum')
+                if data__popularity > 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".popularity must be smaller than or equal to 1", value=data__popularity, name="" + (name_prefix or "data") + ".popularity", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Popularity score (0-1)'}, rule='maximum')
+        if "available" in data_keys:
+            data_keys.remove("available")
+            data__available = data["available"]
+            if not isinstance(data__available, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".available must be boolean", value=data__available, name="" + (name_prefix or "data") + ".available", definition={'type': 'boolean', 'default': True, 'description': 'In-stock status'}, rule='type')
+        if "image_url" in data_keys:
+            data_keys.remove("image_url")
+            data__imageurl = data["image_url"]
+            if not isinstance(data__imageurl, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".image_url must be string", value=data__imageurl, name="" + (name_prefix or "data") + ".image_url", definition={'type': 'string', 'format': 'uri', 'description': 'Product image URL'}, rule='type')
+        if "embedding" in data_keys:
+            data_keys.remove("embedding")
+            data__embedding = data["embedding"]
+            if not isinstance(data__embedding, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".embedding must be array", value=data__embedding, name="" + (name_prefix or "data") + ".embedding", definition={'type': 'array', 'items': {'type': 'number'}, 'description': 'Text/visual embedding vector'}, rule='type')
+            data__embedding_is_list = isinstance(data__embedding, (list, tuple))
+            if data__embedding_is_list:
+                data__embedding_len = len(data__embedding)
+                for data__embedding_x, data__embedding_item in enumerate(data__embedding):
+                    if not isinstance(data__embedding_item, (int, float, Decimal)) or isinstance(data__embedding_item, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".embedding[{data__embedding_x}]".format(**locals()) + " must be number", value=data__embedding_item, name="" + (name_prefix or "data") + ".embedding[{data__embedding_x}]".format(**locals()) + "", definition={'type': 'number'}, rule='type')
+        if "tags" in data_keys:
+            data_keys.remove("tags")
+            data__tags = data["tags"]
+            if not isinstance(data__tags, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags must be array", value=data__tags, name="" + (name_prefix or "data") + ".tags", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Searchable tags'}, rule='type')
+            data__tags_is_list = isinstance(data__tags, (list, tuple))
+            if data__tags_is_list:
+                data__tags_len = len(data__tags)
+                for data__tags_x, data__tags_item in enumerate(data__tags):
+                    if not isinstance(data__tags_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + " must be string", value=data__tags_item, name="" + (name_prefix or "data") + ".tags[{data__tags_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "metadata" in data_keys:
+            data_keys.remove("metadata")
+            data__metadata = data["metadata"]
+            if not isinstance(data__metadata, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata must be object", value=data__metadata, name="" + (name_prefix or "data") + ".metadata", definition={'type': 'object', 'description': 'Additional metadata'}, rule='type')
+    return data
\ No newline at end of file
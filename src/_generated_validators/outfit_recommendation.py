@@ -0,0 +1,229 @@
+"""Generated by `python -m src.regen_validators` from the "outfit_recommendation" schema. Do not edit."""
+SCHEMA_HASH = "d2f17a9ae4a8be81e326fde35587ed1abd7dcb8f1a0b5ca25a9e215af5d65bb2"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'OutfitRecommendation', 'description': 'A single outfit recommendation', 'type': 'object', 'required': ['rank', 'outfit_id', 'items', 'overall_score'], 'properties': {'rank': {'type': 'integer', 'minimum': 1, 'description': 'Ranking position (1 = best)'}, 'outfit_id': {'type': 'string', 'description': 'Unique outfit identifier'}, 'overall_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Overall recommendation score'}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Model confidence in recommendation'}, 'items': {'type': 'array', 'minItems': 3, 'description': 'Outfit items', 'items': {'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}}, 'suitability': {'type': 'object', 'properties': {'temp_ok': {'type': 'boolean'}, 'weather_ok': {'type': 'boolean'}, 'occasion_ok': {'type': 'boolean'}, 'weather_explanation': {'type': 'string'}}}, 'reasons': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Bullet-point explanations (from LLM or heuristic)'}, 'accessory_suggestions': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Recommended accessories'}, 'color_harmony': {'type': 'object', 'properties': {'harmony_score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'notes': {'type': 'string'}}}, 'visual_preview_url': {'type': 'string', 'format': 'uri', 'description': 'Link to outfit visualization'}, 'explainability_trace': {'type': 'object', 'description': 'Feature scores for transparency', 'properties': {'color_harmony_score': {'type': 'number'}, 'style_match_score': {'type': 'number'}, 'weather_suitability_score': {'type': 'number'}, 'user_pref_alignment': {'type': 'number'}, 'novelty_score': {'type': 'number'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['rank', 'outfit_id', 'items', 'overall_score']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'OutfitRecommendation', 'description': 'A single outfit recommendation', 'type': 'object', 'required': ['rank', 'outfit_id', 'items', 'overall_score'], 'properties': {'rank': {'type': 'integer', 'minimum': 1, 'description': 'Ranking position (1 = best)'}, 'outfit_id': {'type': 'string', 'description': 'Unique outfit identifier'}, 'overall_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Overall recommendation score'}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Model confidence in recommendation'}, 'items': {'type': 'array', 'minItems': 3, 'description': 'Outfit items', 'items': {'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}}, 'suitability': {'type': 'object', 'properties': {'temp_ok': {'type': 'boolean'}, 'weather_ok': {'type': 'boolean'}, 'occasion_ok': {'type': 'boolean'}, 'weather_explanation': {'type': 'string'}}}, 'reasons': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Bullet-point explanations (from LLM or heuristic)'}, 'accessory_suggestions': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Recommended accessories'}, 'color_harmony': {'type': 'object', 'properties': {'harmony_score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'notes': {'type': 'string'}}}, 'visual_preview_url': {'type': 'string', 'format': 'uri', 'description': 'Link to outfit visualization'}, 'explainability_trace': {'type': 'object', 'description': 'Feature scores for transparency', 'properties': {'color_harmony_score': {'type': 'number'}, 'style_match_score': {'type': 'number'}, 'weather_suitability_score': {'type': 'number'}, 'user_pref_alignment': {'type': 'number'}, 'novelty_score': {'type': 'number'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "rank" in data_keys:
+            data_keys.remove("rank")
+            data__rank = data["rank"]
+            if not isinstance(data__rank, (int)) and not (isinstance(data__rank, float) and data__rank.is_integer()) or isinstance(data__rank, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rank must be integer", value=data__rank, name="" + (name_prefix or "data") + ".rank", definition={'type': 'integer', 'minimum': 1, 'description': 'Ranking position (1 = best)'}, rule='type')
+            if isinstance(data__rank, (int, float, Decimal)):
+                if data__rank < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".rank must be bigger than or equal to 1", value=data__rank, name="" + (name_prefix or "data") + ".rank", definition={'type': 'integer', 'minimum': 1, 'description': 'Ranking position (1 = best)'}, rule='minimum')
+        if "outfit_id" in data_keys:
+            data_keys.remove("outfit_id")
+            data__outfitid = data["outfit_id"]
+            if not isinstance(data__outfitid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".outfit_id must be string", value=data__outfitid, name="" + (name_prefix or "data") + ".outfit_id", definition={'type': 'string', 'description': 'Unique outfit identifier'}, rule='type')
+        if "overall_score" in data_keys:
+            data_keys.remove("overall_score")
+            data__overallscore = data["overall_score"]
+            if not isinstance(data__overallscore, (int, float, Decimal)) or isinstance(data__overallscore, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".overall_score must be number", value=data__overallscore, name="" + (name_prefix or "data") + ".overall_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Overall recommendation score'}, rule='type')
+            if isinstance(data__overallscore, (int, float, Decimal)):
+                if data__overallscore < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".overall_score must be bigger than or equal to 0", value=data__overallscore, name="" + (name_prefix or "data") + ".overall_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Overall recommendation score'}, rule='minimum')
+                if data__overallscore > 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".overall_score must be smaller than or equal to 1", value=data__overallscore, name="" + (name_prefix or "data") + ".overall_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Overall recommendation score'}, rule='maximum')
+        if "confidence" in data_keys:
+            data_keys.remove("confidence")
+            data__confidence = data["confidence"]
+            if not isinstance(data__confidence, (int, float, Decimal)) or isinstance(data__confidence, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".confidence must be number", value=data__confidence, name="" + (name_prefix or "data") + ".confidence", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Model confidence in recommendation'}, rule='type')
+            if isinstance(data__confidence, (int, float, Decimal)):
+                if data__confidence < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".confidence must be bigger than or equal to 0", value=data__confidence, name="" + (name_prefix or "data") + ".confidence", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Model confidence in recommendation'}, rule='minimum')
+                if data__confidence > 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".confidence must be smaller than or equal to 1", value=data__confidence, name="" + (name_prefix or "data") + ".confidence", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'Model confidence in recommendation'}, rule='maximum')
+        if "items" in data_keys:
+            data_keys.remove("items")
+            data__items = data["items"]
+            if not isinstance(data__items, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items must be array", value=data__items, name="" + (name_prefix or "data") + ".items", definition={'type': 'array', 'minItems': 3, 'description': 'Outfit items', 'items': {'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}}, rule='type')
+            data__items_is_list = isinstance(data__items, (list, tuple))
+            if data__items_is_list:
+                data__items_len = len(data__items)
+                if data__items_len < 3:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".items must contain at least 3 items", value=data__items, name="" + (name_prefix or "data") + ".items", definition={'type': 'array', 'minItems': 3, 'description': 'Outfit items', 'items': {'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}}, rule='minItems')
+                for data__items_x, data__items_item in enumerate(data__items):
+                    if not isinstance(data__items_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}]".format(**locals()) + " must be object", value=data__items_item, name="" + (name_prefix or "data") + ".items[{data__items_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}, rule='type')
+                    data__items_item_is_dict = isinstance(data__items_item, dict)
+                    if data__items_item_is_dict:
+                        data__items_item__missing_keys = set(['role', 'item_id', 'title']) - data__items_item.keys()
+                        if data__items_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}]".format(**locals()) + " must contain " + (str(sorted(data__items_item__missing_keys)) + " properties"), value=data__items_item, name="" + (name_prefix or "data") + ".items[{data__items_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['role', 'item_id', 'title'], 'properties': {'role': {'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, 'item_id': {'type': 'string'}, 'title': {'type': 'string'}, 'color': {'type': 'string'}, 'style': {'type': 'string'}, 'material': {'type': 'string'}, 'match_score': {'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, 'image_url': {'type': 'string', 'format': 'uri'}}}, rule='required')
+                        data__items_item_keys = set(data__items_item.keys())
+                        if "role" in data__items_item_keys:
+                            data__items_item_keys.remove("role")
+                            data__items_item__role = data__items_item["role"]
+                            if not isinstance(data__items_item__role, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].role".format(**locals()) + " must be string", value=data__items_item__role, name="" + (name_prefix or "data") + ".items[{data__items_x}].role".format(**locals()) + "", definition={'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, rule='type')
+                            if not (isinstance(data__items_item__role, str) and data__items_item__role == 'top' or isinstance(data__items_item__role, str) and data__items_item__role == 'bottom' or isinstance(data__items_item__role, str) and data__items_item__role == 'outer' or isinstance(data__items_item__role, str) and data__items_item__role == 'shoes' or isinstance(data__items_item__role, str) and data__items_item__role == 'accessory'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].role".format(**locals()) + " must be one of ['top', 'bottom', 'outer', 'shoes', 'accessory']", value=data__items_item__role, name="" + (name_prefix or "data") + ".items[{data__items_x}].role".format(**locals()) + "", definition={'type': 'string', 'enum': ['top', 'bottom', 'outer', 'shoes', 'accessory']}, rule='enum')
+                        if "item_id" in data__items_item_keys:
+                            data__items_item_keys.remove("item_id")
+                            data__items_item__itemid = data__items_item["item_id"]
+                            if not isinstance(data__items_item__itemid, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].item_id".format(**locals()) + " must be string", value=data__items_item__itemid, name="" + (name_prefix or "data") + ".items[{data__items_x}].item_id".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "title" in data__items_item_keys:
+                            data__items_item_keys.remove("title")
+                            data__items_item__title = data__items_item["title"]
+                            if not isinstance(data__items_item__title, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].title".format(**locals()) + " must be string", value=data__items_item__title, name="" + (name_prefix or "data") + ".items[{data__items_x}].title".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "color" in data__items_item_keys:
+                            data__items_item_keys.remove("color")
+                            data__items_item__color = data__items_item["color"]
+                            if not isinstance(data__items_item__color, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].color".format(**locals()) + " must be string", value=data__items_item__color, name="" + (name_prefix or "data") + ".items[{data__items_x}].color".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "style" in data__items_item_keys:
+                            data__items_item_keys.remove("style")
+                            data__items_item__style = data__items_item["style"]
+                            if not isinstance(data__items_item__style, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].style".format(**locals()) + " must be string", value=data__items_item__style, name="" + (name_prefix or "data") + ".items[{data__items_x}].style".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "material" in data__items_item_keys:
+                            data__items_item_keys.remove("material")
+                            data__items_item__material = data__items_item["material"]
+                            if not isinstance(data__items_item__material, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].material".format(**locals()) + " must be string", value=data__items_item__material, name="" + (name_prefix or "data") + ".items[{data__items_x}].material".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "match_score" in data__items_item_keys:
+                            data__items_item_keys.remove("match_score")
+                            data__items_item__matchscore = data__items_item["match_score"]
+                            if not isinstance(data__items_item__matchscore, (int, float, Decimal)) or isinstance(data__items_item__matchscore, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + " must be number", value=data__items_item__matchscore, name="" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, rule='type')
+                            if isinstance(data__items_item__matchscore, (int, float, Decimal)):
+                                if data__items_item__matchscore < 0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + " must be bigger than or equal to 0", value=data__items_item__matchscore, name="" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, rule='minimum')
+                                if data__items_item__matchscore > 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + " must be smaller than or equal to 1", value=data__items_item__matchscore, name="" + (name_prefix or "data") + ".items[{data__items_x}].match_score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1, 'description': 'How well this item matches context'}, rule='maximum')
+                        if "image_url" in data__items_item_keys:
+                            data__items_item_keys.remove("image_url")
+                            data__items_item__imageurl = data__items_item["image_url"]
+                            if not isinstance(data__items_item__imageurl, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".items[{data__items_x}].image_url".format(**locals()) + " must be string", value=data__items_item__imageurl, name="" + (name_prefix or "data") + ".items[{data__items_x}].image_url".format(**locals()) + "", definition={'type': 'string', 'format': 'uri'}, rule='type')
+        if "suitability" in data_keys:
+            data_keys.remove("suitability")
+            data__suitability = data["suitability"]
+            if not isinstance(data__suitability, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".suitability must be object", value=data__suitability, name="" + (name_prefix or "data") + ".suitability", definition={'type': 'object', 'properties': {'temp_ok': {'type': 'boolean'}, 'weather_ok': {'type': 'boolean'}, 'occasion_ok': {'type': 'boolean'}, 'weather_explanation': {'type': 'string'}}}, rule='type')
+            data__suitability_is_dict = isinstance(data__suitability, dict)
+            if data__suitability_is_dict:
+                data__suitability_keys = set(data__suitability.keys())
+                if "temp_ok" in data__suitability_keys:
+                    data__suitability_keys.remove("temp_ok")
+                    data__suitability__tempok = data__suitability["temp_ok"]
+                    if not isinstance(data__suitability__tempok, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".suitability.temp_ok must be boolean", value=data__suitability__tempok, name="" + (name_prefix or "data") + ".suitability.temp_ok", definition={'type': 'boolean'}, rule='type')
+                if "weather_ok" in data__suitability_keys:
+                    data__suitability_keys.remove("weather_ok")
+                    data__suitability__weatherok = data__suitability["weather_ok"]
+                    if not isinstance(data__suitability__weatherok, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".suitability.weather_ok must be boolean", value=data__suitability__weatherok, name="" + (name_prefix or "data") + ".suitability.weather_ok", definition={'type': 'boolean'}, rule='type')
+                if "occasion_ok" in data__suitability_keys:
+                    data__suitability_keys.remove("occasion_ok")
+                    data__suitability__occasionok = data__suitability["occasion_ok"]
+                    if not isinstance(data__suitability__occasionok, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".suitability.occasion_ok must be boolean", value=data__suitability__occasionok, name="" + (name_prefix or "data") + ".suitability.occasion_ok", definition={'type': 'boolean'}, rule='type')
+                if "weather_explanation" in data__suitability_keys:
+                    data__suitability_keys.remove("weather_explanation")
+                    data__suitability__weatherexplanation = data__suitability["weather_explanation"]
+                    if not isinstance(data__suitability__weatherexplanation, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".suitability.weather_explanation must be string", value=data__suitability__weatherexplanation, name="" + (name_prefix or "data") + ".suitability.weather_explanation", definition={'type': 'string'}, rule='type')
+        if "reasons" in data_keys:
+            data_keys.remove("reasons")
+            data__reasons = data["reasons"]
+            if not isinstance(data__reasons, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".reasons must be array", value=data__reasons, name="" + (name_prefix or "data") + ".reasons", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Bullet-point explanations (from LLM or heuristic)'}, rule='type')
+            data__reasons_is_list = isinstance(data__reasons, (list, tuple))
+            if data__reasons_is_list:
+                data__reasons_len = len(data__reasons)
+                for data__reasons_x, data__reasons_item in enumerate(data__reasons):
+                    if not isinstance(data__reasons_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".reasons[{data__reasons_x}]".format(**locals()) + " must be string", value=data__reasons_item, name="" + (name_prefix or "data") + ".reasons[{data__reasons_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "accessory_suggestions" in data_keys:
+            data_keys.remove("accessory_suggestions")
+            data__accessorysuggestions = data["accessory_suggestions"]
+            if not isinstance(data__accessorysuggestions, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".accessory_suggestions must be array", value=data__accessorysuggestions, name="" + (name_prefix or "data") + ".accessory_suggestions", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Recommended accessories'}, rule='type')
+            data__accessorysuggestions_is_list = isinstance(data__accessorysuggestions, (list, tuple))
+            if data__accessorysuggestions_is_list:
+                data__accessorysuggestions_len = len(data__accessorysuggestions)
+                for data__accessorysuggestions_x, data__accessorysuggestions_item in enumerate(data__accessorysuggestions):
+                    if not isinstance(data__accessorysuggestions_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".accessory_suggestions[{data__accessorysuggestions_x}]".format(**locals()) + " must be string", value=data__accessorysuggestions_item, name="" + (name_prefix or "data") + ".accessory_suggestions[{data__accessorysuggestions_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "color_harmony" in data_keys:
+            data_keys.remove("color_harmony")
+            data__colorharmony = data["color_harmony"]
+            if not isinstance(data__colorharmony, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".color_harmony must be object", value=data__colorharmony, name="" + (name_prefix or "data") + ".color_harmony", definition={'type': 'object', 'properties': {'harmony_score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'notes': {'type': 'string'}}}, rule='type')
+            data__colorharmony_is_dict = isinstance(data__colorharmony, dict)
+            if data__colorharmony_is_dict:
+                data__colorharmony_keys = set(data__colorharmony.keys())
+                if "harmony_score" in data__colorharmony_keys:
+                    data__colorharmony_keys.remove("harmony_score")
+                    data__colorharmony__harmonyscore = data__colorharmony["harmony_score"]
+                    if not isinstance(data__colorharmony__harmonyscore, (int, float, Decimal)) or isinstance(data__colorharmony__harmonyscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".color_harmony.harmony_score must be number", value=data__colorharmony__harmonyscore, name="" + (name_prefix or "data") + ".color_harmony.harmony_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='type')
+                    if isinstance(data__colorharmony__harmonyscore, (int, float, Decimal)):
+                        if data__colorharmony__harmonyscore < 0:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".color_harmony.harmony_score must be bigger than or equal to 0", value=data__colorharmony__harmonyscore, name="" + (name_prefix or "data") + ".color_harmony.harmony_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='minimum')
+                        if data__colorharmony__harmonyscore > 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".color_harmony.harmony_score must be smaller than or equal to 1", value=data__colorharmony__harmonyscore, name="" + (name_prefix or "data") + ".color_harmony.harmony_score", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='maximum')
+                if "notes" in data__colorharmony_keys:
+                    data__colorharmony_keys.remove("notes")
+                    data__colorharmony__notes = data__colorharmony["notes"]
+                    if not isinstance(data__colorharmony__notes, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".color_harmony.notes must be string", value=data__colorharmony__notes, name="" + (name_prefix or "data") + ".color_harmony.notes", definition={'type': 'string'}, rule='type')
+        if "visual_preview_url" in data_keys:
+            data_keys.remove("visual_preview_url")
+            data__visualpreviewurl = data["visual_preview_url"]
+            if not isinstance(data__visualpreviewurl, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".visual_preview_url must be string", value=data__visualpreviewurl, name="" + (name_prefix or "data") + ".visual_preview_url", definition={'type': 'string', 'format': 'uri', 'description': 'Link to outfit visualization'}, rule='type')
+        if "explainability_trace" in data_keys:
+            data_keys.remove("explainability_trace")
+            data__explainabilitytrace = data["explainability_trace"]
+            if not isinstance(data__explainabilitytrace, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace must be object", value=data__explainabilitytrace, name="" + (name_prefix or "data") + ".explainability_trace", definition={'type': 'object', 'description': 'Feature scores for transparency', 'properties': {'color_harmony_score': {'type': 'number'}, 'style_match_score': {'type': 'number'}, 'weather_suitability_score': {'type': 'number'}, 'user_pref_alignment': {'type': 'number'}, 'novelty_score': {'type': 'number'}}}, rule='type')
+            data__explainabilitytrace_is_dict = isinstance(data__explainabilitytrace, dict)
+            if data__explainabilitytrace_is_dict:
+                data__explainabilitytrace_keys = set(data__explainabilitytrace.keys())
+                if "color_harmony_score" in data__explainabilitytrace_keys:
+                    data__explainabilitytrace_keys.remove("color_harmony_score")
+                    data__explainabilitytrace__colorharmonyscore = data__explainabilitytrace["color_harmony_score"]
+                    if not isinstance(data__explainabilitytrace__colorharmonyscore, (int, float, Decimal)) or isinstance(data__explainabilitytrace__colorharmonyscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace.color_harmony_score must be number", value=data__explainabilitytrace__colorharmonyscore, name="" + (name_prefix or "data") + ".explainability_trace.color_harmony_score", definition={'type': 'number'}, rule='type')
+                if "style_match_score" in data__explainabilitytrace_keys:
+                    data__explainabilitytrace_keys.remove("style_match_score")
+                    data__explainabilitytrace__stylematchscore = data__explainabilitytrace["style_match_score"]
+                    if not isinstance(data__explainabilitytrace__stylematchscore, (int, float, Decimal)) or isinstance(data__explainabilitytrace__stylematchscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace.style_match_score must be number", value=data__explainabilitytrace__stylematchscore, name="" + (name_prefix or "data") + ".explainability_trace.style_match_score", definition={'type': 'number'}, rule='type')
+                if "weather_suitability_score" in data__explainabilitytrace_keys:
+                    data__explainabilitytrace_keys.remove("weather_suitability_score")
+                    data__explainabilitytrace__weathersuitabilityscore = data__explainabilitytrace["weather_suitability_score"]
+                    if not isinstance(data__explainabilitytrace__weathersuitabilityscore, (int, float, Decimal)) or isinstance(data__explainabilitytrace__weathersuitabilityscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace.weather_suitability_score must be number", value=data__explainabilitytrace__weathersuitabilityscore, name="" + (name_prefix or "data") + ".explainability_trace.weather_suitability_score", definition={'type': 'number'}, rule='type')
+                if "user_pref_alignment" in data__explainabilitytrace_keys:
+                    data__explainabilitytrace_keys.remove("user_pref_alignment")
+                    data__explainabilitytrace__userprefalignment = data__explainabilitytrace["user_pref_alignment"]
+                    if not isinstance(data__explainabilitytrace__userprefalignment, (int, float, Decimal)) or isinstance(data__explainabilitytrace__userprefalignment, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace.user_pref_alignment must be number", value=data__explainabilitytrace__userprefalignment, name="" + (name_prefix or "data") + ".explainability_trace.user_pref_alignment", definition={'type': 'number'}, rule='type')
+                if "novelty_score" in data__explainabilitytrace_keys:
+                    data__explainabilitytrace_keys.remove("novelty_score")
+                    data__explainabilitytrace__noveltyscore = data__explainabilitytrace["novelty_score"]
+                    if not isinstance(data__explainabilitytrace__noveltyscore, (int, float, Decimal)) or isinstance(data__explainabilitytrace__noveltyscore, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".explainability_trace.novelty_score must be number", value=data__explainabilitytrace__noveltyscore, name="" + (name_prefix or "data") + ".explainability_trace.novelty_score", definition={'type': 'number'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Generated by `python -m src.regen_validators` from the "recommendation_request" schema. Do not edit."""
+SCHEMA_HASH = "2d24ae8078b8f9a1d16ee7e45256abc295bdee6ed099ecc30571de748aa8811c"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'RecommendationRequest', 'type': 'object', 'required': ['user_id', 'weather', 'occasion'], 'properties': {'user_id': {'type': 'string'}, 'weather': {'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100}, 'condition': {'type': 'string'}, 'uv_index': {'type': 'number'}, 'wind_speed_kmh': {'type': 'number'}}}, 'occasion': {'type': 'array', 'items': {'type': 'string'}}, 'preferences': {'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}}}}, 'palette_analysis': {'type': 'object'}, 'demographics': {'type': 'object'}, 'last_worn_history': {'type': 'array', 'items': {'type': 'string'}}, 'top_n': {'type': 'integer', 'minimum': 1, 'maximum': 10, 'default': 3}, 'use_llm': {'type': 'boolean', 'default': False}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['user_id', 'weather', 'occasion']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'RecommendationRequest', 'type': 'object', 'required': ['user_id', 'weather', 'occasion'], 'properties': {'user_id': {'type': 'string'}, 'weather': {'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100}, 'condition': {'type': 'string'}, 'uv_index': {'type': 'number'}, 'wind_speed_kmh': {'type': 'number'}}}, 'occasion': {'type': 'array', 'items': {'type': 'string'}}, 'preferences': {'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}}}}, 'palette_analysis': {'type': 'object'}, 'demographics': {'type': 'object'}, 'last_worn_history': {'type': 'array', 'items': {'type': 'string'}}, 'top_n': {'type': 'integer', 'minimum': 1, 'maximum': 10, 'default': 3}, 'use_llm': {'type': 'boolean', 'default': False}}}, rule='required')
+        data_keys = set(data.keys())
+        if "user_id" in data_keys:
+            data_keys.remove("user_id")
+            data__userid = data["user_id"]
+            if not isinstance(data__userid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".user_id must be string", value=data__userid, name="" + (name_prefix or "data") + ".user_id", definition={'type': 'string'}, rule='type')
+        if "weather" in data_keys:
+            data_keys.remove("weather")
+            data__weather = data["weather"]
+            if not isinstance(data__weather, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather must be object", value=data__weather, name="" + (name_prefix or "data") + ".weather", definition={'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100}, 'condition': {'type': 'string'}, 'uv_index': {'type': 'number'}, 'wind_speed_kmh': {'type': 'number'}}}, rule='type')
+            data__weather_is_dict = isinstance(data__weather, dict)
+            if data__weather_is_dict:
+                data__weather__missing_keys = set(['temp_c', 'condition']) - data__weather.keys()
+                if data__weather__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather must contain " + (str(sorted(data__weather__missing_keys)) + " properties"), value=data__weather, name="" + (name_prefix or "data") + ".weather", definition={'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100}, 'condition': {'type': 'string'}, 'uv_index': {'type': 'number'}, 'wind_speed_kmh': {'type': 'number'}}}, rule='required')
+                data__weather_keys = set(data__weather.keys())
+                if "temp_c" in data__weather_keys:
+                    data__weather_keys.remove("temp_c")
+                    data__weather__tempc = data__weather["temp_c"]
+                    if not isinstance(data__weather__tempc, (int)) and not (isinstance(data__weather__tempc, float) and data__weather__tempc.is_integer()) or isinstance(data__weather__tempc, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.temp_c must be integer", value=data__weather__tempc, name="" + (name_prefix or "data") + ".weather.temp_c", definition={'type': 'integer'}, rule='type')
+                if "humidity" in data__weather_keys:
+                    data__weather_keys.remove("humidity")
+                    data__weather__humidity = data__weather["humidity"]
+                    if not isinstance(data__weather__humidity, (int)) and not (isinstance(data__weather__humidity, float) and data__weather__humidity.is_integer()) or isinstance(data__weather__humidity, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.humidity must be integer", value=data__weather__humidity, name="" + (name_prefix or "data") + ".weather.humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100}, rule='type')
+                    if isinstance(data__weather__humidity, (int, float, Decimal)):
+                        if data__weather__humidity < 0:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.humidity must be bigger than or equal to 0", value=data__weather__humidity, name="" + (name_prefix or "data") + ".weather.humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100}, rule='minimum')
+                        if data__weather__humidity > 100:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.humidity must be smaller than or equal to 100", value=data__weather__humidity, name="" + (name_prefix or "data") + ".weather.humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100}, rule='maximum')
+                if "condition" in data__weather_keys:
+                    data__weather_keys.remove("condition")
+                    data__weather__condition = data__weather["condition"]
+                    if not isinstance(data__weather__condition, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.condition must be string", value=data__weather__condition, name="" + (name_prefix or "data") + ".weather.condition", definition={'type': 'string'}, rule='type')
+                if "uv_index" in data__weather_keys:
+                    data__weather_keys.remove("uv_index")
+                    data__weather__uvindex = data__weather["uv_index"]
+                    if not isinstance(data__weather__uvindex, (int, float, Decimal)) or isinstance(data__weather__uvindex, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.uv_index must be number", value=data__weather__uvindex, name="" + (name_prefix or "data") + ".weather.uv_index", definition={'type': 'number'}, rule='type')
+                if "wind_speed_kmh" in data__weather_keys:
+                    data__weather_keys.remove("wind_speed_kmh")
+                    data__weather__windspeedkmh = data__weather["wind_speed_kmh"]
+                    if not isinstance(data__weather__windspeedkmh, (int, float, Decimal)) or isinstance(data__weather__windspeedkmh, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".weather.wind_speed_kmh must be number", value=data__weather__windspeedkmh, name="" + (name_prefix or "data") + ".weather.wind_speed_kmh", definition={'type': 'number'}, rule='type')
+        if "occasion" in data_keys:
+            data_keys.remove("occasion")
+            data__occasion = data["occasion"]
+            if not isinstance(data__occasion, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".occasion must be array", value=data__occasion, name="" + (name_prefix or "data") + ".occasion", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__occasion_is_list = isinstance(data__occasion, (list, tuple))
+            if data__occasion_is_list:
+                data__occasion_len = len(data__occasion)
+                for data__occasion_x, data__occasion_item in enumerate(data__occasion):
+                    if not isinstance(data__occasion_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + " must be string", value=data__occasion_item, name="" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "preferences" in data_keys:
+            data_keys.remove("preferences")
+            data__preferences = data["preferences"]
+            if not isinstance(data__preferences, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences must be object", value=data__preferences, name="" + (name_prefix or "data") + ".preferences", definition={'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}}}}, rule='type')
+            data__preferences_is_dict = isinstance(data__preferences, dict)
+            if data__preferences_is_dict:
+                data__preferences_keys = set(data__preferences.keys())
+                if "styles" in data__preferences_keys:
+                    data__preferences_keys.remove("styles")
+                    data__preferences__styles = data__preferences["styles"]
+                    if not isinstance(data__preferences__styles, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.styles must be array", value=data__preferences__styles, name="" + (name_prefix or "data") + ".preferences.styles", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__preferences__styles_is_list = isinstance(data__preferences__styles, (list, tuple))
+                    if data__preferences__styles_is_list:
+                        data__preferences__styles_len = len(data__preferences__styles)
+                        for data__preferences__styles_x, data__preferences__styles_item in enumerate(data__preferences__styles):
+                            if not isinstance(data__preferences__styles_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.styles[{data__preferences__styles_x}]".format(**locals()) + " must be string", value=data__preferences__styles_item, name="" + (name_prefix or "data") + ".preferences.styles[{data__preferences__styles_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "colors" in data__preferences_keys:
+                    data__preferences_keys.remove("colors")
+                    data__preferences__colors = data__preferences["colors"]
+                    if not isinstance(data__preferences__colors, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.colors must be array", value=data__preferences__colors, name="" + (name_prefix or "data") + ".preferences.colors", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__preferences__colors_is_list = isinstance(data__preferences__colors, (list, tuple))
+                    if data__preferences__colors_is_list:
+                        data__preferences__colors_len = len(data__preferences__colors)
+                        for data__preferences__colors_x, data__preferences__colors_item in enumerate(data__preferences__colors):
+                            if not isinstance(data__preferences__colors_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.colors[{data__preferences__colors_x}]".format(**locals()) + " must be string", value=data__preferences__colors_item, name="" + (name_prefix or "data") + ".preferences.colors[{data__preferences__colors_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "avoid" in data__preferences_keys:
+                    data__preferences_keys.remove("avoid")
+                    data__preferences__avoid = data__preferences["avoid"]
+                    if not isinstance(data__preferences__avoid, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.avoid must be array", value=data__preferences__avoid, name="" + (name_prefix or "data") + ".preferences.avoid", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__preferences__avoid_is_list = isinstance(data__preferences__avoid, (list, tuple))
+                    if data__preferences__avoid_is_list:
+                        data__preferences__avoid_len = len(data__preferences__avoid)
+                        for data__preferences__avoid_x, data__preferences__avoid_item in enumerate(data__preferences__avoid):
+                            if not isinstance(data__preferences__avoid_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.avoid[{data__preferences__avoid_x}]".format(**locals()) + " must be string", value=data__preferences__avoid_item, name="" + (name_prefix or "data") + ".preferences.avoid[{data__preferences__avoid_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "palette_analysis" in data_keys:
+            data_keys.remove("palette_analysis")
+            data__paletteanalysis = data["palette_analysis"]
+            if not isinstance(data__paletteanalysis, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".palette_analysis must be object", value=data__paletteanalysis, name="" + (name_prefix or "data") + ".palette_analysis", definition={'type': 'object'}, rule='type')
+        if "demographics" in data_keys:
+            data_keys.remove("demographics")
+            data__demographics = data["demographics"]
+            if not isinstance(data__demographics, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".demographics must be object", value=data__demographics, name="" + (name_prefix or "data") + ".demographics", definition={'type': 'object'}, rule='type')
+        if "last_worn_history" in data_keys:
+            data_keys.remove("last_worn_history")
+            data__lastwornhistory = data["last_worn_history"]
+            if not isinstance(data__lastwornhistory, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_worn_history must be array", value=data__lastwornhistory, name="" + (name_prefix or "data") + ".last_worn_history", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__lastwornhistory_is_list = isinstance(data__lastwornhistory, (list, tuple))
+            if data__lastwornhistory_is_list:
+                data__lastwornhistory_len = len(data__lastwornhistory)
+                for data__lastwornhistory_x, data__lastwornhistory_item in enumerate(data__lastwornhistory):
+                    if not isinstance(data__lastwornhistory_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_worn_history[{data__lastwornhistory_x}]".format(**locals()) + " must be string", value=data__lastwornhistory_item, name="" + (name_prefix or "data") + ".last_worn_history[{data__lastwornhistory_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "top_n" in data_keys:
+            data_keys.remove("top_n")
+            data__topn = data["top_n"]
+            if not isinstance(data__topn, (int)) and not (isinstance(data__topn, float) and data__topn.is_integer()) or isinstance(data__topn, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".top_n must be integer", value=data__topn, name="" + (name_prefix or "data") + ".top_n", definition={'type': 'integer', 'minimum': 1, 'maximum': 10, 'default': 3}, rule='type')
+            if isinstance(data__topn, (int, float, Decimal)):
+                if data__topn < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".top_n must be bigger than or equal to 1", value=data__topn, name="" + (name_prefix or "data") + ".top_n", definition={'type': 'integer', 'minimum': 1, 'maximum': 10, 'default': 3}, rule='minimum')
+                if data__topn > 10:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".top_n must be smaller than or equal to 10", value=data__topn, name="" + (name_prefix or "data") + ".top_n", definition={'type': 'integer', 'minimum': 1, 'maximum': 10, 'default': 3}, rule='maximum')
+        if "use_llm" in data_keys:
+            data_keys.remove("use_llm")
+            data__usellm = data["use_llm"]
+            if not isinstance(data__usellm, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".use_llm must be boolean", value=data__usellm, name="" + (name_prefix or "data") + ".use_llm", definition={'type': 'boolean', 'default': False}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""Generated by `python -m src.regen_validators` from the "recommendation_response" schema. Do not edit."""
+SCHEMA_HASH = "6f9d8e6a7462f3e28f6f8f18994f4c39bcbfbda6aa5bb8073ded7f1cd5c2d211"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'RecommendationResponse', 'type': 'object', 'required': ['status', 'timestamp', 'recommended_outfits'], 'properties': {'status': {'type': 'string', 'enum': ['success', 'partial', 'error'], 'description': 'Response status'}, 'timestamp': {'type': 'string', 'description': 'ISO format timestamp'}, 'recommended_outfits': {'type': 'array', 'description': 'List of outfit recommendations', 'items': {'type': 'object', 'properties': {'rank': {'type': 'integer', 'minimum': 1}, 'score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'items': {'type': 'object', 'properties': {'top': {'type': 'string'}, 'bottom': {'type': 'string'}, 'shoes': {'type': 'string'}}}, 'colors': {'type': 'object', 'properties': {'primary': {'type': 'string'}, 'secondary': {'type': 'string'}}}, 'explanation': {'type': 'string'}, 'accessories': {'type': 'array', 'items': {'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}}, 'metadata': {'type': 'object', 'properties': {'style': {'type': 'string'}, 'occasion_fit': {'type': 'string'}, 'weather_fit': {'type': 'string'}}}}}}, 'next_steps': {'type': 'array', 'items': {'type': 'string'}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['status', 'timestamp', 'recommended_outfits']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'RecommendationResponse', 'type': 'object', 'required': ['status', 'timestamp', 'recommended_outfits'], 'properties': {'status': {'type': 'string', 'enum': ['success', 'partial', 'error'], 'description': 'Response status'}, 'timestamp': {'type': 'string', 'description': 'ISO format timestamp'}, 'recommended_outfits': {'type': 'array', 'description': 'List of outfit recommendations', 'items': {'type': 'object', 'properties': {'rank': {'type': 'integer', 'minimum': 1}, 'score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'items': {'type': 'object', 'properties': {'top': {'type': 'string'}, 'bottom': {'type': 'string'}, 'shoes': {'type': 'string'}}}, 'colors': {'type': 'object', 'properties': {'primary': {'type': 'string'}, 'secondary': {'type': 'string'}}}, 'explanation': {'type': 'string'}, 'accessories': {'type': 'array', 'items': {'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}}, 'metadata': {'type': 'object', 'properties': {'style': {'type': 'string'}, 'occasion_fit': {'type': 'string'}, 'weather_fit': {'type': 'string'}}}}}}, 'next_steps': {'type': 'array', 'items': {'type': 'string'}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "status" in data_keys:
+            data_keys.remove("status")
+            data__status = data["status"]
+            if not isinstance(data__status, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be string", value=data__status, name="" + (name_prefix or "data") + ".status", definition={'type': 'string', 'enum': ['success', 'partial', 'error'], 'description': 'Response status'}, rule='type')
+            if not (isinstance(data__status, str) and data__status == 'success' or isinstance(data__status, str) and data__status == 'partial' or isinstance(data__status, str) and data__status == 'error'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be one of ['success', 'partial', 'error']", value=data__status, name="" + (name_prefix or "data") + ".status", definition={'type': 'string', 'enum': ['success', 'partial', 'error'], 'description': 'Response status'}, rule='enum')
+        if "timestamp" in data_keys:
+            data_keys.remove("timestamp")
+            data__timestamp = data["timestamp"]
+            if not isinstance(data__timestamp, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be string", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'string', 'description': 'ISO format timestamp'}, rule='type')
+        if "recommended_outfits" in data_keys:
+            data_keys.remove("recommended_outfits")
+            data__recommendedoutfits = data["recommended_outfits"]
+            if not isinstance(data__recommendedoutfits, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits must be array", value=data__recommendedoutfits, name="" + (name_prefix or "data") + ".recommended_outfits", definition={'type': 'array', 'description': 'List of outfit recommendations', 'items': {'type': 'object', 'properties': {'rank': {'type': 'integer', 'minimum': 1}, 'score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'items': {'type': 'object', 'properties': {'top': {'type': 'string'}, 'bottom': {'type': 'string'}, 'shoes': {'type': 'string'}}}, 'colors': {'type': 'object', 'properties': {'primary': {'type': 'string'}, 'secondary': {'type': 'string'}}}, 'explanation': {'type': 'string'}, 'accessories': {'type': 'array', 'items': {'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}}, 'metadata': {'type': 'object', 'properties': {'style': {'type': 'string'}, 'occasion_fit': {'type': 'string'}, 'weather_fit': {'type': 'string'}}}}}}, rule='type')
+            data__recommendedoutfits_is_list = isinstance(data__recommendedoutfits, (list, tuple))
+            if data__recommendedoutfits_is_list:
+                data__recommendedoutfits_len = len(data__recommendedoutfits)
+                for data__recommendedoutfits_x, data__recommendedoutfits_item in enumerate(data__recommendedoutfits):
+                    if not isinstance(data__recommendedoutfits_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}]".format(**locals()) + " must be object", value=data__recommendedoutfits_item, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'rank': {'type': 'integer', 'minimum': 1}, 'score': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'confidence': {'type': 'number', 'minimum': 0, 'maximum': 1}, 'items': {'type': 'object', 'properties': {'top': {'type': 'string'}, 'bottom': {'type': 'string'}, 'shoes': {'type': 'string'}}}, 'colors': {'type': 'object', 'properties': {'primary': {'type': 'string'}, 'secondary': {'type': 'string'}}}, 'explanation': {'type': 'string'}, 'accessories': {'type': 'array', 'items': {'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}}, 'metadata': {'type': 'object', 'properties': {'style': {'type': 'string'}, 'occasion_fit': {'type': 'string'}, 'weather_fit': {'type': 'string'}}}}}, rule='type')
+                    data__recommendedoutfits_item_is_dict = isinstance(data__recommendedoutfits_item, dict)
+                    if data__recommendedoutfits_item_is_dict:
+                        data__recommendedoutfits_item_keys = set(data__recommendedoutfits_item.keys())
+                        if "rank" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("rank")
+                            data__recommendedoutfits_item__rank = data__recommendedoutfits_item["rank"]
+                            if not isinstance(data__recommendedoutfits_item__rank, (int)) and not (isinstance(data__recommendedoutfits_item__rank, float) and data__recommendedoutfits_item__rank.is_integer()) or isinstance(data__recommendedoutfits_item__rank, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].rank".format(**locals()) + " must be integer", value=data__recommendedoutfits_item__rank, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].rank".format(**locals()) + "", definition={'type': 'integer', 'minimum': 1}, rule='type')
+                            if isinstance(data__recommendedoutfits_item__rank, (int, float, Decimal)):
+                                if data__recommendedoutfits_item__rank < 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].rank".format(**locals()) + " must be bigger than or equal to 1", value=data__recommendedoutfits_item__rank, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].rank".format(**locals()) + "", definition={'type': 'integer', 'minimum': 1}, rule='minimum')
+                        if "score" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("score")
+                            data__recommendedoutfits_item__score = data__recommendedoutfits_item["score"]
+                            if not isinstance(data__recommendedoutfits_item__score, (int, float, Decimal)) or isinstance(data__recommendedoutfits_item__score, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + " must be number", value=data__recommendedoutfits_item__score, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='type')
+                            if isinstance(data__recommendedoutfits_item__score, (int, float, Decimal)):
+                                if data__recommendedoutfits_item__score < 0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + " must be bigger than or equal to 0", value=data__recommendedoutfits_item__score, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='minimum')
+                                if data__recommendedoutfits_item__score > 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + " must be smaller than or equal to 1", value=data__recommendedoutfits_item__score, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].score".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='maximum')
+                        if "confidence" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("confidence")
+                            data__recommendedoutfits_item__confidence = data__recommendedoutfits_item["confidence"]
+                            if not isinstance(data__recommendedoutfits_item__confidence, (int, float, Decimal)) or isinstance(data__recommendedoutfits_item__confidence, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + " must be number", value=data__recommendedoutfits_item__confidence, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='type')
+                            if isinstance(data__recommendedoutfits_item__confidence, (int, float, Decimal)):
+                                if data__recommendedoutfits_item__confidence < 0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + " must be bigger than or equal to 0", value=data__recommendedoutfits_item__confidence, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='minimum')
+                                if data__recommendedoutfits_item__confidence > 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + " must be smaller than or equal to 1", value=data__recommendedoutfits_item__confidence, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].confidence".format(**locals()) + "", definition={'type': 'number', 'minimum': 0, 'maximum': 1}, rule='maximum')
+                        if "items" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("items")
+                            data__recommendedoutfits_item__items = data__recommendedoutfits_item["items"]
+                            if not isinstance(data__recommendedoutfits_item__items, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items".format(**locals()) + " must be object", value=data__recommendedoutfits_item__items, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items".format(**locals()) + "", definition={'type': 'object', 'properties': {'top': {'type': 'string'}, 'bottom': {'type': 'string'}, 'shoes': {'type': 'string'}}}, rule='type')
+                            data__recommendedoutfits_item__items_is_dict = isinstance(data__recommendedoutfits_item__items, dict)
+                            if data__recommendedoutfits_item__items_is_dict:
+                                data__recommendedoutfits_item__items_keys = set(data__recommendedoutfits_item__items.keys())
+                                if "top" in data__recommendedoutfits_item__items_keys:
+                                    data__recommendedoutfits_item__items_keys.remove("top")
+                                    data__recommendedoutfits_item__items__top = data__recommendedoutfits_item__items["top"]
+                                    if not isinstance(data__recommendedoutfits_item__items__top, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.top".format(**locals()) + " must be string", value=data__recommendedoutfits_item__items__top, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.top".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "bottom" in data__recommendedoutfits_item__items_keys:
+                                    data__recommendedoutfits_item__items_keys.remove("bottom")
+                                    data__recommendedoutfits_item__items__bottom = data__recommendedoutfits_item__items["bottom"]
+                                    if not isinstance(data__recommendedoutfits_item__items__bottom, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.bottom".format(**locals()) + " must be string", value=data__recommendedoutfits_item__items__bottom, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.bottom".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "shoes" in data__recommendedoutfits_item__items_keys:
+                                    data__recommendedoutfits_item__items_keys.remove("shoes")
+                                    data__recommendedoutfits_item__items__shoes = data__recommendedoutfits_item__items["shoes"]
+                                    if not isinstance(data__recommendedoutfits_item__items__shoes, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.shoes".format(**locals()) + " must be string", value=data__recommendedoutfits_item__items__shoes, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].items.shoes".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "colors" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("colors")
+                            data__recommendedoutfits_item__colors = data__recommendedoutfits_item["colors"]
+                            if not isinstance(data__recommendedoutfits_item__colors, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors".format(**locals()) + " must be object", value=data__recommendedoutfits_item__colors, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors".format(**locals()) + "", definition={'type': 'object', 'properties': {'primary': {'type': 'string'}, 'secondary': {'type': 'string'}}}, rule='type')
+                            data__recommendedoutfits_item__colors_is_dict = isinstance(data__recommendedoutfits_item__colors, dict)
+                            if data__recommendedoutfits_item__colors_is_dict:
+                                data__recommendedoutfits_item__colors_keys = set(data__recommendedoutfits_item__colors.keys())
+                                if "primary" in data__recommendedoutfits_item__colors_keys:
+                                    data__recommendedoutfits_item__colors_keys.remove("primary")
+                                    data__recommendedoutfits_item__colors__primary = data__recommendedoutfits_item__colors["primary"]
+                                    if not isinstance(data__recommendedoutfits_item__colors__primary, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors.primary".format(**locals()) + " must be string", value=data__recommendedoutfits_item__colors__primary, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors.primary".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "secondary" in data__recommendedoutfits_item__colors_keys:
+                                    data__recommendedoutfits_item__colors_keys.remove("secondary")
+                                    data__recommendedoutfits_item__colors__secondary = data__recommendedoutfits_item__colors["secondary"]
+                                    if not isinstance(data__recommendedoutfits_item__colors__secondary, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors.secondary".format(**locals()) + " must be string", value=data__recommendedoutfits_item__colors__secondary, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].colors.secondary".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "explanation" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("explanation")
+                            data__recommendedoutfits_item__explanation = data__recommendedoutfits_item["explanation"]
+                            if not isinstance(data__recommendedoutfits_item__explanation, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].explanation".format(**locals()) + " must be string", value=data__recommendedoutfits_item__explanation, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].explanation".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "accessories" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("accessories")
+                            data__recommendedoutfits_item__accessories = data__recommendedoutfits_item["accessories"]
+                            if not isinstance(data__recommendedoutfits_item__accessories, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories".format(**locals()) + " must be array", value=data__recommendedoutfits_item__accessories, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}}, rule='type')
+                            data__recommendedoutfits_item__accessories_is_list = isinstance(data__recommendedoutfits_item__accessories, (list, tuple))
+                            if data__recommendedoutfits_item__accessories_is_list:
+                                data__recommendedoutfits_item__accessories_len = len(data__recommendedoutfits_item__accessories)
+                                for data__recommendedoutfits_item__accessories_x, data__recommendedoutfits_item__accessories_item in enumerate(data__recommendedoutfits_item__accessories):
+                                    if not isinstance(data__recommendedoutfits_item__accessories_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}]".format(**locals()) + " must be object", value=data__recommendedoutfits_item__accessories_item, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'type': {'type': 'string'}, 'color': {'type': 'string'}, 'suggestion': {'type': 'string'}}}, rule='type')
+                                    data__recommendedoutfits_item__accessories_item_is_dict = isinstance(data__recommendedoutfits_item__accessories_item, dict)
+                                    if data__recommendedoutfits_item__accessories_item_is_dict:
+                                        data__recommendedoutfits_item__accessories_item_keys = set(data__recommendedoutfits_item__accessories_item.keys())
+                                        if "type" in data__recommendedoutfits_item__accessories_item_keys:
+                                            data__recommendedoutfits_item__accessories_item_keys.remove("type")
+                                            data__recommendedoutfits_item__accessories_item__type = data__recommendedoutfits_item__accessories_item["type"]
+                                            if not isinstance(data__recommendedoutfits_item__accessories_item__type, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].type".format(**locals()) + " must be string", value=data__recommendedoutfits_item__accessories_item__type, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].type".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "color" in data__recommendedoutfits_item__accessories_item_keys:
+                                            data__recommendedoutfits_item__accessories_item_keys.remove("color")
+                                            data__recommendedoutfits_item__accessories_item__color = data__recommendedoutfits_item__accessories_item["color"]
+                                            if not isinstance(data__recommendedoutfits_item__accessories_item__color, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].color".format(**locals()) + " must be string", value=data__recommendedoutfits_item__accessories_item__color, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].color".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "suggestion" in data__recommendedoutfits_item__accessories_item_keys:
+                                            data__recommendedoutfits_item__accessories_item_keys.remove("suggestion")
+                                            data__recommendedoutfits_item__accessories_item__suggestion = data__recommendedoutfits_item__accessories_item["suggestion"]
+                                            if not isinstance(data__recommendedoutfits_item__accessories_item__suggestion, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].suggestion".format(**locals()) + " must be string", value=data__recommendedoutfits_item__accessories_item__suggestion, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].accessories[{data__recommendedoutfits_item__accessories_x}].suggestion".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "metadata" in data__recommendedoutfits_item_keys:
+                            data__recommendedoutfits_item_keys.remove("metadata")
+                            data__recommendedoutfits_item__metadata = data__recommendedoutfits_item["metadata"]
+                            if not isinstance(data__recommendedoutfits_item__metadata, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata".format(**locals()) + " must be object", value=data__recommendedoutfits_item__metadata, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata".format(**locals()) + "", definition={'type': 'object', 'properties': {'style': {'type': 'string'}, 'occasion_fit': {'type': 'string'}, 'weather_fit': {'type': 'string'}}}, rule='type')
+                            data__recommendedoutfits_item__metadata_is_dict = isinstance(data__recommendedoutfits_item__metadata, dict)
+                            if data__recommendedoutfits_item__metadata_is_dict:
+                                data__recommendedoutfits_item__metadata_keys = set(data__recommendedoutfits_item__metadata.keys())
+                                if "style" in data__recommendedoutfits_item__metadata_keys:
+                                    data__recommendedoutfits_item__metadata_keys.remove("style")
+                                    data__recommendedoutfits_item__metadata__style = data__recommendedoutfits_item__metadata["style"]
+                                    if not isinstance(data__recommendedoutfits_item__metadata__style, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.style".format(**locals()) + " must be string", value=data__recommendedoutfits_item__metadata__style, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.style".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "occasion_fit" in data__recommendedoutfits_item__metadata_keys:
+                                    data__recommendedoutfits_item__metadata_keys.remove("occasion_fit")
+                                    data__recommendedoutfits_item__metadata__occasionfit = data__recommendedoutfits_item__metadata["occasion_fit"]
+                                    if not isinstance(data__recommendedoutfits_item__metadata__occasionfit, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.occasion_fit".format(**locals()) + " must be string", value=data__recommendedoutfits_item__metadata__occasionfit, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.occasion_fit".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                if "weather_fit" in data__recommendedoutfits_item__metadata_keys:
+                                    data__recommendedoutfits_item__metadata_keys.remove("weather_fit")
+                                    data__recommendedoutfits_item__metadata__weatherfit = data__recommendedoutfits_item__metadata["weather_fit"]
+                                    if not isinstance(data__recommendedoutfits_item__metadata__weatherfit, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.weather_fit".format(**locals()) + " must be string", value=data__recommendedoutfits_item__metadata__weatherfit, name="" + (name_prefix or "data") + ".recommended_outfits[{data__recommendedoutfits_x}].metadata.weather_fit".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "next_steps" in data_keys:
+            data_keys.remove("next_steps")
+            data__nextsteps = data["next_steps"]
+            if not isinstance(data__nextsteps, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".next_steps must be array", value=data__nextsteps, name="" + (name_prefix or "data") + ".next_steps", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__nextsteps_is_list = isinstance(data__nextsteps, (list, tuple))
+            if data__nextsteps_is_list:
+                data__nextsteps_len = len(data__nextsteps)
+                for data__nextsteps_x, data__nextsteps_item in enumerate(data__nextsteps):
+                    if not isinstance(data__nextsteps_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".next_steps[{data__nextsteps_x}]".format(**locals()) + " must be string", value=data__nextsteps_item, name="" + (name_prefix or "data") + ".next_steps[{data__nextsteps_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""Generated by `python -m src.regen_validators` from the "user_context" schema. Do not edit."""
+SCHEMA_HASH = "1bae844855714c426f09dafce5e26c32713a4292e103c202765ac0d5ad6fcee7"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'UserContext', 'description': 'User preferences and session context', 'type': 'object', 'required': ['user_id', 'weather', 'occasion'], 'properties': {'user_id': {'type': 'string', 'description': 'Unique user identifier'}, 'date_time': {'type': 'string', 'format': 'date-time', 'description': 'Request timestamp'}, 'location': {'type': 'string', 'description': 'City or location name'}, 'weather': {'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, 'preferences': {'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Colors/styles to avoid'}, 'fit_pref': {'type': 'string'}}}, 'occasion': {'type': 'array', 'items': {'type': 'string', 'enum': ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']}, 'description': 'Activity/occasion types'}, 'itinerary': {'type': 'array', 'items': {'type': 'object', 'properties': {'time': {'type': 'string'}, 'activity': {'type': 'string'}, 'location': {'type': 'string'}}}, 'description': 'Daily schedule'}, 'palette_analysis': {'type': 'object', 'properties': {'dominant_colors': {'type': 'array', 'items': {'type': 'string'}}, 'seasonal_palette': {'type': 'string'}}, 'description': 'Results from color analysis (from step 1.5)'}, 'demographics': {'type': 'object', 'properties': {'age': {'type': 'integer'}, 'gender': {'type': 'string'}}}, 'last_worn_history': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Item IDs recently worn'}}, 'definitions': {'WeatherContext': {'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['user_id', 'weather', 'occasion']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'UserContext', 'description': 'User preferences and session context', 'type': 'object', 'required': ['user_id', 'weather', 'occasion'], 'properties': {'user_id': {'type': 'string', 'description': 'Unique user identifier'}, 'date_time': {'type': 'string', 'format': 'date-time', 'description': 'Request timestamp'}, 'location': {'type': 'string', 'description': 'City or location name'}, 'weather': {'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, 'preferences': {'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Colors/styles to avoid'}, 'fit_pref': {'type': 'string'}}}, 'occasion': {'type': 'array', 'items': {'type': 'string', 'enum': ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']}, 'description': 'Activity/occasion types'}, 'itinerary': {'type': 'array', 'items': {'type': 'object', 'properties': {'time': {'type': 'string'}, 'activity': {'type': 'string'}, 'location': {'type': 'string'}}}, 'description': 'Daily schedule'}, 'palette_analysis': {'type': 'object', 'properties': {'dominant_colors': {'type': 'array', 'items': {'type': 'string'}}, 'seasonal_palette': {'type': 'string'}}, 'description': 'Results from color analysis (from step 1.5)'}, 'demographics': {'type': 'object', 'properties': {'age': {'type': 'integer'}, 'gender': {'type': 'string'}}}, 'last_worn_history': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Item IDs recently worn'}}, 'definitions': {'WeatherContext': {'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "user_id" in data_keys:
+            data_keys.remove("user_id")
+            data__userid = data["user_id"]
+            if not isinstance(data__userid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".user_id must be string", value=data__userid, name="" + (name_prefix or "data") + ".user_id", definition={'type': 'string', 'description': 'Unique user identifier'}, rule='type')
+        if "date_time" in data_keys:
+            data_keys.remove("date_time")
+            data__datetime = data["date_time"]
+            if not isinstance(data__datetime, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".date_time must be string", value=data__datetime, name="" + (name_prefix or "data") + ".date_time", definition={'type': 'string', 'format': 'date-time', 'description': 'Request timestamp'}, rule='type')
+        if "location" in data_keys:
+            data_keys.remove("location")
+            data__location = data["location"]
+            if not isinstance(data__location, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".location must be string", value=data__location, name="" + (name_prefix or "data") + ".location", definition={'type': 'string', 'description': 'City or location name'}, rule='type')
+        if "weather" in data_keys:
+            data_keys.remove("weather")
+            data__weather = data["weather"]
+            validate___definitions_weathercontext(data__weather, custom_formats, (name_prefix or "data") + ".weather")
+        if "preferences" in data_keys:
+            data_keys.remove("preferences")
+            data__preferences = data["preferences"]
+            if not isinstance(data__preferences, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences must be object", value=data__preferences, name="" + (name_prefix or "data") + ".preferences", definition={'type': 'object', 'properties': {'styles': {'type': 'array', 'items': {'type': 'string'}}, 'colors': {'type': 'array', 'items': {'type': 'string'}}, 'avoid': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Colors/styles to avoid'}, 'fit_pref': {'type': 'string'}}}, rule='type')
+            data__preferences_is_dict = isinstance(data__preferences, dict)
+            if data__preferences_is_dict:
+                data__preferences_keys = set(data__preferences.keys())
+                if "styles" in data__preferences_keys:
+                    data__preferences_keys.remove("styles")
+                    data__preferences__styles = data__preferences["styles"]
+                    if not isinstance(data__preferences__styles, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.styles must be array", value=data__preferences__styles, name="" + (name_prefix or "data") + ".preferences.styles", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__preferences__styles_is_list = isinstance(data__preferences__styles, (list, tuple))
+                    if data__preferences__styles_is_list:
+                        data__preferences__styles_len = len(data__preferences__styles)
+                        for data__preferences__styles_x, data__preferences__styles_item in enumerate(data__preferences__styles):
+                            if not isinstance(data__preferences__styles_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.styles[{data__preferences__styles_x}]".format(**locals()) + " must be string", value=data__preferences__styles_item, name="" + (name_prefix or "data") + ".preferences.styles[{data__preferences__styles_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "colors" in data__preferences_keys:
+                    data__preferences_keys.remove("colors")
+                    data__preferences__colors = data__preferences["colors"]
+                    if not isinstance(data__preferences__colors, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.colors must be array", value=data__preferences__colors, name="" + (name_prefix or "data") + ".preferences.colors", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__preferences__colors_is_list = isinstance(data__preferences__colors, (list, tuple))
+                    if data__preferences__colors_is_list:
+                        data__preferences__colors_len = len(data__preferences__colors)
+                        for data__preferences__colors_x, data__preferences__colors_item in enumerate(data__preferences__colors):
+                            if not isinstance(data__preferences__colors_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.colors[{data__preferences__colors_x}]".format(**locals()) + " must be string", value=data__preferences__colors_item, name="" + (name_prefix or "data") + ".preferences.colors[{data__preferences__colors_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "avoid" in data__preferences_keys:
+                    data__preferences_keys.remove("avoid")
+                    data__preferences__avoid = data__preferences["avoid"]
+                    if not isinstance(data__preferences__avoid, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.avoid must be array", value=data__preferences__avoid, name="" + (name_prefix or "data") + ".preferences.avoid", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Colors/styles to avoid'}, rule='type')
+                    data__preferences__avoid_is_list = isinstance(data__preferences__avoid, (list, tuple))
+                    if data__preferences__avoid_is_list:
+                        data__preferences__avoid_len = len(data__preferences__avoid)
+                        for data__preferences__avoid_x, data__preferences__avoid_item in enumerate(data__preferences__avoid):
+                            if not isinstance(data__preferences__avoid_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.avoid[{data__preferences__avoid_x}]".format(**locals()) + " must be string", value=data__preferences__avoid_item, name="" + (name_prefix or "data") + ".preferences.avoid[{data__preferences__avoid_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "fit_pref" in data__preferences_keys:
+                    data__preferences_keys.remove("fit_pref")
+                    data__preferences__fitpref = data__preferences["fit_pref"]
+                    if not isinstance(data__preferences__fitpref, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".preferences.fit_pref must be string", value=data__preferences__fitpref, name="" + (name_prefix or "data") + ".preferences.fit_pref", definition={'type': 'string'}, rule='type')
+        if "occasion" in data_keys:
+            data_keys.remove("occasion")
+            data__occasion = data["occasion"]
+            if not isinstance(data__occasion, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".occasion must be array", value=data__occasion, name="" + (name_prefix or "data") + ".occasion", definition={'type': 'array', 'items': {'type': 'string', 'enum': ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']}, 'description': 'Activity/occasion types'}, rule='type')
+            data__occasion_is_list = isinstance(data__occasion, (list, tuple))
+            if data__occasion_is_list:
+                data__occasion_len = len(data__occasion)
+                for data__occasion_x, data__occasion_item in enumerate(data__occasion):
+                    if not isinstance(data__occasion_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + " must be string", value=data__occasion_item, name="" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']}, rule='type')
+                    if not (isinstance(data__occasion_item, str) and data__occasion_item == 'work' or isinstance(data__occasion_item, str) and data__occasion_item == 'date' or isinstance(data__occasion_item, str) and data__occasion_item == 'casual_walk' or isinstance(data__occasion_item, str) and data__occasion_item == 'gym' or isinstance(data__occasion_item, str) and data__occasion_item == 'party' or isinstance(data__occasion_item, str) and data__occasion_item == 'outdoor' or isinstance(data__occasion_item, str) and data__occasion_item == 'home' or isinstance(data__occasion_item, str) and data__occasion_item == 'travel'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + " must be one of ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']", value=data__occasion_item, name="" + (name_prefix or "data") + ".occasion[{data__occasion_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['work', 'date', 'casual_walk', 'gym', 'party', 'outdoor', 'home', 'travel']}, rule='enum')
+        if "itinerary" in data_keys:
+            data_keys.remove("itinerary")
+            data__itinerary = data["itinerary"]
+            if not isinstance(data__itinerary, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".itinerary must be array", value=data__itinerary, name="" + (name_prefix or "data") + ".itinerary", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'time': {'type': 'string'}, 'activity': {'type': 'string'}, 'location': {'type': 'string'}}}, 'description': 'Daily schedule'}, rule='type')
+            data__itinerary_is_list = isinstance(data__itinerary, (list, tuple))
+            if data__itinerary_is_list:
+                data__itinerary_len = len(data__itinerary)
+                for data__itinerary_x, data__itinerary_item in enumerate(data__itinerary):
+                    if not isinstance(data__itinerary_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}]".format(**locals()) + " must be object", value=data__itinerary_item, name="" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'time': {'type': 'string'}, 'activity': {'type': 'string'}, 'location': {'type': 'string'}}}, rule='type')
+                    data__itinerary_item_is_dict = isinstance(data__itinerary_item, dict)
+                    if data__itinerary_item_is_dict:
+                        data__itinerary_item_keys = set(data__itinerary_item.keys())
+                        if "time" in data__itinerary_item_keys:
+                            data__itinerary_item_keys.remove("time")
+                            data__itinerary_item__time = data__itinerary_item["time"]
+                            if not isinstance(data__itinerary_item__time, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].time".format(**locals()) + " must be string", value=data__itinerary_item__time, name="" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].time".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "activity" in data__itinerary_item_keys:
+                            data__itinerary_item_keys.remove("activity")
+                            data__itinerary_item__activity = data__itinerary_item["activity"]
+                            if not isinstance(data__itinerary_item__activity, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].activity".format(**locals()) + " must be string", value=data__itinerary_item__activity, name="" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].activity".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "location" in data__itinerary_item_keys:
+                            data__itinerary_item_keys.remove("location")
+                            data__itinerary_item__location = data__itinerary_item["location"]
+                            if not isinstance(data__itinerary_item__location, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].location".format(**locals()) + " must be string", value=data__itinerary_item__location, name="" + (name_prefix or "data") + ".itinerary[{data__itinerary_x}].location".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "palette_analysis" in data_keys:
+            data_keys.remove("palette_analysis")
+            data__paletteanalysis = data["palette_analysis"]
+            if not isinstance(data__paletteanalysis, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".palette_analysis must be object", value=data__paletteanalysis, name="" + (name_prefix or "data") + ".palette_analysis", definition={'type': 'object', 'properties': {'dominant_colors': {'type': 'array', 'items': {'type': 'string'}}, 'seasonal_palette': {'type': 'string'}}, 'description': 'Results from color analysis (from step 1.5)'}, rule='type')
+            data__paletteanalysis_is_dict = isinstance(data__paletteanalysis, dict)
+            if data__paletteanalysis_is_dict:
+                data__paletteanalysis_keys = set(data__paletteanalysis.keys())
+                if "dominant_colors" in data__paletteanalysis_keys:
+                    data__paletteanalysis_keys.remove("dominant_colors")
+                    data__paletteanalysis__dominantcolors = data__paletteanalysis["dominant_colors"]
+                    if not isinstance(data__paletteanalysis__dominantcolors, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".palette_analysis.dominant_colors must be array", value=data__paletteanalysis__dominantcolors, name="" + (name_prefix or "data") + ".palette_analysis.dominant_colors", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__paletteanalysis__dominantcolors_is_list = isinstance(data__paletteanalysis__dominantcolors, (list, tuple))
+                    if data__paletteanalysis__dominantcolors_is_list:
+                        data__paletteanalysis__dominantcolors_len = len(data__paletteanalysis__dominantcolors)
+                        for data__paletteanalysis__dominantcolors_x, data__paletteanalysis__dominantcolors_item in enumerate(data__paletteanalysis__dominantcolors):
+                            if not isinstance(data__paletteanalysis__dominantcolors_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".palette_analysis.dominant_colors[{data__paletteanalysis__dominantcolors_x}]".format(**locals()) + " must be string", value=data__paletteanalysis__dominantcolors_item, name="" + (name_prefix or "data") + ".palette_analysis.dominant_colors[{data__paletteanalysis__dominantcolors_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "seasonal_palette" in data__paletteanalysis_keys:
+                    data__paletteanalysis_keys.remove("seasonal_palette")
+                    data__paletteanalysis__seasonalpalette = data__paletteanalysis["seasonal_palette"]
+                    if not isinstance(data__paletteanalysis__seasonalpalette, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".palette_analysis.seasonal_palette must be string", value=data__paletteanalysis__seasonalpalette, name="" + (name_prefix or "data") + ".palette_analysis.seasonal_palette", definition={'type': 'string'}, rule='type')
+        if "demographics" in data_keys:
+            data_keys.remove("demographics")
+            data__demographics = data["demographics"]
+            if not isinstance(data__demographics, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".demographics must be object", value=data__demographics, name="" + (name_prefix or "data") + ".demographics", definition={'type': 'object', 'properties': {'age': {'type': 'integer'}, 'gender': {'type': 'string'}}}, rule='type')
+            data__demographics_is_dict = isinstance(data__demographics, dict)
+            if data__demographics_is_dict:
+                data__demographics_keys = set(data__demographics.keys())
+                if "age" in data__demographics_keys:
+                    data__demographics_keys.remove("age")
+                    data__demographics__age = data__demographics["age"]
+                    if not isinstance(data__demographics__age, (int)) and not (isinstance(data__demographics__age, float) and data__demographics__age.is_integer()) or isinstance(data__demographics__age, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".demographics.age must be integer", value=data__demographics__age, name="" + (name_prefix or "data") + ".demographics.age", definition={'type': 'integer'}, rule='type')
+                if "gender" in data__demographics_keys:
+                    data__demographics_keys.remove("gender")
+                    data__demographics__gender = data__demographics["gender"]
+                    if not isinstance(data__demographics__gender, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".demographics.gender must be string", value=data__demographics__gender, name="" + (name_prefix or "data") + ".demographics.gender", definition={'type': 'string'}, rule='type')
+        if "last_worn_history" in data_keys:
+            data_keys.remove("last_worn_history")
+            data__lastwornhistory = data["last_worn_history"]
+            if not isinstance(data__lastwornhistory, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_worn_history must be array", value=data__lastwornhistory, name="" + (name_prefix or "data") + ".last_worn_history", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Item IDs recently worn'}, rule='type')
+            data__lastwornhistory_is_list = isinstance(data__lastwornhistory, (list, tuple))
+            if data__lastwornhistory_is_list:
+                data__lastwornhistory_len = len(data__lastwornhistory)
+                for data__lastwornhistory_x, data__lastwornhistory_item in enumerate(data__lastwornhistory):
+                    if not isinstance(data__lastwornhistory_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_worn_history[{data__lastwornhistory_x}]".format(**locals()) + " must be string", value=data__lastwornhistory_item, name="" + (name_prefix or "data") + ".last_worn_history[{data__lastwornhistory_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate___definitions_weathercontext(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['temp_c', 'condition']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "temp_c" in data_keys:
+            data_keys.remove("temp_c")
+            data__tempc = data["temp_c"]
+            if not isinstance(data__tempc, (int)) and not (isinstance(data__tempc, float) and data__tempc.is_integer()) or isinstance(data__tempc, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".temp_c must be integer", value=data__tempc, name="" + (name_prefix or "data") + ".temp_c", definition={'type': 'integer', 'description': 'Temperature in Celsius'}, rule='type')
+        if "humidity" in data_keys:
+            data_keys.remove("humidity")
+            data__humidity = data["humidity"]
+            if not isinstance(data__humidity, (int)) and not (isinstance(data__humidity, float) and data__humidity.is_integer()) or isinstance(data__humidity, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be integer", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='type')
+            if isinstance(data__humidity, (int, float, Decimal)):
+                if data__humidity < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be bigger than or equal to 0", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='minimum')
+                if data__humidity > 100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be smaller than or equal to 100", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='maximum')
+        if "condition" in data_keys:
+            data_keys.remove("condition")
+            data__condition = data["condition"]
+            if not isinstance(data__condition, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".condition must be string", value=data__condition, name="" + (name_prefix or "data") + ".condition", definition={'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, rule='type')
+            if not (isinstance(data__condition, str) and data__condition == 'sunny' or isinstance(data__condition, str) and data__condition == 'cloudy' or isinstance(data__condition, str) and data__condition == 'rainy' or isinstance(data__condition, str) and data__condition == 'snowy' or isinstance(data__condition, str) and data__condition == 'windy' or isinstance(data__condition, str) and data__condition == 'hot' or isinstance(data__condition, str) and data__condition == 'cold'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".condition must be one of ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold']", value=data__condition, name="" + (name_prefix or "data") + ".condition", definition={'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, rule='enum')
+        if "uv_index" in data_keys:
+            data_keys.remove("uv_index")
+            data__uvindex = data["uv_index"]
+            if not isinstance(data__uvindex, (int, float, Decimal)) or isinstance(data__uvindex, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".uv_index must be number", value=data__uvindex, name="" + (name_prefix or "data") + ".uv_index", definition={'type': 'number', 'description': 'UV index (0-12+)'}, rule='type')
+        if "wind_speed_kmh" in data_keys:
+            data_keys.remove("wind_speed_kmh")
+            data__windspeedkmh = data["wind_speed_kmh"]
+            if not isinstance(data__windspeedkmh, (int, float, Decimal)) or isinstance(data__windspeedkmh, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".wind_speed_kmh must be number", value=data__windspeedkmh, name="" + (name_prefix or "data") + ".wind_speed_kmh", definition={'type': 'number', 'description': 'Wind speed in km/h'}, rule='type')
+    return data
\ No newline at end of file
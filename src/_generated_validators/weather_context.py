@@ -0,0 +1,51 @@
+"""Generated by `python -m src.regen_validators` from the "weather_context" schema. Do not edit."""
+SCHEMA_HASH = "647a3095d5fd6d83c562288179448b3f715bb4cdb2baf8a3484c1c75dbc7d2e9"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['temp_c', 'condition']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'title': 'WeatherContext', 'type': 'object', 'required': ['temp_c', 'condition'], 'properties': {'temp_c': {'type': 'integer', 'description': 'Temperature in Celsius'}, 'humidity': {'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, 'condition': {'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, 'uv_index': {'type': 'number', 'description': 'UV index (0-12+)'}, 'wind_speed_kmh': {'type': 'number', 'description': 'Wind speed in km/h'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "temp_c" in data_keys:
+            data_keys.remove("temp_c")
+            data__tempc = data["temp_c"]
+            if not isinstance(data__tempc, (int)) and not (isinstance(data__tempc, float) and data__tempc.is_integer()) or isinstance(data__tempc, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".temp_c must be integer", value=data__tempc, name="" + (name_prefix or "data") + ".temp_c", definition={'type': 'integer', 'description': 'Temperature in Celsius'}, rule='type')
+        if "humidity" in data_keys:
+            data_keys.remove("humidity")
+            data__humidity = data["humidity"]
+            if not isinstance(data__humidity, (int)) and not (isinstance(data__humidity, float) and data__humidity.is_integer()) or isinstance(data__humidity, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be integer", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='type')
+            if isinstance(data__humidity, (int, float, Decimal)):
+                if data__humidity < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be bigger than or equal to 0", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='minimum')
+                if data__humidity > 100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".humidity must be smaller than or equal to 100", value=data__humidity, name="" + (name_prefix or "data") + ".humidity", definition={'type': 'integer', 'minimum': 0, 'maximum': 100, 'description': 'Humidity percentage'}, rule='maximum')
+        if "condition" in data_keys:
+            data_keys.remove("condition")
+            data__condition = data["condition"]
+            if not isinstance(data__condition, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".condition must be string", value=data__condition, name="" + (name_prefix or "data") + ".condition", definition={'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, rule='type')
+            if not (isinstance(data__condition, str) and data__condition == 'sunny' or isinstance(data__condition, str) and data__condition == 'cloudy' or isinstance(data__condition, str) and data__condition == 'rainy' or isinstance(data__condition, str) and data__condition == 'snowy' or isinstance(data__condition, str) and data__condition == 'windy' or isinstance(data__condition, str) and data__condition == 'hot' or isinstance(data__condition, str) and data__condition == 'cold'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".condition must be one of ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold']", value=data__condition, name="" + (name_prefix or "data") + ".condition", definition={'type': 'string', 'enum': ['sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'hot', 'cold'], 'description': 'Weather condition'}, rule='enum')
+        if "uv_index" in data_keys:
+            data_keys.remove("uv_index")
+            data__uvindex = data["uv_index"]
+            if not isinstance(data__uvindex, (int, float, Decimal)) or isinstance(data__uvindex, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".uv_index must be number", value=data__uvindex, name="" + (name_prefix or "data") + ".uv_index", definition={'type': 'number', 'description': 'UV index (0-12+)'}, rule='type')
+        if "wind_speed_kmh" in data_keys:
+            data_keys.remove("wind_speed_kmh")
+            data__windspeedkmh = data["wind_speed_kmh"]
+            if not isinstance(data__windspeedkmh, (int, float, Decimal)) or isinstance(data__windspeedkmh, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".wind_speed_kmh must be number", value=data__windspeedkmh, name="" + (name_prefix or "data") + ".wind_speed_kmh", definition={'type': 'number', 'description': 'Wind speed in km/h'}, rule='type')
+    return data
\ No newline at end of file
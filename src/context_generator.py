@@ -5,9 +5,43 @@ Simulates input from:
 - Context Collector (weather, occasion, itinerary)
 """
 
-import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+from src.json_utils import dump_json
+
+
+# Keyword fragments per seasonal palette, in tie-break order
+SEASONAL_KEYWORDS = (
+    ("spring", ("pink", "peach", "mint", "lavender", "light")),
+    ("summer", ("white", "yellow", "light_blue", "bright")),
+    ("fall", ("orange", "brown", "rust", "olive", "gold")),
+    ("winter", ("navy", "black", "burgundy", "deep", "cool")),
+)
+_SEASONAL_PATTERNS = tuple(
+    (season, re.compile("|".join(map(re.escape, keywords))))
+    for season, keywords in SEASONAL_KEYWORDS
+)
+
+# Scenario batches above this size are generated in a process pool
+PARALLEL_MIN_SCENARIOS = 64
+
+# Default values, kept as immutable tuples. Each generated context gets its
+# own lists/dicts built from them, so callers may mutate their context freely.
+DEFAULT_OCCASION = ("casual_walk",)
+DEFAULT_STYLE_COLORS = ("white", "navy", "beige")
+DEFAULT_STYLE_AESTHETICS = ("casual", "minimalist")
+DEFAULT_AVOID = ("neon", "bright_patterns")
+# (time, activity, location)
+DEFAULT_ITINERARY = (
+    ("09:00", "office_work", "office"),
+    ("12:30", "lunch_meeting", "cafe"),
+)
 
 
 def generate_step15_context(
@@ -40,29 +74,21 @@ def generate_step15_context(
     """
     
     if date is None:
-        date = datetime.now().isoformat()
+        date = _default_now_iso()
     
     if occasion is None:
-        occasion = ["casual_walk"]
+        occasion = list(DEFAULT_OCCASION)
     
     if user_style_colors is None:
-        user_style_colors = ["white", "navy", "beige"]
+        user_style_colors = list(DEFAULT_STYLE_COLORS)
     
     if user_style_aesthetics is None:
-        user_style_aesthetics = ["casual", "minimalist"]
+        user_style_aesthetics = list(DEFAULT_STYLE_AESTHETICS)
     
     if itinerary is None:
         itinerary = [
-            {
-                "time": "09:00",
-                "activity": "office_work",
-                "location": "office"
-            },
-            {
-                "time": "12:30",
-                "activity": "lunch_meeting",
-                "location": "cafe"
-            }
+            {"time": time_, "activity": activity, "location": location}
+            for time_, activity, location in DEFAULT_ITINERARY
         ]
     
     context = {
@@ -91,7 +117,7 @@ def generate_step15_context(
         "preferences": {
             "styles": user_style_aesthetics,  # e.g., ["casual", "minimalist"]
             "colors": user_style_colors,
-            "avoid": ["neon", "bright_patterns"],  # Can be set by user
+            "avoid": list(DEFAULT_AVOID),  # Can be set by user
             "fit_pref": "regular"
         },
         
@@ -112,6 +138,33 @@ def generate_step15_context(
     return context
 
 
+def preference_sets(context: Dict[str, Any]) -> Dict[str, frozenset]:
+    """
+    Set views of the list-valued context fields, for membership filtering.
+    
+    The context itself keeps JSON arrays (ordered, serializable); build
+    these once per request so retrieval/ranking loops test membership in
+    O(1) instead of scanning lists per candidate.
+    
+    Returns:
+        Dict with frozensets for occasion, styles, colors, avoid,
+        last_worn_history (empty when the field is absent)
+    """
+    preferences = context.get("preferences", {})
+    return {
+        "occasion": frozenset(context.get("occasion", ())),
+        "styles": frozenset(preferences.get("styles", ())),
+        "colors": frozenset(preferences.get("colors", ())),
+        "avoid": frozenset(preferences.get("avoid", ())),
+        "last_worn_history": frozenset(context.get("last_worn_history", ())),
+    }
+
+
+def _default_now_iso() -> str:
+    """Current local time as an ISO string (default context timestamp)."""
+    return datetime.fromtimestamp(time.time()).isoformat()
+
+
 def _classify_seasonal_palette(colors: List[str]) -> str:
     """
     Classify seasonal color palette based on dominant colors.
@@ -121,45 +174,49 @@ def _classify_seasonal_palette(colors: List[str]) -> str:
     Fall: earth tones, warm colors
     Winter: cool, deep colors
     """
-    color_lower = [c.lower() for c in colors]
-    
-    spring_colors = ["pink", "peach", "mint", "lavender", "light"]
-    summer_colors = ["white", "yellow", "light_blue", "bright"]
-    fall_colors = ["orange", "brown", "rust", "olive", "gold"]
-    winter_colors = ["navy", "black", "burgundy", "deep", "cool"]
-    
-    spring_score = sum(1 for c in color_lower if any(sc in c for sc in spring_colors))
-    summer_score = sum(1 for c in color_lower if any(sc in c for sc in summer_colors))
-    fall_score = sum(1 for c in color_lower if any(sc in c for sc in fall_colors))
-    winter_score = sum(1 for c in color_lower if any(sc in c for sc in winter_colors))
-    
-    scores = {
-        "spring": spring_score,
-        "summer": summer_score,
-        "fall": fall_score,
-        "winter": winter_score
-    }
+    scores = {season: 0 for season, _ in SEASONAL_KEYWORDS}
+    for color in colors:
+        for season in _color_seasons(color.lower()):
+            scores[season] += 1
     
-    return max(scores, key=scores.get) if max(scores.values()) > 0 else "neutral"
+    best = max(scores, key=scores.get)
+    return best if scores[best] > 0 else "neutral"
+
+
+@lru_cache(maxsize=512)
+def _color_seasons(color: str) -> Tuple[str, ...]:
+    """Seasons whose keywords appear in a (lowercased) color name."""
+    return tuple(season for season, pattern in _SEASONAL_PATTERNS if pattern.search(color))
+
+
+# Base UV per condition; higher temp = more sun exposure
+_BASE_UV = {
+    "sunny": 8,
+    "cloudy": 3,
+    "rainy": 1,
+    "snowy": 2,
+    "windy": 5,
+}
+_UNKNOWN_CONDITION_UV = 4
+
+# Final (clamped to 0-11) UV index for every (condition, temperature bucket)
+_UV_TABLE = {
+    (condition, bucket): max(0, min(11, base + bucket))
+    for condition, base in _BASE_UV.items()
+    for bucket in (-1, 0, 1)
+}
+_UV_DEFAULT = {bucket: max(0, min(11, _UNKNOWN_CONDITION_UV + bucket)) for bucket in (-1, 0, 1)}
+
+
+def _temp_bucket(temp_c: int) -> int:
+    """Temperature adjustment for UV: +1 when hot (>25°C), -1 when cold (<5°C)."""
+    return 1 if temp_c > 25 else -1 if temp_c < 5 else 0
 
 
 def _estimate_uv_index(condition: str, temp_c: int) -> float:
     """Estimate UV index based on condition."""
-    base_uv = {
-        "sunny": 8,
-        "cloudy": 3,
-        "rainy": 1,
-        "snowy": 2,
-        "windy": 5,
-    }.get(condition.lower(), 4)
-    
-    # Adjust for temperature (higher temp = more sun exposure)
-    if temp_c > 25:
-        base_uv += 1
-    elif temp_c < 5:
-        base_uv -= 1
-    
-    return max(0, min(11, base_uv))
+    bucket = _temp_bucket(temp_c)
+    return _UV_TABLE.get((condition.lower(), bucket), _UV_DEFAULT[bucket])
 
 
 def generate_multiple_contexts(count: int = 5) -> List[Dict[str, Any]]:
@@ -209,7 +266,35 @@ def generate_multiple_contexts(count: int = 5) -> List[Dict[str, Any]]:
         },
     ]
     
-    return [generate_step15_context(**scenario) for scenario in scenarios[:count]]
+    return generate_contexts_from_scenarios(scenarios[:count])
+
+
+def generate_contexts_from_scenarios(
+    scenarios: List[Dict[str, Any]],
+    max_workers: int = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate one context per scenario (kwargs for generate_step15_context).
+    
+    Batches larger than PARALLEL_MIN_SCENARIOS are spread over a process
+    pool; smaller ones run inline to avoid the pool start-up cost.
+    """
+    # One shared timestamp for the whole batch
+    now = _default_now_iso()
+    scenarios = [{"date": now, **scenario} for scenario in scenarios]
+    
+    if len(scenarios) <= PARALLEL_MIN_SCENARIOS:
+        return [_context_from_scenario(scenario) for scenario in scenarios]
+    
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(scenarios) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_context_from_scenario, scenarios, chunksize=chunksize))
+
+
+def _context_from_scenario(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    # Top-level so it can be pickled for ProcessPoolExecutor
+    return generate_step15_context(**scenario)
 
 
 if __name__ == "__main__":
@@ -241,7 +326,6 @@ if __name__ == "__main__":
         ]
     )
     
-    with open("step15_context_example.json", "w", encoding="utf-8") as f:
-        json.dump(example_ctx, f, ensure_ascii=False, indent=2)
+    dump_json("step15_context_example.json", example_ctx)
     
     print(f"\n✓ Saved example context to step15_context_example.json")
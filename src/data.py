@@ -1,6 +1,10 @@
 import random
-import json
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+from src.json_utils import dump_json
 
 ROLES = ["top", "bottom", "outer", "shoes", "accessory"]
 STYLES = ["casual", "formal", "sporty", "boho", "street", "smart-casual"]
@@ -8,48 +12,152 @@ COLORS = ["white", "black", "navy", "khaki", "brown", "beige", "olive", "red", "
 MATERIALS = ["cotton", "linen", "wool", "polyester", "leather"]
 PATTERNS = ["plain", "stripe", "floral", "check"]
 SEASONS = ["spring", "summer", "fall", "winter"]
+OCCASIONS = ["work", "date", "coffee", "gym", "party", "outdoor_walk"]
+
+
+# Categorical item attributes and their vocabularies, in draw order
+ITEM_ATTRIBUTES = (
+    ("role", ROLES),
+    ("style", STYLES),
+    ("color", COLORS),
+    ("material", MATERIALS),
+    ("pattern", PATTERNS),
+    ("season", SEASONS),
+)
+_VOCAB = dict(ITEM_ATTRIBUTES)
+_DIMS = tuple(len(vocab) for _, vocab in ITEM_ATTRIBUTES)
 
 
-def _rand_choice(lst):
-    return random.choice(lst)
+class ItemTable:
+    """
+    Column-oriented (struct-of-arrays) store for synthetic items.
+    
+    Categorical attributes are kept as int8 codes into their vocabulary
+    list, so a column costs one byte per item. Item dicts are only built
+    on demand via row() / to_dicts().
+    """
+    
+    __slots__ = ("role", "style", "color", "material", "pattern", "season", "available", "popularity")
+    
+    def __init__(self, codes: Dict[str, np.ndarray], popularity: np.ndarray, available: np.ndarray = None):
+        for name, _ in ITEM_ATTRIBUTES:
+            setattr(self, name, np.asarray(codes[name], dtype=np.int8))
+        self.popularity = np.asarray(popularity, dtype=np.float64)
+        if available is None:
+            available = np.ones(len(self.popularity), dtype=bool)
+        self.available = np.asarray(available, dtype=bool)
+    
+    def __len__(self) -> int:
+        return len(self.popularity)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Decoded string values of a categorical column."""
+        return np.asarray(_VOCAB[name])[getattr(self, name)]
+    
+    def mask(self, **filters: str) -> np.ndarray:
+        """
+        Boolean mask of items matching every attribute filter.
+        
+        Example: table.mask(role="top", color="white")
+        """
+        result = np.ones(len(self), dtype=bool)
+        for name, value in filters.items():
+            if value not in _VOCAB[name]:
+                return np.zeros(len(self), dtype=bool)
+            result &= getattr(self, name) == _VOCAB[name].index(value)
+        return result
+    
+    def combos(self) -> np.ndarray:
+        """Single integer code per item for its full attribute combination."""
+        return np.ravel_multi_index([getattr(self, name) for name, _ in ITEM_ATTRIBUTES], _DIMS)
+    
+    def row(self, i: int) -> Dict:
+        """Materialize a single item dict."""
+        combo = int(np.ravel_multi_index([getattr(self, name)[i] for name, _ in ITEM_ATTRIBUTES], _DIMS))
+        return _item_dict(i, _item_fields(combo), bool(self.available[i]), float(self.popularity[i]))
+    
+    def to_dicts(self) -> List[Dict]:
+        """Materialize all items as a list of dicts (JSON-compatible)."""
+        return [
+            _item_dict(i, _item_fields(combo), available, popularity)
+            for i, (combo, available, popularity) in enumerate(
+                zip(self.combos().tolist(), self.available.tolist(), self.popularity.tolist())
+            )
+        ]
+
+
+@lru_cache(maxsize=None)
+def _item_fields(combo: int) -> Tuple[str, ...]:
+    """
+    Decoded attributes plus title/description for one attribute combination.
+    
+    Filled lazily, so each distinct combination is formatted once and its
+    strings are shared by every item that uses it.
+    """
+    role, style, color, material, pattern, season = (
+        vocab[code] for (_, vocab), code in zip(ITEM_ATTRIBUTES, np.unravel_index(combo, _DIMS))
+    )
+    title = f"{color} {material} {role}"
+    desc = f"A {style}, {pattern} {role} in {color} made of {material}. Suitable for {season}."
+    return role, style, color, material, pattern, season, title, desc
+
+
+def _item_dict(i: int, fields: Tuple[str, ...], available: bool, popularity: float) -> Dict:
+    role, style, color, material, pattern, season, title, desc = fields
+    return {
+        "item_id": f"item_{i}",
+        "role": role,
+        "title": title,
+        "description": desc,
+        "color": color,
+        "style": style,
+        "material": material,
+        "pattern": pattern,
+        "season": season,
+        "available": available,
+        "popularity": popularity,
+    }
+
+
+def generate_item_table(n: int = 200, seed: int = 42) -> ItemTable:
+    # Draw every attribute column in one batched call
+    rng = np.random.default_rng(seed)
+    codes = {name: rng.integers(0, len(vocab), n) for name, vocab in ITEM_ATTRIBUTES}
+    return ItemTable(codes, popularity=rng.random(n))
 
 
 def generate_items(n: int = 200, seed: int = 42) -> List[Dict]:
-    random.seed(seed)
-    items = []
-    for i in range(n):
-        role = _rand_choice(ROLES)
-        style = _rand_choice(STYLES)
-        color = _rand_choice(COLORS)
-        material = _rand_choice(MATERIALS)
-        pattern = _rand_choice(PATTERNS)
-        season = _rand_choice(SEASONS)
-        title = f"{color} {material} {role}"
-        desc = f"A {style}, {pattern} {role} in {color} made of {material}. Suitable for {season}."
-        items.append({
-            "item_id": f"item_{i}",
-            "role": role,
-            "title": title,
-            "description": desc,
-            "color": color,
-            "style": style,
-            "material": material,
-            "pattern": pattern,
-            "season": season,
-            "available": True,
-            "popularity": random.random(),
-        })
-    return items
+    return generate_item_table(n, seed).to_dicts()
 
 
 def generate_context(seed: int = 1) -> Dict:
-    random.seed(seed)
-    temp_c = random.randint(5, 30)
-    humidity = random.randint(20, 90)
-    pref_styles = random.sample(STYLES, k=1)
-    occasion = random.choice(["work", "date", "coffee", "gym", "party", "outdoor_walk"])
-    palette = random.sample(COLORS, k=2)
-    ctx = {
+    # Local generator: same draws as random.seed(seed), without touching global state
+    rng = random.Random(seed)
+    temp_c = rng.randint(5, 30)
+    humidity = rng.randint(20, 90)
+    pref_styles = rng.sample(STYLES, k=1)
+    occasion = rng.choice(OCCASIONS)
+    palette = rng.sample(COLORS, k=2)
+    return _build_context(temp_c, humidity, pref_styles, occasion, palette)
+
+
+def generate_contexts(n: int, seed: int = 1) -> List[Dict]:
+    # Bulk variant: every random field is drawn for all n contexts in one call
+    rng = np.random.default_rng(seed)
+    temps = rng.integers(5, 31, n).tolist()
+    humidities = rng.integers(20, 91, n).tolist()
+    styles = rng.integers(0, len(STYLES), n).tolist()
+    occasions = rng.integers(0, len(OCCASIONS), n).tolist()
+    # Two distinct palette colors per context: first two of a random permutation
+    palettes = np.argsort(rng.random((n, len(COLORS))), axis=1)[:, :2].tolist()
+    return [
+        _build_context(t, h, [STYLES[s]], OCCASIONS[o], [COLORS[a], COLORS[b]])
+        for t, h, s, o, (a, b) in zip(temps, humidities, styles, occasions, palettes)
+    ]
+
+
+def _build_context(temp_c: int, humidity: int, pref_styles: List[str], occasion: str, palette: List[str]) -> Dict:
+    return {
         "user_id": "user_demo",
         "date_time": "2025-12-10T09:00:00Z",
         "location": "demo_city",
@@ -60,12 +168,10 @@ def generate_context(seed: int = 1) -> Dict:
         "demographics": {"age": 30, "gender": "female"},
         "last_worn_history": [],
     }
-    return ctx
 
 
 def save_json(path: str, obj):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    dump_json(path, obj)
 
 
 if __name__ == "__main__":
@@ -8,18 +8,50 @@ Provides:
 3. Text-based hybrid search combining embeddings with keyword matching
 """
 
-import json
+import heapq
 import os
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from pathlib import Path
 
+from src.json_utils import dump_json, load_json
+
 try:
     from sentence_transformers import SentenceTransformer
     HAS_EMBEDDINGS = True
 except ImportError:
     HAS_EMBEDDINGS = False
 
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+
+def _load_step1_json(json_path: str) -> Any:
+    """Parse a Step 1 JSON file, with simdjson's SIMD tokenizer when installed."""
+    if HAS_SIMDJSON:
+        # Step 1 output is only read, never re-serialized
+        with open(json_path, "rb") as f:
+            return simdjson.loads(f.read())
+    return load_json(json_path)
+
 
 def load_catalog_from_step1(json_path: str) -> List[Dict[str, Any]]:
     """
@@ -31,8 +63,7 @@ def load_catalog_from_step1(json_path: str) -> List[Dict[str, Any]]:
     Returns:
         List of outfit items with standardized fields for Step 3
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        step1_data = json.load(f)
+    step1_data = _load_step1_json(json_path)
     
     items = []
     for idx, outfit in enumerate(step1_data):
@@ -61,19 +92,63 @@ def load_catalog_from_step1(json_path: str) -> List[Dict[str, Any]]:
     return items
 
 
+def load_standardized_catalog(json_path: str) -> List[Dict[str, Any]]:
+    """
+    Load Step 1 output straight into the standard recommender schema.
+    
+    Single-pass equivalent of
+    convert_to_standard_format(load_catalog_from_step1(json_path)): no
+    intermediate items and no raw_metadata copies are built.
+    
+    Args:
+        json_path: Path to outfit_descriptions.json from Step 1
+    
+    Returns:
+        Items in standardized schema format
+    """
+    return [_standardize_outfit(idx, outfit) for idx, outfit in enumerate(_load_step1_json(json_path))]
+
+
+def _standardize_outfit(idx: int, outfit: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the standardized item for the idx-th Step 1 outfit."""
+    get = outfit.get
+    color = get("color_primary", "")
+    return {
+        "item_id": f"outfit_{idx}",
+        "title": get("complete_description", get("subcategory", f"Outfit {idx}")),
+        "role": _map_category_to_role(get("category", "")),
+        "color": color,
+        "colors": [color] + ([get("color_secondary", "")] if get("color_secondary") else []),
+        "style": get("style_aesthetic", ""),
+        "material": get("material", ""),
+        "pattern": get("pattern", ""),
+        "fit": get("fit_silhouette", ""),
+        "description": get("complete_description", ""),
+        "category": get("category", ""),
+        "subcategory": get("subcategory", ""),
+        "sleeve_length": get("sleeve_length", ""),
+        "length": get("length", ""),
+        "available": True,
+        "popularity": 0.5,  # Default; can be updated based on usage
+        "image_url": "",  # To be filled with actual image URLs
+    }
+
+
+# Step 1 category keyword -> role, checked in this order
+_ROLE_MAP = {"upper": "top", "lower": "bottom", "dress": "dress", "set": "set"}
+
+
+@lru_cache(maxsize=256)
 def _map_category_to_role(category: str) -> str:
     """Map Step 1 category to our role field."""
     category_lower = category.lower()
-    if "upper" in category_lower:
-        return "top"
-    elif "lower" in category_lower:
-        return "bottom"
-    elif "dress" in category_lower:
-        return "dress"
-    elif "set" in category_lower:
-        return "set"
-    else:
-        return "other"
+    role = _ROLE_MAP.get(category_lower)
+    if role is not None:
+        return role
+    for keyword, role in _ROLE_MAP.items():
+        if keyword in category_lower:
+            return role
+    return "other"
 
 
 def convert_to_standard_format(step1_catalog: List[Dict]) -> List[Dict]:
@@ -112,10 +187,124 @@ def convert_to_standard_format(step1_catalog: List[Dict]) -> List[Dict]:
     return standardized
 
 
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, in O(N + k log k)."""
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _quantize_rows(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-row int8 quantization.
+    
+    Args:
+        vectors: Float array of shape (N, D)
+    
+    Returns:
+        (int8 codes of shape (N, D), float32 scales of shape (N,)) with
+        vectors ~= codes * scales[:, None]
+    """
+    scale = np.max(np.abs(vectors), axis=1) / 127.0
+    scale = np.maximum(scale, 1e-12).astype(np.float32)
+    codes = np.rint(vectors / scale[:, None]).astype(np.int8)
+    return codes, scale
+
+
+def _cuda_available() -> bool:
+    """True if torch is installed and sees a CUDA device."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def _load_sentence_model(
+    model_name: str,
+    onnx: bool = False,
+    half_precision: bool = False,
+    max_seq_length: Optional[int] = None
+):
+    """
+    Load a SentenceTransformer for query encoding.
+    
+    Tries the ONNX backend and/or fp16 weights first when requested and falls
+    back to the default fp32 torch model if those are unavailable (older
+    sentence-transformers, missing optimum/onnxruntime). fp16 is only tried
+    on CUDA: CPU float16 weights may load but then fail or crawl in encode().
+    
+    Args:
+        model_name: Sentence transformer model name or path
+        onnx: Try the ONNX runtime backend
+        half_precision: Try loading the weights as float16 (CUDA only)
+        max_seq_length: Cap on query length in tokens (None keeps the model default)
+    
+    Returns:
+        SentenceTransformer model in eval mode
+    """
+    attempts = []
+    if onnx:
+        attempts.append({"backend": "onnx"})
+    if half_precision and _cuda_available():
+        attempts.append({"model_kwargs": {"torch_dtype": "float16"}})
+    attempts.append({})
+    
+    for i, kwargs in enumerate(attempts):
+        try:
+            model = SentenceTransformer(model_name, **kwargs)
+            break
+        except Exception:
+            if i == len(attempts) - 1:
+                raise
+    
+    if hasattr(model, "eval"):
+        model.eval()
+    if max_seq_length:
+        model.max_seq_length = max_seq_length
+    return model
+
+
+def _model_dimension(model) -> int:
+    """
+    Output dimension of a SentenceTransformer, read from its config.
+    
+    Falls back to encoding a probe string only for models that do not
+    report their dimension.
+    """
+    dim = model.get_sentence_embedding_dimension()
+    if dim is None:
+        dim = model.encode(["__test__"], convert_to_numpy=True).shape[1]
+    return int(dim)
+
+
 def save_standardized_catalog(items: List[Dict], output_path: str):
     """Save standardized catalog to JSON."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    dump_json(output_path, items)
+
+
+# Item attributes supported by CatalogLoader.search_by_attributes
+ATTRIBUTE_FIELDS = ("color", "material", "style", "fit", "category")
+
+# Item fields searched by the keyword fallback
+KEYWORD_FIELDS = ("title", "description", "color", "material", "style")
+
+# Low-cardinality item fields whose string values are interned on load
+INTERNED_FIELDS = ("color", "material", "style", "category", "fit", "pattern", "role")
+
+# Vector search backends: exact numpy matmul, exact FAISS inner product,
+# or approximate FAISS HNSW (sublinear queries for very large catalogs)
+SEARCH_BACKENDS = ("numpy", "faiss", "faiss-hnsw")
+HNSW_NEIGHBORS = 32
+
+# Rows of the int8 catalog widened to float32 at a time when scoring
+QUANTIZED_BLOCK_ROWS = 65536
+
+# Normalized query embeddings kept per CatalogLoader (LRU by query string)
+QUERY_CACHE_SIZE = 1024
 
 
 class CatalogLoader:
@@ -130,7 +319,13 @@ class CatalogLoader:
         self,
         catalog_path: str = "items.json",
         embeddings_path: Optional[str] = None,
-        model_name: str = "all-MiniLM-L6-v2"
+        model_name: str = "all-MiniLM-L6-v2",
+        backend: str = "numpy",
+        onnx: bool = False,
+        half_precision: bool = False,
+        max_seq_length: Optional[int] = None,
+        mmap_embeddings: bool = False,
+        quantize: bool = False
     ):
         """
         Initialize the catalog loader.
@@ -139,86 +334,198 @@ class CatalogLoader:
             catalog_path: Path to JSON file with outfit descriptions
             embeddings_path: Path to NPY file with precomputed embeddings
             model_name: Sentence transformer model to use for query embeddings
+            backend: Vector search backend, one of SEARCH_BACKENDS. "faiss" and
+                "faiss-hnsw" need the faiss package and fall back to numpy without it.
+            onnx: Load the query encoder with the ONNX runtime backend if available
+            half_precision: Load the query encoder in float16 on CUDA devices
+            max_seq_length: Token cap for query encoding (queries are short, so a
+                small value such as 64 avoids padding to the model maximum)
+            mmap_embeddings: Memory-map the NPY file instead of reading it into RAM
+                (only the raw embeddings; the normalized search copy is in memory)
+            quantize: Keep the normalized embeddings as int8 (4x smaller) for the
+                numpy backend and release the float32 copies (self.embeddings is
+                then None unless memory-mapped); similarities become approximate
         """
+        if backend not in SEARCH_BACKENDS:
+            raise ValueError(f"Unknown search backend: {backend!r} (expected one of {SEARCH_BACKENDS})")
         self.catalog_path = catalog_path
         self.embeddings_path = embeddings_path
         self.model_name = model_name
+        self.backend = backend
+        self._model_options = {
+            "onnx": onnx,
+            "half_precision": half_precision,
+            "max_seq_length": max_seq_length,
+        }
         
         # Load catalog
         self.catalog = self._load_catalog()
         self.catalog_size = len(self.catalog)
         
-        # Load embeddings if available. If model and embeddings dimensions
-        # mismatch, disable the embedding_model and fallback to keyword search.
+        # item_id -> item lookup (first occurrence wins, as with a linear scan)
+        self._id_index: Dict[str, Dict] = {}
+        for item in self.catalog:
+            self._id_index.setdefault(item.get("item_id"), item)
+        
+        # Structure-of-arrays view of the attribute fields: raw values as
+        # object columns, plus lowercased string columns for filtering
+        self._columns: Dict[str, np.ndarray] = {
+            field: np.fromiter(
+                (item.get(field, "") for item in self.catalog), dtype=object, count=self.catalog_size
+            )
+            for field in ATTRIBUTE_FIELDS
+        }
+        self._attr_lc: Dict[str, np.ndarray] = {
+            field: np.array([str(value or "").lower() for value in column], dtype=str)
+            for field, column in self._columns.items()
+        }
+        
+        # Lowercased text searched by the keyword fallback, one string per item
+        self._search_text: List[str] = [
+            " ".join(str(item.get(field) or "").lower() for field in KEYWORD_FIELDS)
+            for item in self.catalog
+        ]
+        
+        # Inverted index over the search text: token -> ascending item indices
+        self._postings: Dict[str, List[int]] = {}
+        for idx, text in enumerate(self._search_text):
+            for token in set(text.split()):
+                self._postings.setdefault(token, []).append(idx)
+        
+        # Load embeddings if available. The query model is loaded lazily by
+        # _init_model on the first text search; if its dimension mismatches the
+        # embeddings, embedding_model stays None and search falls back to keywords.
         self.embeddings = None
+        self.embedding_dim: Optional[int] = None
+        self._embeddings_norm = None
+        self._index = None
+        self._emb_i8 = None
+        self._emb_scale = None
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         self.embedding_model = None
+        self._model_ready = False
         if embeddings_path and os.path.exists(embeddings_path) and HAS_EMBEDDINGS:
             try:
-                self.embeddings = np.load(embeddings_path)
+                # float32, C-contiguous; a float32 file opened with mmap stays on disk
+                raw = np.load(embeddings_path, mmap_mode="r" if mmap_embeddings else None)
+                self.embeddings = np.ascontiguousarray(raw, dtype=np.float32)
             except Exception:
                 self.embeddings = None
-
+            
             if self.embeddings is not None:
+                self.embedding_dim = int(self.embeddings.shape[1]) if self.embeddings.ndim > 1 else 0
+                # L2-normalize once so each query is a single matrix-vector product
+                emb = self.embeddings / np.maximum(
+                    np.linalg.norm(self.embeddings, axis=1, keepdims=True), 1e-10
+                )
+                self._embeddings_norm = emb
+                self._index = self._build_index(emb)
+                if quantize and self._index is None and emb.ndim == 2:
+                    self._emb_i8, self._emb_scale = _quantize_rows(emb)
+                    self._embeddings_norm = None
+                    # Search only reads the int8 copy; keep the raw matrix only
+                    # when it is a memory-mapped view (on disk, not in RAM)
+                    if not (mmap_embeddings and self.embeddings.base is raw):
+                        self.embeddings = None
+    
+    def _init_model(self):
+        """
+        Load the query embedding model on first use.
+        
+        Verifies that the configured model matches the embedding dimension and
+        otherwise tries to auto-detect a compatible model. If none matches,
+        embedding_model stays None and text search uses the keyword fallback.
+        """
+        self._model_ready = True
+        if self.embedding_dim is None:
+            return
+        
+        try:
+            # Try to load the embedding model and verify vector dimension
+            model = _load_sentence_model(self.model_name, **self._model_options)
+            model_dim = _model_dimension(model)
+            emb_dim = self.embedding_dim
+            if model_dim == emb_dim:
+                self.embedding_model = model
+            else:
+                print(
+                    f"Warning: embedding dimension mismatch: embeddings={emb_dim}, model={model_dim}."
+                    " Disabling embedding model and using keyword fallback."
+                )
+                self.embedding_model = None
+        except Exception as e:
+            # If model loading or encoding fails, fall back to keyword search
+            print(f"Warning: failed to initialize embedding model '{self.model_name}': {e}. Using keyword fallback.")
+            self.embedding_model = None
+
+        # If embeddings loaded but model didn't match, attempt to auto-detect a compatible model
+        if self.embedding_model is None:
+            # Candidate models to try (ordered by likelihood)
+            candidate_models = [
+                'distiluse-base-multilingual-cased-v2',
+                'sentence-transformers/distiluse-base-multilingual-cased-v2',
+                'paraphrase-multilingual-MiniLM-L12-v2',
+                'paraphrase-xlm-r-multilingual-v1',
+                'all-MiniLM-L6-v2',
+                'all-mpnet-base-v2'
+            ]
+            emb_dim = self.embedding_dim
+            for cand in candidate_models:
                 try:
-                    # Try to load the embedding model and verify vector dimension
-                    model = SentenceTransformer(model_name)
-                    sample_emb = model.encode(["__test__"], convert_to_numpy=True)
-                    model_dim = int(sample_emb.shape[1])
-                    emb_dim = int(self.embeddings.shape[1]) if len(self.embeddings.shape) > 1 else 0
-                    if model_dim == emb_dim:
-                        self.embedding_model = model
-                    else:
-                        print(
-                            f"Warning: embedding dimension mismatch: embeddings={emb_dim}, model={model_dim}."
-                            " Disabling embedding model and using keyword fallback."
-                        )
-                        self.embedding_model = None
-                except Exception as e:
-                    # If model loading or encoding fails, fall back to keyword search
-                    print(f"Warning: failed to initialize embedding model '{model_name}': {e}. Using keyword fallback.")
-                    self.embedding_model = None
-
-                # If embeddings loaded but model didn't match, attempt to auto-detect a compatible model
-                if self.embedding_model is None:
-                    # Candidate models to try (ordered by likelihood)
-                    candidate_models = [
-                        'distiluse-base-multilingual-cased-v2',
-                        'sentence-transformers/distiluse-base-multilingual-cased-v2',
-                        'paraphrase-multilingual-MiniLM-L12-v2',
-                        'paraphrase-xlm-r-multilingual-v1',
-                        'all-MiniLM-L6-v2',
-                        'all-mpnet-base-v2'
-                    ]
-                    emb_dim = int(self.embeddings.shape[1])
-                    for cand in candidate_models:
-                        try:
-                            cand_model = SentenceTransformer(cand)
-                            cand_emb = cand_model.encode(["__test__"], convert_to_numpy=True)
-                            cand_dim = int(cand_emb.shape[1])
-                            if cand_dim == emb_dim:
-                                self.embedding_model = cand_model
-                                self.model_name = cand
-                                print(f"Info: auto-detected compatible embedding model: {cand} (dim={cand_dim})")
-                                break
-                        except Exception:
-                            continue
-                    if self.embedding_model is None:
-                        print(f"Info: no compatible embedding model auto-detected for embedding dim={emb_dim}. Using keyword fallback.")
+                    cand_model = _load_sentence_model(cand, **self._model_options)
+                    cand_dim = _model_dimension(cand_model)
+                    if cand_dim == emb_dim:
+                        self.embedding_model = cand_model
+                        self.model_name = cand
+                        print(f"Info: auto-detected compatible embedding model: {cand} (dim={cand_dim})")
+                        break
+                except Exception:
+                    continue
+            if self.embedding_model is None:
+                print(f"Info: no compatible embedding model auto-detected for embedding dim={emb_dim}. Using keyword fallback.")
+    
+    def _build_index(self, embeddings_norm: np.ndarray):
+        """
+        Build the FAISS index for the configured backend.
+        
+        Args:
+            embeddings_norm: L2-normalized float32 catalog embeddings
+        
+        Returns:
+            FAISS index, or None to search with numpy
+        """
+        if self.backend == "numpy" or embeddings_norm.ndim != 2:
+            return None
+        if not HAS_FAISS:
+            print(f"Warning: faiss is not installed; using numpy instead of the '{self.backend}' backend.")
+            self.backend = "numpy"
+            return None
+        
+        dim = embeddings_norm.shape[1]
+        if self.backend == "faiss-hnsw":
+            index = faiss.IndexHNSWFlat(dim, HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexFlatIP(dim)
+        index.add(embeddings_norm)
+        return index
     
     def _load_catalog(self) -> List[Dict]:
         """Load catalog from JSON file."""
         if os.path.exists(self.catalog_path):
-            with open(self.catalog_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            catalog = load_json(self.catalog_path)
+            # Repeated attribute values ("cotton", "Casual", ...) share one string object
+            for item in catalog:
+                for field in INTERNED_FIELDS:
+                    value = item.get(field)
+                    if type(value) is str:
+                        item[field] = sys.intern(value)
+            return catalog
         else:
             raise FileNotFoundError(f"Catalog not found: {self.catalog_path}")
     
     def get_by_id(self, item_id: str) -> Optional[Dict]:
         """Get a single item by ID."""
-        for item in self.catalog:
-            if item.get("item_id") == item_id:
-                return item
-        return None
+        return self._id_index.get(item_id)
     
     def search_by_text(
         self,
@@ -237,34 +544,122 @@ class CatalogLoader:
         Returns:
             List of (item, similarity_score) tuples, sorted by similarity descending
         """
-        if not HAS_EMBEDDINGS or self.embeddings is None or self.embedding_model is None:
+        return self.search_by_texts([query], top_k=top_k, threshold=threshold)[0]
+    
+    def search_by_texts(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        threshold: float = 0.3,
+        batch_size: int = 64
+    ) -> List[List[Tuple[Dict, float]]]:
+        """
+        Search catalog for several text queries at once.
+        
+        All queries are embedded in one encode call and scored against the
+        catalog with a single matrix product.
+        
+        Args:
+            queries: Text queries
+            top_k: Number of results to return per query
+            threshold: Minimum similarity score (0-1)
+            batch_size: Encoder batch size
+        
+        Returns:
+            One list of (item, similarity_score) tuples per query, in query order
+        """
+        if not self._model_ready:
+            self._init_model()
+        if not HAS_EMBEDDINGS or self.embedding_dim is None or self.embedding_model is None:
             # Fallback: keyword-based search
-            return self._search_by_keyword(query, top_k)
+            return [self._search_by_keyword(query, top_k) for query in queries]
+        if not queries:
+            return []
+        
+        query_vecs = self._embed_queries(queries, batch_size)
+        
+        k = min(top_k, self.catalog_size)
+        if k <= 0:
+            return [[] for _ in queries]
         
-        # Embed the query
-        query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)
-        query_embedding = query_embedding.astype(np.float32)
-        query_embedding = query_embedding / (np.linalg.norm(query_embedding) + 1e-10)
+        if self._index is not None:
+            # FAISS returns the top-k inner products; unfilled slots have index -1
+            scores, indices = self._index.search(query_vecs, k)
+            tops = [
+                [(int(i), float(s)) for i, s in zip(row_idx, row_scores) if i >= 0]
+                for row_idx, row_scores in zip(indices, scores)
+            ]
+        else:
+            if self._emb_i8 is not None:
+                similarities = self._quantized_similarities(query_vecs)
+            elif HAS_SIMSIMD:
+                # SIMD cosine kernel; rows are unit length, so 1 - distance is the dot product
+                distances = simsimd.cdist(query_vecs, self._embeddings_norm, metric="cosine")
+                similarities = 1.0 - np.asarray(distances, dtype=np.float32)
+            else:
+                # Cosine similarities against the pre-normalized catalog embeddings, (Q, N)
+                similarities = query_vecs @ self._embeddings_norm.T
+            tops = [
+                [(int(i), float(row[i])) for i in _top_k_indices(row, k)]
+                for row in similarities
+            ]
         
-        # Normalize catalog embeddings
-        catalog_embeddings = self.embeddings.astype(np.float32)
-        for i in range(catalog_embeddings.shape[0]):
-            catalog_embeddings[i] = catalog_embeddings[i] / (np.linalg.norm(catalog_embeddings[i]) + 1e-10)
+        return [
+            [(self.catalog[idx], score) for idx, score in top if score >= threshold]
+            for top in tops
+        ]
+    
+    def _quantized_similarities(self, query_vecs: np.ndarray) -> np.ndarray:
+        """
+        Approximate cosine similarities against the int8 catalog, shape (Q, N).
         
-        # Compute cosine similarities
-        similarities = np.dot(catalog_embeddings, query_embedding.T).flatten()
+        Queries are quantized the same way as the catalog. The int8 rows are
+        widened to float32 one block at a time; integer dot products up to
+        127 * 127 * D stay exact in float32 for typical embedding sizes.
+        """
+        q_i8, q_scale = _quantize_rows(query_vecs)
+        q_t = q_i8.astype(np.float32).T
+        n = self._emb_i8.shape[0]
+        sims = np.empty((query_vecs.shape[0], n), dtype=np.float32)
+        for start in range(0, n, QUANTIZED_BLOCK_ROWS):
+            stop = min(start + QUANTIZED_BLOCK_ROWS, n)
+            sims[:, start:stop] = (self._emb_i8[start:stop].astype(np.float32) @ q_t).T
+        sims *= q_scale[:, None]
+        sims *= self._emb_scale[None, :]
+        return sims
+    
+    def _embed_queries(self, queries: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        L2-normalized float32 query embeddings, served from the LRU query cache.
         
-        # Get top-k results
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        Only queries missing from the cache are sent to the encoder, in one call.
         
-        results = []
-        for idx in top_indices:
-            score = float(similarities[idx])
-            if score >= threshold:
-                item = self.catalog[int(idx)]
-                results.append((item, score))
+        Args:
+            queries: Text queries
+            batch_size: Encoder batch size
         
-        return results
+        Returns:
+            Array of shape (len(queries), dim)
+        """
+        cache = self._query_cache
+        missing = list(dict.fromkeys(q for q in queries if q not in cache))
+        if missing:
+            vecs = self.embedding_model.encode(
+                missing, convert_to_numpy=True, batch_size=batch_size
+            ).astype(np.float32)
+            vecs /= np.sqrt(np.einsum("ij,ij->i", vecs, vecs))[:, None] + 1e-10
+            vecs.setflags(write=False)
+            for query, vec in zip(missing, vecs):
+                cache[query] = vec
+        
+        rows = []
+        for query in queries:
+            cache.move_to_end(query)
+            rows.append(cache[query])
+        result = np.stack(rows)
+        while len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
     
     def _search_by_keyword(
         self,
@@ -282,30 +677,28 @@ class CatalogLoader:
             List of (item, keyword_match_score) tuples
         """
         keywords = query.lower().split()
-        results = []
+        if not keywords:
+            return []
         
-        for item in self.catalog:
-            # Score based on keyword matches in title, description, color, material, style
-            score = 0
-            text_to_search = (
-                item.get("title", "").lower() + " " +
-                item.get("description", "").lower() + " " +
-                item.get("color", "").lower() + " " +
-                item.get("material", "").lower() + " " +
-                item.get("style", "").lower()
-            )
-            
-            for keyword in keywords:
-                if keyword in text_to_search:
-                    score += 1
-            
-            if score > 0:
-                normalized_score = min(score / len(keywords), 1.0)
-                results.append((item, normalized_score))
+        # Keywords hold no whitespace, so a substring hit in an item's text is
+        # always a substring hit in one of its tokens: resolve each keyword
+        # against the (small) vocabulary and count hits over posting lists.
+        match_counts = np.zeros(self.catalog_size, dtype=np.int64)
+        for keyword in keywords:
+            hits = [
+                postings for token, postings in self._postings.items()
+                if keyword in token
+            ]
+            if hits:
+                match_counts[np.unique(np.concatenate(hits))] += 1
         
-        # Sort by score descending and return top-k
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        results = [
+            (self.catalog[idx], min(int(match_counts[idx]) / len(keywords), 1.0))
+            for idx in np.flatnonzero(match_counts)
+        ]
+        
+        # Top-k by score descending (stable: ties keep catalog order)
+        return heapq.nlargest(top_k, results, key=lambda x: x[1])
     
     def search_by_attributes(
         self,
@@ -330,43 +723,34 @@ class CatalogLoader:
         Returns:
             List of matching items
         """
-        results = []
+        filters = {"color": color, "material": material, "style": style, "fit": fit, "category": category}
+        mask = np.ones(self.catalog_size, dtype=bool)
+        for field, value in filters.items():
+            if value:
+                mask &= self._attr_lc[field] == value.lower()
         
-        for item in self.catalog:
-            match = True
-            
-            if color and item.get("color", "").lower() != color.lower():
-                match = False
-            if material and item.get("material", "").lower() != material.lower():
-                match = False
-            if style and item.get("style", "").lower() != style.lower():
-                match = False
-            if fit and item.get("fit", "").lower() != fit.lower():
-                match = False
-            if category and item.get("category", "").lower() != category.lower():
-                match = False
-            
-            if match:
-                results.append(item)
-        
-        return results[:top_k]
+        return [self.catalog[i] for i in np.flatnonzero(mask)[:top_k]]
     
     def get_all(self) -> List[Dict]:
         """Get all items in catalog."""
         return self.catalog
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get catalog statistics."""
-        colors = set()
-        materials = set()
-        styles = set()
-        categories = set()
+    def get_stats(self, check_model: bool = False) -> Dict[str, Any]:
+        """
+        Get catalog statistics.
         
-        for item in self.catalog:
-            colors.add(item.get("color", ""))
-            materials.add(item.get("material", ""))
-            styles.add(item.get("style", ""))
-            categories.add(item.get("category", ""))
+        Args:
+            check_model: Load the query model now to verify it matches the
+                embeddings. Otherwise the model stays unloaded until the first
+                text search, and has_embeddings only reflects the embeddings file.
+        """
+        if check_model and not self._model_ready:
+            self._init_model()
+        # One C-level pass per column; dict keys keep first-seen order
+        colors = list(dict.fromkeys(self._columns["color"].tolist()))
+        materials = list(dict.fromkeys(self._columns["material"].tolist()))
+        styles = list(dict.fromkeys(self._columns["style"].tolist()))
+        categories = list(dict.fromkeys(self._columns["category"].tolist()))
         
         return {
             "total_items": self.catalog_size,
@@ -374,22 +758,25 @@ class CatalogLoader:
             "unique_materials": len(materials),
             "unique_styles": len(styles),
             "unique_categories": len(categories),
-            "colors": list(colors),
-            "materials": list(materials),
-            "styles": list(styles),
-            "categories": list(categories),
-            # True only if embeddings loaded AND the model is compatible
-            "has_embeddings": (self.embeddings is not None and self.embedding_model is not None),
+            "colors": colors,
+            "materials": materials,
+            "styles": styles,
+            "categories": categories,
+            # Embeddings loaded, and the model is compatible once it has been checked
+            "has_embeddings": (
+                self.embedding_dim is not None
+                and (self.embedding_model is not None or not self._model_ready)
+            ),
+            "model_checked": self._model_ready,
         }
 
 
 if __name__ == "__main__":
     # Example usage (when Step 1 data is available)
     try:
-        catalog = load_catalog_from_step1("outfit_descriptions.json")
-        standardized = convert_to_standard_format(catalog)
+        standardized = load_standardized_catalog("outfit_descriptions.json")
         save_standardized_catalog(standardized, "catalog_standardized.json")
-        print(f"✓ Loaded {len(catalog)} outfits from Step 1")
+        print(f"✓ Loaded {len(standardized)} outfits from Step 1")
         print(f"✓ Converted to {len(standardized)} standardized items")
     except FileNotFoundError:
         print("outfit_descriptions.json not found. Using synthetic data instead.")
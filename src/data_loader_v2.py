@@ -8,18 +8,44 @@ Architecture:
 - Provides hybrid search with fallback mechanisms
 """
 
-import json
 import os
+import threading
+from collections import OrderedDict
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from pathlib import Path
 
+from src.json_utils import load_json
+
 try:
     from sentence_transformers import SentenceTransformer
     HAS_SENTENCE_TRANSFORMERS = True
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
 
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+# search_by_attributes argument -> item field it matches
+ATTRIBUTE_FIELDS = {"color": "color_primary", "material": "material", "category": "category"}
+
+# Rows masked at a time by search_by_attributes before checking for top_k matches
+ATTRIBUTE_SCAN_BLOCK = 4096
+
+# Item fields searched by the keyword fallback
+KEYWORD_FIELDS = ("complete_description", "color_primary", "material", "style_aesthetic")
+
+# Normalized query embeddings kept per loader (LRU by query string)
+QUERY_CACHE_SIZE = 1024
+
+# Vector search backends: as in CatalogLoader (exact numpy matmul, exact FAISS
+# inner product, approximate FAISS HNSW), plus exact search on a CUDA GPU with torch
+SEARCH_BACKENDS = ("numpy", "faiss", "faiss-hnsw", "torch-cuda")
+HNSW_NEIGHBORS = 32
+
 
 class CatalogLoaderV2:
     """
@@ -37,7 +63,8 @@ class CatalogLoaderV2:
         descriptions_path: str = "src/outfit_descriptions.json",
         embeddings_path: Optional[str] = None,
         model_name: str = "all-MiniLM-L6-v2",
-        auto_detect_model: bool = True
+        auto_detect_model: bool = True,
+        backend: str = "numpy"
     ):
         """
         Initialize the catalog loader.
@@ -47,7 +74,13 @@ class CatalogLoaderV2:
             embeddings_path: Path to outfit_embeddings.npy from Part 1
             model_name: Sentence transformer model for encoding queries
             auto_detect_model: If True, try to auto-detect compatible model
+            backend: Vector search backend, one of SEARCH_BACKENDS. "faiss" and
+                "faiss-hnsw" need the faiss package, "torch-cuda" needs torch and
+                a CUDA device; each falls back to numpy without them.
         """
+        if backend not in SEARCH_BACKENDS:
+            raise ValueError(f"Unknown search backend: {backend!r} (expected one of {SEARCH_BACKENDS})")
+        self.backend = backend
         self.descriptions_path = descriptions_path
         self.embeddings_path = embeddings_path
         self.model_name = model_name
@@ -56,9 +89,59 @@ class CatalogLoaderV2:
         # Load catalog metadata
         self.catalog = self._load_descriptions()
         self.catalog_size = len(self.catalog)
+        self._catalog_values = list(self.catalog.values())
+        
+        # Lowercased attribute columns for vectorized attribute filtering
+        self._attr_columns: Dict[str, np.ndarray] = {
+            name: np.array([str(item_meta.get(field, "")).lower() for item_meta in self.catalog.values()], dtype=str)
+            for name, field in ATTRIBUTE_FIELDS.items()
+        }
+        
+        # Catalog position of each loaded item dict; _catalog_values keeps the
+        # dicts alive, so an id() here is never reused by another object
+        self._item_positions: Dict[int, int] = {
+            id(item_meta): idx for idx, item_meta in enumerate(self._catalog_values)
+        }
+        
+        # Per catalog position for filter_metadata: the raw (category, material)
+        # and their lowercased forms. The raw pair detects items edited in place.
+        self._lowered_attrs: List[Tuple[Any, Any, str, str]] = [
+            (item_meta.get("category", ""), item_meta.get("material", ""), cat, material)
+            for item_meta, cat, material in zip(
+                self._catalog_values,
+                self._attr_columns["category"].tolist(),
+                self._attr_columns["material"].tolist(),
+            )
+        ]
+        
+        # Lowercased text searched by the keyword fallback, one string per item
+        self._keyword_texts: List[str] = [
+            " ".join(str(item_meta.get(field, "")) for field in KEYWORD_FIELDS).lower()
+            for item_meta in self.catalog.values()
+        ]
+        
+        # Inverted index over the keyword text, flattened into arrays: the
+        # vocabulary, and one (token id, item index) entry per posting
+        postings: Dict[str, List[int]] = {}
+        for idx, text in enumerate(self._keyword_texts):
+            for token in set(text.split()):
+                postings.setdefault(token, []).append(idx)
+        self._vocab = np.array(list(postings), dtype=str)
+        self._posting_token_ids = np.repeat(
+            np.arange(len(postings), dtype=np.intp), [len(p) for p in postings.values()]
+        )
+        self._posting_items = np.array(
+            [idx for p in postings.values() for idx in p], dtype=np.intp
+        )
         
         # Load embeddings and model
         self.embeddings = None
+        self._embeddings_norm = None
+        self._mean_norm = None
+        self._faiss = None
+        self._emb_t = None
+        self._buffers = threading.local()
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         self.embedding_model = None
         self._load_embeddings_and_model()
     
@@ -67,8 +150,7 @@ class CatalogLoaderV2:
         if not os.path.exists(self.descriptions_path):
             raise FileNotFoundError(f"Descriptions not found: {self.descriptions_path}")
         
-        with open(self.descriptions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(self.descriptions_path)
         
         # If data is a list, convert to dict keyed by filename/item_id
         if isinstance(data, list):
@@ -82,12 +164,29 @@ class CatalogLoaderV2:
             return
         
         try:
-            self.embeddings = np.load(self.embeddings_path)
+            # Memory-mapped, so pages load on demand and are shared across processes;
+            # single precision, C order: BLAS takes the sgemv path and moves half
+            # the bytes of float64 (a float32 file stays mapped instead of copied)
+            self.embeddings = np.ascontiguousarray(
+                np.load(self.embeddings_path, mmap_mode="r"), dtype=np.float32
+            )
             print(f"Info: Loaded embeddings shape {self.embeddings.shape}")
         except Exception as e:
             print(f"Warning: Failed to load embeddings: {e}")
             return
         
+        # L2-normalize once so each query is a single matrix-vector product
+        norms = np.linalg.norm(self.embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        self._embeddings_norm = (self.embeddings / norms).astype(np.float32, copy=False)
+        # Mean of the unit vectors: q @ mean == mean of q's cosine to every item
+        self._mean_norm = self._embeddings_norm.mean(axis=0)
+        
+        if self.backend == "torch-cuda":
+            self._emb_t = self._to_gpu(self._embeddings_norm)
+        elif self.backend != "numpy":
+            self._faiss = self._build_index(self._embeddings_norm)
+        
         if not HAS_SENTENCE_TRANSFORMERS:
             print("Warning: sentence-transformers not installed. Using keyword-only search.")
             return
@@ -99,6 +198,49 @@ class CatalogLoaderV2:
         if self.embedding_model is None and self.auto_detect_model:
             self._auto_detect_model()
     
+    def _to_gpu(self, embeddings_norm: np.ndarray):
+        """
+        Copy the catalog to the GPU for the "torch-cuda" backend.
+        
+        Keeping it there means only the top-k indices come back to the host.
+        
+        Returns:
+            CUDA tensor, or None to search with numpy
+        """
+        try:
+            import torch
+            has_cuda = torch.cuda.is_available()
+        except ImportError:
+            has_cuda = False
+        if not has_cuda:
+            print("Warning: torch with CUDA is not available; using numpy instead of the 'torch-cuda' backend.")
+            self.backend = "numpy"
+            return None
+        return torch.from_numpy(embeddings_norm).to("cuda")
+    
+    def _build_index(self, embeddings_norm: np.ndarray):
+        """
+        Build the FAISS index for the configured backend.
+        
+        Args:
+            embeddings_norm: L2-normalized float32 catalog embeddings
+        
+        Returns:
+            FAISS index, or None to search with numpy
+        """
+        if not HAS_FAISS:
+            print(f"Warning: faiss is not installed; using numpy instead of the '{self.backend}' backend.")
+            self.backend = "numpy"
+            return None
+        
+        dim = embeddings_norm.shape[1]
+        if self.backend == "faiss-hnsw":
+            index = faiss.IndexHNSWFlat(dim, HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexFlatIP(dim)
+        index.add(embeddings_norm)
+        return index
+    
     def _try_load_model(self, model_name: str) -> bool:
         """Try to load a model and verify embedding dimension compatibility."""
         try:
@@ -160,6 +302,27 @@ class CatalogLoaderV2:
         else:
             return self._search_by_keyword(query, top_k)
     
+    def search_by_texts(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        threshold: float = 0.3
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Batched search_by_text: one encode call and one matrix product for all queries.
+        
+        Args:
+            queries: Text queries
+            top_k: Number of results to return per query
+            threshold: Minimum similarity score for embedding search
+        
+        Returns:
+            One list of (item_metadata, similarity_score) tuples per query
+        """
+        if self.embedding_model is not None and self.embeddings is not None:
+            return self._search_by_embeddings(queries, top_k, threshold)
+        return [self._search_by_keyword(query, top_k) for query in queries]
+    
     def _search_by_embedding(
         self,
         query: str,
@@ -167,28 +330,104 @@ class CatalogLoaderV2:
         threshold: float = 0.3
     ) -> List[Tuple[Dict[str, Any], float]]:
         """Semantic search using embeddings."""
-        # Encode query
-        query_emb = self.embedding_model.encode([query], convert_to_numpy=True)
-        query_emb = query_emb / (np.linalg.norm(query_emb, axis=1, keepdims=True) + 1e-10)
+        return self._search_by_embeddings([query], top_k, threshold)[0]
+    
+    def _search_by_embeddings(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        threshold: float = 0.3
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """Semantic search for a batch of queries (one row of results per query)."""
+        k = min(top_k, self._embeddings_norm.shape[0])
+        if not queries or k <= 0:
+            return [[] for _ in queries]
+        query_embs = self._encode_queries(queries)
         
-        # Normalize embeddings for cosine similarity
-        embeddings_norm = self.embeddings / (np.linalg.norm(self.embeddings, axis=1, keepdims=True) + 1e-10)
+        if self._emb_t is not None:
+            # GPU matmul + topk (best first); only k scores/indices per query cross to the host
+            import torch
+            query_t = torch.tensor(query_embs, device=self._emb_t.device)
+            scores, indices = torch.topk(query_t @ self._emb_t.T, k, dim=1)
+            tops = [list(zip(row_idx, row_scores)) for row_idx, row_scores in zip(indices.tolist(), scores.tolist())]
+        elif self._faiss is not None:
+            # FAISS inner-product search; results come back best first, -1 pads
+            scores, indices = self._faiss.search(query_embs, k)
+            tops = [
+                [(int(i), float(s)) for i, s in zip(row_idx, row_scores) if i >= 0]
+                for row_idx, row_scores in zip(indices, scores)
+            ]
+        elif len(queries) == 1:
+            # Cosine similarities against the pre-normalized catalog embeddings,
+            # written into a per-thread buffer reused across queries
+            similarities = self._scores_buffer()
+            np.matmul(self._embeddings_norm, query_embs[0], out=similarities)
+            
+            # Get top-k indices: O(N) partition, then sort only the k winners
+            part = np.argpartition(-similarities, k - 1)[:k]
+            top_indices = part[np.argsort(-similarities[part])]
+            tops = [[(int(idx), float(similarities[idx])) for idx in top_indices]]
+        else:
+            # One (Q, D) x (D, N) product, then a row-wise partition + sort of the k winners
+            similarities = query_embs @ self._embeddings_norm.T
+            part = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            part_scores = np.take_along_axis(similarities, part, axis=1)
+            order = np.argsort(-part_scores, axis=1)
+            top_indices = np.take_along_axis(part, order, axis=1)
+            top_scores = np.take_along_axis(part_scores, order, axis=1)
+            tops = [list(zip(row_idx, row_scores)) for row_idx, row_scores in zip(top_indices.tolist(), top_scores.tolist())]
         
-        # Compute similarities
-        similarities = np.dot(embeddings_norm, query_emb.T).flatten()
+        return [
+            [(self._catalog_values[idx], score) for idx, score in top if score >= threshold]
+            for top in tops
+        ]
+    
+    def mean_similarity(self, query: str) -> Optional[float]:
+        """
+        Average cosine similarity of a query to the whole catalog, in O(D).
         
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        Useful for drift / diversity checks. Returns None when embedding
+        search is unavailable.
+        """
+        if self.embedding_model is None or self._mean_norm is None:
+            return None
+        return float(self._encode_query(query)[0] @ self._mean_norm)
+    
+    def _scores_buffer(self) -> np.ndarray:
+        """Per-thread float32 buffer with one similarity slot per embedding row."""
+        buf = getattr(self._buffers, "scores", None)
+        if buf is None:
+            buf = np.empty(self._embeddings_norm.shape[0], dtype=np.float32)
+            self._buffers.scores = buf
+        return buf
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Normalized (1, D) float32 query embedding, cached per query string."""
+        return self._encode_queries([query])
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Normalized (Q, D) float32 query embeddings.
         
-        results = []
-        catalog_items = list(self.catalog.items())
-        for idx in top_indices:
-            score = float(similarities[idx])
-            if score >= threshold:
-                item_key, item_meta = catalog_items[int(idx)]
-                results.append((item_meta, score))
+        Served from the per-loader LRU cache; all misses are encoded in one call.
+        """
+        cache = self._query_cache
+        missing = list(dict.fromkeys(q for q in queries if q not in cache))
+        if missing:
+            embs = self.embedding_model.encode(
+                missing, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            embs.setflags(write=False)
+            for query, emb in zip(missing, embs):
+                cache[query] = emb
         
-        return results
+        rows = []
+        for query in queries:
+            cache.move_to_end(query)
+            rows.append(cache[query])
+        while len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return np.stack(rows)
     
     def _search_by_keyword(
         self,
@@ -197,25 +436,25 @@ class CatalogLoaderV2:
     ) -> List[Tuple[Dict[str, Any], float]]:
         """Keyword-based fallback search."""
         keywords = query.lower().split()
-        results = []
-        
-        for item_key, item_meta in self.catalog.items():
-            score = 0
-            text_to_search = (
-                str(item_meta.get("complete_description", "")).lower() + " " +
-                str(item_meta.get("color_primary", "")).lower() + " " +
-                str(item_meta.get("material", "")).lower() + " " +
-                str(item_meta.get("style_aesthetic", "")).lower()
-            )
-            
-            for keyword in keywords:
-                if keyword in text_to_search:
-                    score += 1
-            
-            if score > 0:
-                normalized_score = min(score / len(keywords), 1.0) if keywords else 0.0
-                results.append((item_meta, normalized_score))
+        if not keywords:
+            return []
         
+        # A keyword has no whitespace, so it occurs in an item's text exactly
+        # when it occurs in one of the item's tokens: substring-match it against
+        # the whole vocabulary in one vectorized call, then mark every item in
+        # the matching posting lists.
+        scores = np.zeros(self.catalog_size, dtype=np.int32)
+        item_hits = np.empty(self.catalog_size, dtype=bool)
+        for keyword in keywords:
+            token_hits = np.char.find(self._vocab, keyword) >= 0
+            item_hits.fill(False)
+            item_hits[self._posting_items[token_hits[self._posting_token_ids]]] = True
+            scores += item_hits
+        
+        results = [
+            (self._catalog_values[idx], min(int(scores[idx]) / len(keywords), 1.0))
+            for idx in np.flatnonzero(scores)
+        ]
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:top_k]
 
@@ -246,8 +485,15 @@ class CatalogLoaderV2:
         filtered = []
 
         for item, score in candidates:
-            cat = str(item.get("category", "")).lower()
-            material = str(item.get("material", "")).lower()
+            raw_cat = item.get("category", "")
+            raw_material = item.get("material", "")
+            idx = self._item_positions.get(id(item))
+            cached = self._lowered_attrs[idx] if idx is not None else None
+            if cached is not None and cached[0] == raw_cat and cached[1] == raw_material:
+                cat, material = cached[2], cached[3]
+            else:
+                cat = str(raw_cat).lower()
+                material = str(raw_material).lower()
 
             # Swimming occasion: only keep swimwear
             if "swim" in occ_type:
@@ -280,22 +526,21 @@ class CatalogLoaderV2:
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """Exact attribute matching."""
-        results = []
+        filters = {"color": color, "material": material, "category": category}
+        active = [(self._attr_columns[name], value.lower()) for name, value in filters.items() if value]
         
-        for item_key, item_meta in self.catalog.items():
-            match = True
-            
-            if color and str(item_meta.get("color_primary", "")).lower() != color.lower():
-                match = False
-            if material and str(item_meta.get("material", "")).lower() != material.lower():
-                match = False
-            if category and str(item_meta.get("category", "")).lower() != category.lower():
-                match = False
-            
-            if match:
-                results.append(item_meta)
+        # Mask the catalog block by block and stop once top_k matches are found
+        matches: List[int] = []
+        for start in range(0, self.catalog_size, ATTRIBUTE_SCAN_BLOCK):
+            stop = min(start + ATTRIBUTE_SCAN_BLOCK, self.catalog_size)
+            mask = np.ones(stop - start, dtype=bool)
+            for column, value in active:
+                mask &= column[start:stop] == value
+            matches.extend((np.flatnonzero(mask) + start).tolist())
+            if top_k > 0 and len(matches) >= top_k:
+                break
         
-        return results[:top_k]
+        return [self._catalog_values[idx] for idx in matches[:top_k]]
     
     def get_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
         """Get single item by ID."""
@@ -312,15 +557,20 @@ class CatalogLoaderV2:
         styles = set()
         categories = set()
         
+        # One lookup per field per item; empty values are not counted
         for item in self.catalog.values():
-            if item.get("color_primary"):
-                colors.add(item.get("color_primary"))
-            if item.get("material"):
-                materials.add(item.get("material"))
-            if item.get("style_aesthetic"):
-                styles.add(item.get("style_aesthetic"))
-            if item.get("category"):
-                categories.add(item.get("category"))
+            color = item.get("color_primary")
+            if color:
+                colors.add(color)
+            material = item.get("material")
+            if material:
+                materials.add(material)
+            style = item.get("style_aesthetic")
+            if style:
+                styles.add(style)
+            category = item.get("category")
+            if category:
+                categories.add(category)
         
         return {
             "total_items": self.catalog_size,
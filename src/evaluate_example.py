@@ -35,16 +35,15 @@ def example_offline_evaluation():
         for metric, value in query_metrics.items():
             print(f"  {metric}: {value:.4f}")
     
-    # Aggregate
-    agg = {}
-    for metric in results["per_query"][0].keys():
-        values = [q[metric] for q in results["per_query"]]
-        agg[metric] = {
-            "mean": np.mean(values),
-            "std": np.std(values),
-            "min": np.min(values),
-            "max": np.max(values),
-        }
+    # Aggregate: one (queries, metrics) array, reduced column-wise
+    metric_names = list(results["per_query"][0].keys())
+    values = np.array([[q[m] for m in metric_names] for q in results["per_query"]], dtype=np.float64)
+    means, stds = values.mean(axis=0), values.std(axis=0)
+    mins, maxs = values.min(axis=0), values.max(axis=0)
+    agg = {
+        metric: {"mean": means[j], "std": stds[j], "min": mins[j], "max": maxs[j]}
+        for j, metric in enumerate(metric_names)
+    }
     
     print("\n" + "-"*70)
     print("AGGREGATED METRICS:")
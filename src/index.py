@@ -1,4 +1,7 @@
+import contextlib
 import os
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
@@ -6,14 +9,42 @@ from typing import List, Dict
 
 MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Catalog encoding batch size; larger batches amortize per-batch overhead
+ENCODE_BATCH_SIZE = 256
 
-def build_item_embeddings(items: List[Dict], save_dir: str = "./data") -> None:
+# Normalized embeddings of recently embedded texts (LRU by text)
+QUERY_CACHE_SIZE = 1024
+_QUERY_CACHE: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+
+@lru_cache(maxsize=4)
+def _get_model(model_name: str = MODEL_NAME) -> SentenceTransformer:
+    """Load a SentenceTransformer once per process and reuse it."""
+    return SentenceTransformer(model_name)
+
+
+def build_item_embeddings(
+    items: List[Dict], save_dir: str = "./data", batch_size: int = ENCODE_BATCH_SIZE
+) -> None:
     os.makedirs(save_dir, exist_ok=True)
     texts = [f"{it['title']}. {it['description']}" for it in items]
-    model = SentenceTransformer(MODEL_NAME)
-    emb = model.encode(texts, show_progress_bar=True, convert_to_numpy=True)
-    # normalize for inner-product similarity
-    faiss.normalize_L2(emb)
+    model = _get_model()
+    precision = contextlib.nullcontext()
+    if str(model.device).startswith("cuda"):
+        # fp16 autocast for this encode only: roughly doubles GPU throughput
+        # without converting the shared cached model used by embed_texts
+        import torch
+        precision = torch.autocast(device_type="cuda", dtype=torch.float16)
+    # normalized inside encode for inner-product similarity
+    with precision:
+        emb = model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=True,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+    emb = np.ascontiguousarray(emb, dtype=np.float32)
     dim = emb.shape[1]
     index = faiss.IndexFlatIP(dim)
     index.add(emb)
@@ -26,10 +57,23 @@ def load_index(path: str = "./data/items.index"):
 
 
 def embed_texts(texts: List[str]):
-    model = SentenceTransformer(MODEL_NAME)
-    emb = model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
-    faiss.normalize_L2(emb)
-    return emb
+    """L2-normalized embeddings of texts; repeated texts are served from an LRU cache."""
+    if not texts:
+        return _get_model().encode(texts, show_progress_bar=False, convert_to_numpy=True)
+    missing = list(dict.fromkeys(t for t in texts if t not in _QUERY_CACHE))
+    if missing:
+        emb = _get_model().encode(
+            missing, show_progress_bar=False, convert_to_numpy=True, normalize_embeddings=True
+        )
+        for text, vec in zip(missing, emb):
+            _QUERY_CACHE[text] = vec
+    rows = []
+    for text in texts:
+        _QUERY_CACHE.move_to_end(text)
+        rows.append(_QUERY_CACHE[text])
+    while len(_QUERY_CACHE) > QUERY_CACHE_SIZE:
+        _QUERY_CACHE.popitem(last=False)
+    return np.stack(rows)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,267 @@ Data loader for integrating with Step 1 (Catalog Builder) output.
 Handles clothing metadata and embeddings from various sources.
 """
 
+import bisect
 import json
+import logging
+import mmap
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import Any, List, Dict, Iterator, Mapping, Optional, Sequence, Union
 import numpy as np
 
+from src.json_utils import HAS_ORJSON, dumps_pretty, load_json
+
+if HAS_ORJSON:
+    import orjson
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Parse errors raised by the JSON backends in use (orjson / json raise ValueError)
+_JSON_ERRORS = (ValueError, ijson.JSONError) if HAS_IJSON else (ValueError,)
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Loader status messages; silent unless the application configures logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Where BDA_Final_Project_114-1 may have written its Step 1 metadata
+_BDA_CANDIDATES = (
+    os.path.join("output", "metadata.json"),
+    os.path.join("results", "metadata.json"),
+    os.path.join("data", "processed", "metadata.json"),
+)
+
+# Seasonal color palette -> skin undertone (unknown palettes count as cool)
+_UNDERTONE_BY_PALETTE = {"autumn": "warm", "spring": "warm", "summer": "cool", "winter": "cool"}
+
+# Upper temperature bounds (inclusive, Celsius) of each season but the last
+_TEMP_BINS = (0, 10, 20)
+_SEASONS = ("winter", "fall", "spring", "summer")
+_TEMP_BINS_ARRAY = np.array(_TEMP_BINS, dtype=np.float64)
+_SEASON_NAMES = np.array(_SEASONS)
+
+# Preferences used by generate_context_input when the caller gives none
+_DEFAULT_COLORS = ("white", "navy", "beige")
+_DEFAULT_STYLES = ("casual", "smart-casual")
+_DEFAULT_DEMOGRAPHICS = MappingProxyType({"age": 28, "gender": "female"})
+
+# Low-cardinality item fields whose strings are interned on load
+INTERNED_FIELDS = ("role", "color", "style", "material", "season")
+
+# Worker threads used by load_from_image_folder(parallel=True)
+IMAGE_SCAN_WORKERS = 8
+
+# Item fields exposed as columns by ClothingDataLoader.load_columnar
+COLUMN_FIELDS = ("item_id", "title", "role", "color", "style", "material", "season")
+
+
+def _load_embeddings(path) -> np.ndarray:
+    """
+    Memory-map a .npy embeddings file (rows are paged in on demand).
+    
+    The result is a read-only view aliasing the file. Files that cannot be
+    mapped (e.g. pickled object arrays) are read into memory instead.
+    """
+    try:
+        return np.load(path, mmap_mode='r')
+    except FileNotFoundError:
+        raise
+    except (ValueError, OSError):
+        return np.load(path)
+
+
+def _cast_embeddings(embeddings: np.ndarray, dtype: Optional[str]):
+    """
+    Convert loaded embeddings to the storage type requested by the caller.
+    
+    Args:
+        embeddings: (N, d) embedding matrix as stored on disk
+        dtype: None (keep as stored), "float32", "float16" or "int8"
+    
+    Returns:
+        The converted matrix, or for "int8" a (codes, scales) pair with
+        embeddings ~= codes * scales[:, None]
+    """
+    if dtype is None:
+        return embeddings
+    if dtype in ("float32", "float16"):
+        return embeddings.astype(dtype, copy=False)
+    if dtype == "int8":
+        # Symmetric per-row quantization
+        scales = np.max(np.abs(embeddings), axis=1).astype(np.float32) / 127.0
+        scales = np.maximum(scales, 1e-12)
+        codes = np.rint(embeddings / scales[:, None]).astype(np.int8)
+        return codes, scales
+    raise ValueError(f"Unsupported embedding dtype: {dtype!r}")
+
+
+def _read_json(f, use_mmap: bool = False) -> object:
+    """
+    Parse JSON from an open binary file.
+    
+    With use_mmap the file is parsed from a read-only memory map instead of
+    a read() copy.
+    """
+    if use_mmap:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if HAS_ORJSON:
+                return orjson.loads(memoryview(buf))
+            return json.loads(buf[:])
+    data = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _check_json_syntax(f):
+    """
+    Fail fast on a malformed JSON file (given as an open binary file).
+    
+    With ijson installed the file is walked as a token stream without
+    building any Python objects; otherwise it is parsed and discarded.
+    
+    Raises:
+        ValueError: If the file is not well-formed JSON
+    """
+    try:
+        if HAS_IJSON:
+            for _ in ijson.parse(f):
+                pass
+        else:
+            _read_json(f)
+    except _JSON_ERRORS as e:
+        raise ValueError(f"Malformed JSON in {f.name}: {e}") from e
+
+
+def _iter_json_items(path) -> Iterator[Dict]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+    
+    Uses ijson's incremental parser when installed, so the whole item list is
+    never held in memory; otherwise parses the memory-mapped file in one go.
+    """
+    with open(path, 'rb') as f:
+        if HAS_IJSON:
+            yield from map(_intern_fields, ijson.items(f, 'item', use_float=True))
+        else:
+            yield from map(_intern_fields, _read_json(f, use_mmap=True))
+
+
+def _intern_fields(item):
+    """Intern the small-vocabulary string fields of an item, in place."""
+    if isinstance(item, dict):
+        for key in INTERNED_FIELDS:
+            value = item.get(key)
+            if type(value) is str:
+                item[key] = sys.intern(value)
+    return item
+
+
+def _file_names(entries: List[os.DirEntry]) -> List[str]:
+    """Names of the entries that are regular files (or links to them)."""
+    return [entry.name for entry in entries if entry.is_file()]
+
+
+def _file_names_parallel(entries: List[os.DirEntry], workers: int = IMAGE_SCAN_WORKERS) -> List[str]:
+    """
+    _file_names with the per-entry stat calls spread over a thread pool.
+    
+    Only pays off where stat() is slow (network mounts); on local disks
+    scandir already knows the entry types.
+    """
+    chunk = -(-len(entries) // workers)
+    shards = [entries[i:i + chunk] for i in range(0, len(entries), chunk)]
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        return list(chain.from_iterable(pool.map(_file_names, shards)))
+
+
+def items_to_columns(items: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of item dicts to a structure-of-arrays layout.
+    
+    String fields become object columns (missing values are None) and
+    "available" a bool column defaulting to True, so filters can be written
+    as vectorized comparisons, e.g.
+    (cols["color"] == "white") & (cols["style"] == "casual").
+    
+    Args:
+        items: Item dicts as returned by the ClothingDataLoader methods
+    
+    Returns:
+        Dict mapping field name to a length-N array
+    """
+    n = len(items)
+    columns = {
+        field: np.fromiter((item.get(field) for item in items), dtype=object, count=n)
+        for field in COLUMN_FIELDS
+    }
+    columns["available"] = np.fromiter(
+        (bool(item.get("available", True)) for item in items), dtype=bool, count=n
+    )
+    return columns
+
+
+@dataclass(slots=True)
+class ClothingItem:
+    """
+    Compact image-folder item (no per-instance __dict__).
+    
+    Attributes:
+        item_id: Sequential item identifier (item_0, item_1, ...)
+        image_url: Path to the image file
+        role/color/style/material: Filled in later (manually or by ML)
+        season: Default season
+        available: Whether the item can be recommended
+    
+    The title is derived from the file name the first time it is read.
+    """
+    item_id: str
+    image_url: str
+    role: str = "unknown"
+    color: str = "unknown"
+    style: str = "unknown"
+    material: str = "unknown"
+    season: str = "spring"
+    available: bool = True
+    _title: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def title(self) -> str:
+        """Title case file name stem, e.g. "white_shirt.jpg" -> "White Shirt"."""
+        if self._title is None:
+            stem = os.path.splitext(os.path.basename(self.image_url))[0]
+            self._title = stem.replace("_", " ").title()
+        return self._title
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Item dict in the format load_from_image_folder returns by default."""
+        return {
+            "item_id": self.item_id,
+            "title": self.title,
+            "image_url": self.image_url,
+            "role": self.role,
+            "color": self.color,
+            "style": self.style,
+            "material": self.material,
+            "season": self.season,
+            "available": self.available,
+        }
+
 
 class ClothingDataLoader:
     """Load clothing data from Step 1 Catalog Builder output."""
@@ -17,7 +272,10 @@ class ClothingDataLoader:
     def load_from_embedding_output(
         embedding_dir: str,
         metadata_file: str = "metadata.json",
-        embedding_file: str = "embeddings.npy"
+        embedding_file: str = "embeddings.npy",
+        mmap_metadata: bool = False,
+        dtype: Optional[str] = None,
+        validate_only: bool = False
     ) -> tuple[List[Dict], np.ndarray]:
         """
         Load clothing data from Step 1 output.
@@ -27,13 +285,124 @@ class ClothingDataLoader:
             ├── metadata.json (list of items with: id, title, color, style, material, season, image_url, etc.)
             └── embeddings.npy (shape: [num_items, embedding_dim])
         
+        Args:
+            embedding_dir: Directory containing Step 1 outputs
+            metadata_file: Name of metadata JSON file
+            embedding_file: Name of embeddings numpy file
+            mmap_metadata: Parse the metadata from a memory map of the file
+            dtype: Embedding storage type. None keeps the file's dtype;
+                "float16" halves the memory traffic of similarity search
+                (~0.5% recall loss on normalized embeddings); "int8" quarters
+                it (~1-2% recall loss) and returns (codes, per-row scales)
+            validate_only: Only check that both files exist and the metadata
+                is well-formed JSON, without loading anything
+        
+        Returns:
+            (items_list, embeddings_array). With dtype=None the embeddings are
+            a read-only memory map of the .npy file; copy them before modifying.
+            (None, None) if validate_only is set and the files are valid.
+        
+        Raises:
+            FileNotFoundError: If either file is missing
+            ValueError: If validate_only is set and the metadata is malformed
+        """
+        metadata_path = os.path.join(embedding_dir, metadata_file)
+        embedding_path = os.path.join(embedding_dir, embedding_file)
+        
+        # Open both files before parsing anything, so a missing embeddings
+        # file fails fast instead of after a full metadata parse
+        try:
+            f = open(metadata_path, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Metadata file not found: {metadata_path}") from None
+        with f:
+            try:
+                embeddings = _load_embeddings(embedding_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Embedding file not found: {embedding_path}") from None
+            
+            if validate_only:
+                _check_json_syntax(f)
+                return None, None
+            
+            items = _read_json(f, use_mmap=mmap_metadata)
+        
+        # Repeated values ("cotton", "casual", ...) share one string object
+        for item in items:
+            _intern_fields(item)
+        
+        log.info("✓ Loaded %d items with shape %s", len(items), embeddings.shape)
+        
+        return items, _cast_embeddings(embeddings, dtype)
+    
+    @staticmethod
+    def load_columnar(
+        embedding_dir: str,
+        metadata_file: str = "metadata.json",
+        embedding_file: str = "embeddings.npy"
+    ) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Load Step 1 outputs as columns instead of a list of dicts.
+        
         Args:
             embedding_dir: Directory containing Step 1 outputs
             metadata_file: Name of metadata JSON file
             embedding_file: Name of embeddings numpy file
         
         Returns:
-            (items_list, embeddings_array)
+            (columns, embeddings_array); see items_to_columns for the columns
+        """
+        items, embeddings = ClothingDataLoader.load_from_embedding_output(
+            embedding_dir, metadata_file, embedding_file
+        )
+        return items_to_columns(items), embeddings
+    
+    @staticmethod
+    def to_arrow(items: List[Dict], embeddings: np.ndarray) -> "pa.Table":
+        """
+        Wrap items and embeddings in an Arrow table without copying rows.
+        
+        The embedding column is a FixedSizeListArray over the flattened
+        float32 buffer, so exporting to Parquet / LanceDB / DuckDB is a
+        single buffer copy instead of N*d Python floats. The Arrow buffer
+        aliases the NumPy memory (unless a float32 contiguous copy had to be
+        made): keep `embeddings` alive and unmodified while the table is used.
+        
+        Args:
+            items: Item dicts, one per embedding row
+            embeddings: (N, d) embedding matrix
+        
+        Returns:
+            pyarrow.Table with "item_id" and "embedding" columns
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow package required: pip install pyarrow")
+        
+        flat = np.ascontiguousarray(embeddings, dtype=np.float32).ravel()
+        emb_col = pa.FixedSizeListArray.from_arrays(pa.array(flat, type=pa.float32()), embeddings.shape[1])
+        id_col = pa.array([item.get("item_id") for item in items], type=pa.string())
+        return pa.table({"item_id": id_col, "embedding": emb_col})
+    
+    @staticmethod
+    def load_from_embedding_output_stream(
+        embedding_dir: str,
+        metadata_file: str = "metadata.json",
+        embedding_file: str = "embeddings.npy"
+    ) -> tuple[Iterator[Dict], np.ndarray]:
+        """
+        Streaming variant of load_from_embedding_output for large catalogs.
+        
+        Items are parsed lazily as the iterator is consumed, so callers can
+        filter or downsample without materializing the full list.
+        
+        Args:
+            embedding_dir: Directory containing Step 1 outputs
+            metadata_file: Name of metadata JSON file
+            embedding_file: Name of embeddings numpy file
+        
+        Returns:
+            (items_iterator, embeddings_array). The embeddings are a read-only
+            memory map of the .npy file.
         """
         metadata_path = os.path.join(embedding_dir, metadata_file)
         embedding_path = os.path.join(embedding_dir, embedding_file)
@@ -43,21 +412,16 @@ class ClothingDataLoader:
         if not os.path.exists(embedding_path):
             raise FileNotFoundError(f"Embedding file not found: {embedding_path}")
         
-        # Load metadata
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            items = json.load(f)
-        
-        # Load embeddings
-        embeddings = np.load(embedding_path)
-        
-        print(f"✓ Loaded {len(items)} items with shape {embeddings.shape}")
-        return items, embeddings
+        return _iter_json_items(metadata_path), _load_embeddings(embedding_path)
     
     @staticmethod
     def load_from_image_folder(
         image_folder: str,
-        auto_extract_metadata: bool = True
-    ) -> List[Dict]:
+        auto_extract_metadata: bool = True,
+        presorted: bool = False,
+        as_objects: bool = False,
+        parallel: bool = False
+    ) -> List[Union[Dict, ClothingItem]]:
         """
         Load clothing items from image folder (JPG).
         Auto-generates metadata from filename or manual entry.
@@ -71,21 +435,51 @@ class ClothingDataLoader:
         Args:
             image_folder: Path to folder containing JPG images
             auto_extract_metadata: Extract color/style from filename
+            presorted: The folder lists its entries in name order already
+                (e.g. an object-store mount), so skip sorting them
+            as_objects: Return slotted ClothingItem objects (lazy title,
+                no per-item dict) instead of dicts
+            parallel: Check the directory entries from a thread pool, hiding
+                per-file stat latency on network-mounted folders
         
         Returns:
             List of items with image_url, title, etc.
         """
         items = []
-        image_files = list(Path(image_folder).glob("*.jpg")) + \
-                     list(Path(image_folder).glob("*.jpeg"))
+        candidates = []
+        try:
+            with os.scandir(image_folder) as it:
+                candidates = [entry for entry in it if entry.name.endswith((".jpg", ".jpeg"))]
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        
+        if parallel and len(candidates) > 1:
+            image_files = _file_names_parallel(candidates)
+        else:
+            image_files = _file_names(candidates)
+        if not presorted:
+            image_files.sort()
+        
+        # Keep image_url in the normalized form pathlib produced
+        folder = str(Path(image_folder))
+        if folder == ".":
+            folder = ""
+        
+        if as_objects:
+            items = [
+                ClothingItem(f"item_{idx}", os.path.join(folder, name))
+                for idx, name in enumerate(image_files)
+            ]
+            log.info("✓ Loaded %d items from %s", len(items), image_folder)
+            return items
         
-        for idx, img_path in enumerate(sorted(image_files)):
-            filename = img_path.stem
+        for idx, name in enumerate(image_files):
+            filename = os.path.splitext(name)[0]
             
             item = {
                 "item_id": f"item_{idx}",
                 "title": filename.replace("_", " ").title(),
-                "image_url": str(img_path),
+                "image_url": os.path.join(folder, name),
                 "role": "unknown",  # Will be filled manually or by ML
                 "color": "unknown",
                 "style": "unknown",
@@ -95,51 +489,55 @@ class ClothingDataLoader:
             }
             items.append(item)
         
-        print(f"✓ Loaded {len(items)} items from {image_folder}")
+        log.info("✓ Loaded %d items from %s", len(items), image_folder)
         return items
     
     @staticmethod
     def load_from_bda_project(
-        repo_path: str = "../../BDA_Final_Project_114-1"
+        repo_path: str = "../../BDA_Final_Project_114-1",
+        validate_only: bool = False
     ) -> tuple[List[Dict], Optional[np.ndarray]]:
         """
         Load clothing data directly from BDA Final Project repo.
         
         Args:
             repo_path: Path to BDA_Final_Project_114-1 folder
+            validate_only: Only check that the metadata found is well-formed
+                JSON (raises ValueError otherwise), without loading anything
         
         Returns:
-            (items_list, embeddings_array or None)
+            (items_list, embeddings_array or None); embeddings are a read-only
+            memory map of the .npy file. (None, None) if validate_only is set
+            and the metadata is valid.
         """
-        bda_path = Path(repo_path)
-        
         # Try to find output folder
-        possible_paths = [
-            bda_path / "output" / "metadata.json",
-            bda_path / "results" / "metadata.json",
-            bda_path / "data" / "processed" / "metadata.json",
-        ]
-        
         metadata_path = None
-        for p in possible_paths:
-            if p.exists():
+        for rel in _BDA_CANDIDATES:
+            p = os.path.join(repo_path, rel)
+            if os.path.isfile(p):
                 metadata_path = p
                 break
         
         if not metadata_path:
-            print("⚠️  Could not find BDA project metadata. Using manual loader.")
+            log.warning("⚠️  Could not find BDA project metadata. Using manual loader.")
             return [], None
         
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            items = json.load(f)
+        if validate_only:
+            with open(metadata_path, 'rb') as f:
+                _check_json_syntax(f)
+            return None, None
+        
+        items = load_json(metadata_path)
+        for item in items:
+            _intern_fields(item)
         
         # Try to load embeddings
-        embedding_path = metadata_path.parent / "embeddings.npy"
+        embedding_path = os.path.join(os.path.dirname(metadata_path), "embeddings.npy")
         embeddings = None
-        if embedding_path.exists():
-            embeddings = np.load(embedding_path)
+        if os.path.isfile(embedding_path):
+            embeddings = _load_embeddings(embedding_path)
         
-        print(f"✓ Loaded {len(items)} items from BDA project")
+        log.info("✓ Loaded %d items from BDA project", len(items))
         return items, embeddings
 
 
@@ -164,7 +562,7 @@ class Step15InputBuilder:
         return {
             "dominant_colors": dominant_colors,
             "seasonal_palette": seasonal_palette,
-            "undertone": "warm" if seasonal_palette in ["autumn", "spring"] else "cool",
+            "undertone": _UNDERTONE_BY_PALETTE.get(seasonal_palette, "cool"),
             "contrast_level": "medium",
         }
     
@@ -199,16 +597,78 @@ class Step15InputBuilder:
         Returns:
             Complete context dict for Step 3 (Outfit Planner)
         """
+        return Step15InputBuilder._build_context(
+            user_id, date_time, location, temp_c, humidity, condition, occasion,
+            activities, color_preferences, style_preferences,
+            Step15InputBuilder._infer_season(temp_c),
+        )
+    
+    @staticmethod
+    def generate_context_input_batch(
+        rows: Union[Mapping[str, Sequence], "pd.DataFrame"]
+    ) -> List[Dict]:
+        """
+        Generate Step 1.5 context inputs for many (user, time) pairs at once.
+        
+        Seasons are inferred for the whole temperature column in one
+        vectorized pass; the result equals calling generate_context_input
+        once per row.
+        
+        Args:
+            rows: pandas DataFrame or dict of equal-length columns with the
+                generate_context_input arguments as column names. The
+                activities / color_preferences / style_preferences columns
+                are optional; None entries get the usual defaults.
+        
+        Returns:
+            List of context dicts, one per row
+        """
+        def column(name, required=True):
+            if not required and name not in rows:
+                return None
+            values = rows[name]
+            return values.tolist() if hasattr(values, "tolist") else list(values)
+        
+        temps = column("temp_c")
+        seasons = Step15InputBuilder._infer_seasons(temps).tolist()
+        n = len(temps)
+        optional = [column(name, required=False) or [None] * n
+                    for name in ("activities", "color_preferences", "style_preferences")]
+        
+        return [
+            Step15InputBuilder._build_context(*args)
+            for args in zip(
+                column("user_id"), column("date_time"), column("location"), temps,
+                column("humidity"), column("condition"), column("occasion"),
+                *optional, seasons,
+            )
+        ]
+    
+    @staticmethod
+    def _build_context(
+        user_id: str,
+        date_time: str,
+        location: str,
+        temp_c: int,
+        humidity: int,
+        condition: str,
+        occasion: List[str],
+        activities: Optional[List[Dict]],
+        color_preferences: Optional[List[str]],
+        style_preferences: Optional[List[str]],
+        seasonal_palette: str,
+    ) -> Dict:
+        """Assemble one context dict (shared by the scalar and batch builders)."""
         if activities is None:
             activities = [
                 {"time": "09:00", "activity": occasion[0] if occasion else "casual", "location": location}
             ]
         
         if color_preferences is None:
-            color_preferences = ["white", "navy", "beige"]
+            color_preferences = list(_DEFAULT_COLORS)
         
         if style_preferences is None:
-            style_preferences = ["casual", "smart-casual"]
+            style_preferences = list(_DEFAULT_STYLES)
         
         return {
             "user_id": user_id,
@@ -229,26 +689,34 @@ class Step15InputBuilder:
             "itinerary": activities,
             "palette_analysis": {
                 "dominant_colors": color_preferences,
-                "seasonal_palette": Step15InputBuilder._infer_season(temp_c),
-            },
-            "demographics": {
-                "age": 28,
-                "gender": "female",
+                "seasonal_palette": seasonal_palette,
             },
+            "demographics": dict(_DEFAULT_DEMOGRAPHICS),
             "last_worn_history": [],
         }
     
     @staticmethod
     def _infer_season(temp_c: int) -> str:
         """Infer season from temperature."""
-        if temp_c <= 0:
-            return "winter"
-        elif temp_c <= 10:
-            return "fall"
-        elif temp_c <= 20:
-            return "spring"
-        else:
-            return "summer"
+        if temp_c != temp_c:
+            # NaN fails every "<= bin" test, so it falls through to summer
+            # (as in _infer_seasons, where searchsorted sorts NaN last)
+            return _SEASONS[-1]
+        return _SEASONS[bisect.bisect_left(_TEMP_BINS, temp_c)]
+    
+    @staticmethod
+    def _infer_seasons(temps) -> np.ndarray:
+        """
+        Vectorized _infer_season for a batch of temperatures.
+        
+        Args:
+            temps: Sequence or array of temperatures in Celsius
+        
+        Returns:
+            Array of season names, one per temperature
+        """
+        codes = np.searchsorted(_TEMP_BINS_ARRAY, np.asarray(temps, dtype=np.float64), side='left')
+        return _SEASON_NAMES[codes]
 
 
 def example_integration():
@@ -314,12 +782,12 @@ def example_integration():
     )
     
     print("\n✓ Generated context input:")
-    print(json.dumps({
+    print(dumps_pretty({
         "user_id": context["user_id"],
         "weather": context["weather"],
         "occasion": context["occasion"],
         "preferences": context["preferences"],
-    }, indent=2, ensure_ascii=False))
+    }).decode("utf-8"))
     
     print("\n" + "="*70)
     print("FLOW: Items (Step 1) → Context (Step 1.5) → Recommendations (Step 3)")
@@ -327,4 +795,5 @@ def example_integration():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     example_integration()
@@ -9,7 +9,6 @@ This demonstrates the complete data flow:
 Example outputs are saved to files for inspection.
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, Any
@@ -17,6 +16,7 @@ from typing import Dict, Any
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.json_utils import dumps_pretty
 from src.mock_context import get_beach_wedding_context, get_office_meeting_context, select_context
 from src.data_loader import CatalogLoader
 from src.recommend_interface import OutfitRecommender, RecommendationOutput
@@ -34,18 +34,20 @@ def demonstrate_input_formats():
     
     print("\n📋 Beach Wedding Context (Example 1):")
     context1 = get_beach_wedding_context()
-    print(json.dumps(context1, ensure_ascii=False, indent=2))
+    context1_json = dumps_pretty(context1)
+    print(context1_json.decode("utf-8"))
     
     print("\n📋 Office Meeting Context (Example 2):")
     context2 = get_office_meeting_context()
-    print(json.dumps(context2, ensure_ascii=False, indent=2))
+    context2_json = dumps_pretty(context2)
+    print(context2_json.decode("utf-8"))
     
-    # Save for reference
-    with open("context_example_beach.json", "w", encoding="utf-8") as f:
-        json.dump(context1, f, ensure_ascii=False, indent=2)
+    # Save for reference (same bytes as printed above)
+    with open("context_example_beach.json", "wb") as f:
+        f.write(context1_json)
     
-    with open("context_example_office.json", "w", encoding="utf-8") as f:
-        json.dump(context2, f, ensure_ascii=False, indent=2)
+    with open("context_example_office.json", "wb") as f:
+        f.write(context2_json)
     
     print("\n✓ Context examples saved to context_example_*.json")
     return context1, context2
@@ -140,7 +142,7 @@ def demonstrate_output_formats(output: RecommendationOutput):
     output_dict = output.to_dict()
     
     print("\n📤 Complete Recommendation Output (JSON):")
-    print(json.dumps(output_dict, ensure_ascii=False, indent=2))
+    print(dumps_pretty(output_dict).decode("utf-8"))
     
     # Highlight key fields
     print(f"\n🔑 Key Fields for Person 4:")
@@ -189,14 +191,14 @@ def save_complete_example():
         }
     
     # Save complete example
-    with open("complete_example_input_output.json", "w", encoding="utf-8") as f:
+    with open("complete_example_input_output.json", "wb") as f:
         complete_example = {
             "scenario": "beach_wedding",
             "input_context": context,
             "output_recommendation": output_dict,
             "description": "Complete example of input from Person 2 and output for Person 4"
         }
-        json.dump(complete_example, f, ensure_ascii=False, indent=2)
+        f.write(dumps_pretty(complete_example))
     
     print(f"\n✓ Complete example saved to complete_example_input_output.json")
     return output_dict
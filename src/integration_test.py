@@ -10,21 +10,68 @@ This script shows:
 4. Format output for Step 4 (virtual try-on)
 """
 
-import json
+import hashlib
+import os
+import random
 import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data import generate_items, generate_context
-from src.data_loader import load_catalog_from_step1, convert_to_standard_format, save_standardized_catalog
+from src.data_loader import load_standardized_catalog, save_standardized_catalog
+from src.json_utils import canonical_json, dump_json, dump_ndjson, load_json
 from src.recommend import recommend
 from src.context_generator import generate_step15_context
 from src.schemas import validate_schema
 
 
+# Recommendation cache size limit; least recently used entries are evicted
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Seed for fallback recommendations when no generator is passed in
+FALLBACK_SEED = 42
+
+
+def _causal_key(
+    items: List[Dict],
+    context: Dict,
+    index_path: str,
+    model_path: str,
+    top_n: int,
+    compiled_model_path: Optional[str] = None
+) -> str:
+    """
+    Hash of everything the Step 3 recommendation depends on.
+    
+    Includes which scorer runs (joblib model or compiled library) and the
+    mtime of each file involved. The context's date_time is left out:
+    recommend() only copies it into the output timestamp, which is
+    refreshed on a cache hit instead.
+    """
+    h = hashlib.sha256()
+    h.update(canonical_json(items))
+    h.update(canonical_json({k: v for k, v in context.items() if k != "date_time"}))
+    for path in (index_path, model_path, compiled_model_path):
+        mtime = os.path.getmtime(path) if path and os.path.exists(path) else None
+        h.update(f"{path}:{mtime};".encode())
+    h.update(str(top_n).encode())
+    return h.hexdigest()
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int = CACHE_MAX_BYTES):
+    """Delete least recently used cache entries until the total fits max_bytes."""
+    entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    for path in entries:
+        if total <= max_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink()
+
+
 def load_or_create_step1_catalog(step1_json_path: str = None) -> List[Dict]:
     """
     Load Step 1 catalog or use synthetic data.
@@ -37,8 +84,7 @@ def load_or_create_step1_catalog(step1_json_path: str = None) -> List[Dict]:
     """
     if step1_json_path and Path(step1_json_path).exists():
         print(f"📦 Loading Step 1 catalog from {step1_json_path}")
-        catalog = load_catalog_from_step1(step1_json_path)
-        standardized = convert_to_standard_format(catalog)
+        standardized = load_standardized_catalog(step1_json_path)
         print(f"   ✓ Loaded {len(standardized)} items from Step 1")
         return standardized
     else:
@@ -58,32 +104,34 @@ def format_for_step4(recommendations: List[Dict]) -> Dict[str, Any]:
     Returns:
         JSON structure for Step 4 API
     """
+    timestamp = recommendations[0].get("timestamp", "")
+    recs = recommendations[:3]
+    
+    # Pull each field out as a column once, then zip the columns into rows
+    scores = [rec["score"] for rec in recs]
+    confidences = [rec.get("confidence", score) for rec, score in zip(recs, scores)]
+    item_ids = [(rec["top_id"], rec["bottom_id"], rec["shoes_id"]) for rec in recs]
+    colors = [rec["colors"] if "colors" in rec else {"primary": "n/a", "secondary": "n/a"} for rec in recs]
+    explanations = [rec.get("explanation", "") for rec in recs]
+    accessories = [rec["accessories_suggestions"] if "accessories_suggestions" in rec else [] for rec in recs]
+    metadata = [(rec.get("style", ""), rec.get("occasion", ""), rec.get("weather_suitability", "")) for rec in recs]
+    
     return {
         "status": "success",
-        "timestamp": recommendations[0].get("timestamp", ""),
+        "timestamp": timestamp,
         "recommended_outfits": [
             {
-                "rank": i + 1,
-                "score": rec["score"],
-                "confidence": rec.get("confidence", rec["score"]),
-                "items": {
-                    "top": rec["top_id"],
-                    "bottom": rec["bottom_id"],
-                    "shoes": rec["shoes_id"],
-                },
-                "colors": rec.get("colors", {
-                    "primary": "n/a",
-                    "secondary": "n/a"
-                }),
-                "explanation": rec.get("explanation", ""),
-                "accessories": rec.get("accessories_suggestions", []),
-                "metadata": {
-                    "style": rec.get("style", ""),
-                    "occasion_fit": rec.get("occasion", ""),
-                    "weather_fit": rec.get("weather_suitability", ""),
-                }
+                "rank": rank,
+                "score": score,
+                "confidence": confidence,
+                "items": {"top": top, "bottom": bottom, "shoes": shoes_id},
+                "colors": color,
+                "explanation": explanation,
+                "accessories": accessory,
+                "metadata": {"style": style, "occasion_fit": occasion, "weather_fit": weather},
             }
-            for i, rec in enumerate(recommendations[:3])
+            for rank, score, confidence, (top, bottom, shoes_id), color, explanation, accessory, (style, occasion, weather)
+            in zip(range(1, len(recs) + 1), scores, confidences, item_ids, colors, explanations, accessories, metadata)
         ],
         "next_steps": [
             "1. User selects outfit from top 3",
@@ -97,7 +145,10 @@ def format_for_step4(recommendations: List[Dict]) -> Dict[str, Any]:
 def run_integration_test(
     step1_path: str = None,
     use_llm: bool = False,
-    output_file: str = "integration_test_output.json"
+    output_file: str = "integration_test_output.json",
+    cache_dir: Optional[str] = None,
+    use_treelite: bool = False,
+    ndjson: bool = False
 ):
     """
     Execute end-to-end integration test.
@@ -106,6 +157,13 @@ def run_integration_test(
         step1_path: Path to Step 1 outfit_descriptions.json
         use_llm: Whether to use LLM for explanations
         output_file: Output JSON filename
+        cache_dir: Reuse Step 3 results from this directory when the catalog,
+            context, index and model are unchanged (ignored with use_llm,
+            whose explanations are not deterministic)
+        use_treelite: Compile the LightGBM model to a native library
+            (model.so) and score with it
+        ndjson: Save the catalog as catalog_for_step3.jsonl, one item per
+            line, so Step 3 can read it without parsing one large document
     """
     
     print("\n" + "=" * 80)
@@ -117,9 +175,12 @@ def run_integration_test(
     items = load_or_create_step1_catalog(step1_path)
     
     # Save catalog for Step 3
-    catalog_path = "catalog_for_step3.json"
-    with open(catalog_path, "w", encoding="utf-8") as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    if ndjson:
+        catalog_path = "catalog_for_step3.jsonl"
+        dump_ndjson(catalog_path, items)
+    else:
+        catalog_path = "catalog_for_step3.json"
+        dump_json(catalog_path, items)
     print(f"   ✓ Saved to {catalog_path}")
     
     # ========== STEP 1.5: Generate Context ==========
@@ -140,8 +201,7 @@ def run_integration_test(
     )
     
     context_path = "context_for_step3.json"
-    with open(context_path, "w", encoding="utf-8") as f:
-        json.dump(context1, f, ensure_ascii=False, indent=2)
+    dump_json(context_path, context1)
     
     print(f"   User: {context1['user_id']}")
     print(f"   Occasion: {', '.join(context1['occasion'])}")
@@ -173,15 +233,36 @@ def run_integration_test(
                 model_path=model_path
             )
         
-        # Run recommendation
-        recommendations = recommend(
-            context_path=context_path,
-            items_path=catalog_path,
-            index_path=index_path,
-            model_path=model_path,
-            top_n=3,
-            use_llm=use_llm
-        )
+        compiled_model_path = None
+        if use_treelite:
+            from src.recommend import compile_model
+            compiled_model_path = compile_model(model_path, "model.so")
+        
+        # Run recommendation (or reuse a cached result for identical inputs)
+        cache_path = None
+        if cache_dir and not use_llm:
+            cache_path = Path(cache_dir) / f"{_causal_key(items, context1, index_path, model_path, 3, compiled_model_path)}.json"
+        
+        if cache_path is not None and cache_path.exists():
+            recommendations = load_json(cache_path)
+            if isinstance(recommendations, dict) and "timestamp" in recommendations:
+                recommendations["timestamp"] = context1["date_time"]
+            os.utime(cache_path)
+            print(f"   ✓ Reused cached recommendations ({cache_path.name[:12]})")
+        else:
+            recommendations = recommend(
+                context_path=context_path,
+                items_path=catalog_path,
+                index_path=index_path,
+                model_path=model_path,
+                top_n=3,
+                use_llm=use_llm,
+                compiled_model_path=compiled_model_path
+            )
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                dump_json(cache_path, recommendations)
+                _evict_cache(cache_path.parent)
         
         print(f"   ✓ Generated {len(recommendations)} recommendations")
         for rec in recommendations:
@@ -198,8 +279,7 @@ def run_integration_test(
     
     step4_output = format_for_step4(recommendations)
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(step4_output, f, ensure_ascii=False, indent=2)
+    dump_json(output_file, step4_output)
     
     print(f"   ✓ Generated {len(step4_output['recommended_outfits'])} outfit options")
     print(f"   ✓ Saved to {output_file}")
@@ -240,26 +320,49 @@ def run_integration_test(
     }
 
 
-def generate_fallback_recommendations(items: List[Dict], top_n: int = 3) -> List[Dict]:
+def generate_fallback_recommendations(
+    items: List[Dict],
+    top_n: int = 3,
+    rng: Optional[random.Random] = None
+) -> List[Dict]:
     """
     Generate fallback recommendations if main pipeline fails.
+    
+    Args:
+        items: Catalog items
+        top_n: Number of recommendations (at most 3)
+        rng: Random generator for the picks; defaults to one seeded with
+            FALLBACK_SEED, so the output is reproducible for a given catalog
     """
-    import random
+    if rng is None:
+        rng = random.Random(FALLBACK_SEED)
+    
+    # Partition by role in one pass; empty roles fall back to a placeholder
+    by_role = {"top": [], "bottom": [], "shoes": []}
+    for item in items:
+        bucket = by_role.get(item.get("role"))
+        if bucket is not None:
+            bucket.append(item)
+    tops = by_role["top"] or [{"id": "top_01"}]
+    bottoms = by_role["bottom"] or [{"id": "bottom_01"}]
+    shoes = by_role["shoes"] or [{"id": "shoes_01"}]
     
-    tops = [i for i in items if i.get("role") == "top"]
-    bottoms = [i for i in items if i.get("role") == "bottom"]
-    shoes = [i for i in items if i.get("role") == "shoes"]
+    # One draw per role per rank, so "top"/"top_id" and "bottom"/"bottom_id" agree
+    n = min(top_n, 3)
+    picks = zip(rng.choices(tops, k=n), rng.choices(bottoms, k=n), rng.choices(shoes, k=n))
     
     recommendations = []
-    for rank in range(min(top_n, 3)):
+    for rank, (top, bottom, shoe) in enumerate(picks):
+        top_id = top.get("id", "top_01")
+        bottom_id = bottom.get("id", "bottom_01")
         rec = {
             "rank": rank + 1,
             "score": 0.7 - rank * 0.05,
-            "top": random.choice(tops).get("id", "top_01") if tops else "top_01",
-            "top_id": random.choice(tops).get("id", "top_01") if tops else "top_01",
-            "bottom": random.choice(bottoms).get("id", "bottom_01") if bottoms else "bottom_01",
-            "bottom_id": random.choice(bottoms).get("id", "bottom_01") if bottoms else "bottom_01",
-            "shoes_id": random.choice(shoes).get("id", "shoes_01") if shoes else "shoes_01",
+            "top": top_id,
+            "top_id": top_id,
+            "bottom": bottom_id,
+            "bottom_id": bottom_id,
+            "shoes_id": shoe.get("id", "shoes_01"),
             "explanation": f"Fallback recommendation #{rank + 1}",
             "timestamp": "2025-01-01T00:00:00",
             "colors": {"primary": "gray", "secondary": "white"}
@@ -276,11 +379,17 @@ if __name__ == "__main__":
     parser.add_argument("--step1-path", help="Path to Step 1 outfit_descriptions.json")
     parser.add_argument("--with-llm", action="store_true", help="Use LLM for explanations")
     parser.add_argument("--output", default="integration_test_output.json", help="Output file")
+    parser.add_argument("--cache-dir", help="Reuse Step 3 results cached in this directory")
+    parser.add_argument("--treelite", action="store_true", help="Score with a Treelite-compiled model")
+    parser.add_argument("--ndjson", action="store_true", help="Save the Step 1 catalog as NDJSON")
     
     args = parser.parse_args()
     
     result = run_integration_test(
         step1_path=args.step1_path,
         use_llm=args.with_llm,
-        output_file=args.output
+        output_file=args.output,
+        cache_dir=args.cache_dir,
+        use_treelite=args.treelite,
+        ndjson=args.ndjson
     )
@@ -0,0 +1,112 @@
+"""
+JSON helpers shared by the data generators and integration scripts.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable, Iterator, List
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize to indented UTF-8 JSON bytes.
+    
+    Equivalent to json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8").
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dump_json(path: str, obj: Any):
+    """Write obj to path as indented UTF-8 JSON."""
+    with open(path, "wb") as f:
+        f.write(dumps_pretty(obj))
+
+
+def load_json(path: str) -> Any:
+    """Read and parse a UTF-8 JSON file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_ndjson(path: str, items: Iterable[Any]):
+    """Write each item as one compact JSON line (NDJSON)."""
+    with open(path, "wb") as f:
+        if HAS_ORJSON:
+            f.writelines(orjson.dumps(item) + b"\n" for item in items)
+        else:
+            f.writelines(
+                json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+                for item in items
+            )
+
+
+def iter_ndjson(path: str) -> Iterator[Any]:
+    """Yield the items of an NDJSON file one line at a time, skipping blank lines."""
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def load_items(path: str = "items.json") -> List[Any]:
+    """
+    Read an item catalog: one item per line for .jsonl paths (see
+    dump_ndjson), otherwise a single JSON array.
+    """
+    if str(path).endswith(".jsonl"):
+        return list(iter_ndjson(path))
+    return load_json(path)
+
+
+def canonical_json(obj: Any) -> bytes:
+    """
+    Compact JSON bytes with sorted keys, suitable as a cache key.
+    
+    Raises TypeError for values that are not plain JSON types (datetime,
+    dataclass, str subclasses, ...) so they are never conflated with the
+    string they would serialize to.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except orjson.JSONEncodeError as e:
+            raise TypeError(str(e)) from e
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def canonical_key(obj: Any) -> int:
+    """
+    64-bit hash of the canonical JSON of obj, for memoization keys.
+    
+    Uses xxh64 when xxhash is installed, otherwise an 8-byte blake2b digest.
+    Raises TypeError for the same non-JSON values as canonical_json().
+    """
+    payload = canonical_json(obj)
+    if HAS_XXHASH:
+        return xxhash.xxh64_intdigest(payload)
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "little")
@@ -7,11 +7,11 @@ from typing import List, Dict, Optional
 import openai
 
 from src.prompts import (
-    get_explain_outfit_prompt,
-    get_accessory_suggestion_prompt,
-    get_style_validation_prompt,
-    get_weather_check_prompt,
-    get_color_harmony_prompt,
+    format_explain_outfit_prompt,
+    format_accessory_suggestion_prompt,
+    format_style_validation_prompt,
+    format_weather_check_prompt,
+    format_color_harmony_prompt,
 )
 
 
@@ -74,8 +74,7 @@ class OutfitExplainer:
         weather_str = f"{weather['temp_c']}°C, {weather.get('condition', 'unknown')}, humidity {weather.get('humidity', 'N/A')}%"
         style_str = ", ".join(user_style)
         
-        template = get_explain_outfit_prompt()
-        prompt = template.format(
+        prompt = format_explain_outfit_prompt(
             items=items_str,
             occasion=occasion,
             weather=weather_str,
@@ -104,8 +103,7 @@ class OutfitExplainer:
         Returns:
             List of suggested accessory names
         """
-        template = get_accessory_suggestion_prompt()
-        prompt = template.format(
+        prompt = format_accessory_suggestion_prompt(
             top_color=top_color,
             bottom_color=bottom_color,
             occasion=occasion,
@@ -134,8 +132,7 @@ class OutfitExplainer:
         styles_str = ", ".join(styles)
         items_str = "\n".join([f"- {it['title']}" for it in items])
         
-        template = get_style_validation_prompt()
-        prompt = template.format(
+        prompt = format_style_validation_prompt(
             styles=styles_str,
             items=items_str,
         )
@@ -167,8 +164,7 @@ class OutfitExplainer:
         """
         items_str = "\n".join([f"- {it['title']} ({it['material']})" for it in items])
         
-        template = get_weather_check_prompt()
-        prompt = template.format(
+        prompt = format_weather_check_prompt(
             temp_c=temp_c,
             humidity=humidity,
             condition=condition,
@@ -193,8 +189,7 @@ class OutfitExplainer:
         """
         colors_str = ", ".join(colors)
         
-        template = get_color_harmony_prompt()
-        prompt = template.format(colors=colors_str)
+        prompt = format_color_harmony_prompt(colors=colors_str)
         
         result = self._call_openai(prompt)
         try:
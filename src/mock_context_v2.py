@@ -54,13 +54,34 @@ def get_base_context() -> Dict[str, Any]:
     }
 
 
+# Top-level key order of get_base_context(), and the sections scenarios replace
+_BASE_KEYS = tuple(get_base_context())
+_BASE_SECTIONS = frozenset(_BASE_KEYS) - {"timestamp"}
+
+
+def _scenario_context(sections: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Equivalent of get_base_context() updated with `sections`.
+    
+    When a scenario replaces every base section (all scenarios below do),
+    the base defaults are never built just to be thrown away.
+    """
+    if not _BASE_SECTIONS <= sections.keys():
+        ctx = get_base_context()
+        ctx.update(sections)
+        return ctx
+    ctx = dict.fromkeys(_BASE_KEYS)
+    ctx["timestamp"] = datetime.now().isoformat()
+    ctx.update(sections)
+    return ctx
+
+
 def get_beach_wedding_context() -> Dict[str, Any]:
     """
     Scenario: Beach wedding guest (coastal, sunny, warm)
     Personal Color: Summer Soft
     """
-    ctx = get_base_context()
-    ctx.update({
+    return _scenario_context({
         "user_id": "user_beach_wedding_001",
         "user_query": "週末要去海邊參加婚禮，需要優雅但輕盈的裝扮，要展現Summer Soft色調的氣質",
         "weather": {
@@ -94,7 +115,6 @@ def get_beach_wedding_context() -> Dict[str, Any]:
             "max_temperature": 35
         }
     })
-    return ctx
 
 
 def get_office_meeting_context() -> Dict[str, Any]:
@@ -102,8 +122,7 @@ def get_office_meeting_context() -> Dict[str, Any]:
     Scenario: Important business meeting (professional environment)
     Personal Color: Autumn Deep
     """
-    ctx = get_base_context()
-    ctx.update({
+    return _scenario_context({
         "user_id": "user_office_meeting_001",
         "user_query": "重要客戶會議，需要專業得體、展現Autumn Deep色調的商務穿搭",
         "weather": {
@@ -137,7 +156,6 @@ def get_office_meeting_context() -> Dict[str, Any]:
             "min_temperature": 15
         }
     })
-    return ctx
 
 
 def get_casual_date_context() -> Dict[str, Any]:
@@ -145,8 +163,7 @@ def get_casual_date_context() -> Dict[str, Any]:
     Scenario: Weekend casual date (relaxed, outdoor)
     Personal Color: Spring Light
     """
-    ctx = get_base_context()
-    ctx.update({
+    return _scenario_context({
         "user_id": "user_casual_date_001",
         "user_query": "週末約會，輕鬆但精緻，展現Spring Light明亮色調的魅力",
         "weather": {
@@ -179,7 +196,6 @@ def get_casual_date_context() -> Dict[str, Any]:
             "sun_protection": False
         }
     })
-    return ctx
 
 
 def get_formal_dinner_context() -> Dict[str, Any]:
@@ -187,8 +203,7 @@ def get_formal_dinner_context() -> Dict[str, Any]:
     Scenario: Formal evening dinner (elegant, sophisticated)
     Personal Color: Winter Clear
     """
-    ctx = get_base_context()
-    ctx.update({
+    return _scenario_context({
         "user_id": "user_formal_dinner_001",
         "user_query": "晚宴盛典，展現Winter Clear冷色調的高級優雅",
         "weather": {
@@ -222,7 +237,6 @@ def get_formal_dinner_context() -> Dict[str, Any]:
             "luxury": True
         }
     })
-    return ctx
 
 
 def select_context(scenario: Literal["beach_wedding", "office_meeting", "casual_date", "formal_dinner"] = "beach_wedding") -> Dict[str, Any]:
@@ -246,6 +260,10 @@ def select_context(scenario: Literal["beach_wedding", "office_meeting", "casual_
     return getter()
 
 
+# Fields a context must have for outfit recommendation
+_REQUIRED_KEYS = frozenset({"user_query", "weather", "user_profile", "occasion"})
+
+
 def validate_context(context: Dict[str, Any]) -> bool:
     """
     Validate that context has required fields for outfit recommendation.
@@ -256,8 +274,7 @@ def validate_context(context: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_keys = {"user_query", "weather", "user_profile", "occasion"}
-    return all(key in context for key in required_keys)
+    return _REQUIRED_KEYS <= context.keys()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,15 @@
-"""LangChain prompt templates for outfit recommendation explanations."""
+"""
+LangChain prompt templates for outfit recommendation explanations.
+
+The format_*_prompt helpers fill the raw template strings directly with
+str.format, which gives the same text as PromptTemplate.format without
+LangChain's per-call input validation; use them on hot paths.
+"""
 
 from langchain.prompts import PromptTemplate
 
 # 主要推薦解釋 prompt
-EXPLAIN_OUTFIT_PROMPT = PromptTemplate(
-    input_variables=["items", "occasion", "weather", "user_style", "reason"],
-    template="""You are a professional fashion stylist. Given an outfit recommendation, provide a brief, engaging explanation in Traditional Chinese.
+_EXPLAIN_OUTFIT_TEMPLATE = """You are a professional fashion stylist. Given an outfit recommendation, provide a brief, engaging explanation in Traditional Chinese.
 
 Outfit items:
 {items}
@@ -22,12 +26,13 @@ Provide 2-3 short bullet points (each under 20 words) explaining why this outfit
 • [optional accessory suggestion]
 
 Output in Traditional Chinese."""
+EXPLAIN_OUTFIT_PROMPT = PromptTemplate(
+    input_variables=["items", "occasion", "weather", "user_style", "reason"],
+    template=_EXPLAIN_OUTFIT_TEMPLATE,
 )
 
 # 配件建議 prompt
-ACCESSORY_SUGGESTION_PROMPT = PromptTemplate(
-    input_variables=["top_color", "bottom_color", "occasion", "style"],
-    template="""As a fashion expert, suggest 2-3 accessory items (bag, shoes, jewelry, scarf, belt) to complete this outfit.
+_ACCESSORY_SUGGESTION_TEMPLATE = """As a fashion expert, suggest 2-3 accessory items (bag, shoes, jewelry, scarf, belt) to complete this outfit.
 
 Base outfit colors: Top={top_color}, Bottom={bottom_color}
 Occasion: {occasion}
@@ -37,12 +42,13 @@ Return ONLY a JSON array like:
 ["item1", "item2", "item3"]
 
 Be specific (e.g., "棕色皮帶" instead of just "belt")."""
+ACCESSORY_SUGGESTION_PROMPT = PromptTemplate(
+    input_variables=["top_color", "bottom_color", "occasion", "style"],
+    template=_ACCESSORY_SUGGESTION_TEMPLATE,
 )
 
 # 風格匹配驗證 prompt
-STYLE_VALIDATION_PROMPT = PromptTemplate(
-    input_variables=["styles", "items"],
-    template="""Check if the given outfit items match the requested styles.
+_STYLE_VALIDATION_TEMPLATE = """Check if the given outfit items match the requested styles.
 
 Requested styles: {styles}
 Outfit items:
@@ -52,12 +58,13 @@ Respond with a JSON object:
 {{"matches": true/false, "confidence": 0.0-1.0, "explanation": "..."}}
 
 Respond ONLY with valid JSON, no markdown."""
+STYLE_VALIDATION_PROMPT = PromptTemplate(
+    input_variables=["styles", "items"],
+    template=_STYLE_VALIDATION_TEMPLATE,
 )
 
 # 天氣適配性檢查 prompt
-WEATHER_CHECK_PROMPT = PromptTemplate(
-    input_variables=["temp_c", "humidity", "condition", "items"],
-    template="""Assess if this outfit is suitable for the given weather conditions.
+_WEATHER_CHECK_TEMPLATE = """Assess if this outfit is suitable for the given weather conditions.
 
 Weather: {temp_c}°C, humidity {humidity}%, {condition}
 Outfit items:
@@ -67,12 +74,13 @@ Return JSON:
 {{"suitable": true/false, "score": 0.0-1.0, "adjustment": "..."}}
 
 Respond ONLY with valid JSON."""
+WEATHER_CHECK_PROMPT = PromptTemplate(
+    input_variables=["temp_c", "humidity", "condition", "items"],
+    template=_WEATHER_CHECK_TEMPLATE,
 )
 
 # 色彩和諧檢查 prompt
-COLOR_HARMONY_PROMPT = PromptTemplate(
-    input_variables=["colors"],
-    template="""Evaluate the color harmony of this outfit.
+_COLOR_HARMONY_TEMPLATE = """Evaluate the color harmony of this outfit.
 
 Colors: {colors}
 
@@ -81,12 +89,13 @@ Return JSON:
 {{"harmony_score": 0.0-1.0, "notes": "..."}}
 
 Respond ONLY with valid JSON."""
+COLOR_HARMONY_PROMPT = PromptTemplate(
+    input_variables=["colors"],
+    template=_COLOR_HARMONY_TEMPLATE,
 )
 
 # VTON (Virtual Try-On) Prompt 生成 - 這是關鍵的新 Prompt
-VTON_PROMPT_GENERATION = PromptTemplate(
-    input_variables=["outfit_description", "color", "material", "fit", "occasion", "style"],
-    template="""Generate a detailed Stable Diffusion/AI image generation prompt for virtual try-on of this outfit.
+_VTON_PROMPT_GENERATION_TEMPLATE = """Generate a detailed Stable Diffusion/AI image generation prompt for virtual try-on of this outfit.
 
 Outfit Details:
 - Description: {outfit_description}
@@ -111,13 +120,14 @@ Output format (JSON):
 }}
 
 Respond ONLY with valid JSON."""
+VTON_PROMPT_GENERATION = PromptTemplate(
+    input_variables=["outfit_description", "color", "material", "fit", "occasion", "style"],
+    template=_VTON_PROMPT_GENERATION_TEMPLATE,
 )
 
 
 # Enhanced VTON / Outfit recommendation prompt (emphasize environment and lighting)
-OUTFIT_RECOMMENDATION_PROMPT_V2 = PromptTemplate(
-    input_variables=["outfit_description", "color", "material", "fit", "occasion", "style", "weather", "time_of_day"],
-    template="""You are a virtual stylist generating a Stable Diffusion-ready prompt.
+_OUTFIT_RECOMMENDATION_PROMPT_V2_TEMPLATE = """You are a virtual stylist generating a Stable Diffusion-ready prompt.
 
 Include:
 1) Complete outfit description (color, material, fit)
@@ -135,12 +145,13 @@ Make sure the `vton_prompt` explicitly mentions the environment and lighting as
 Example vton_prompt start: "A photorealistic image of a model wearing {color} {material} {outfit_description}, standing in a {occasion} with {lighting}..."
 
 Respond ONLY with valid JSON."""
+OUTFIT_RECOMMENDATION_PROMPT_V2 = PromptTemplate(
+    input_variables=["outfit_description", "color", "material", "fit", "occasion", "style", "weather", "time_of_day"],
+    template=_OUTFIT_RECOMMENDATION_PROMPT_V2_TEMPLATE,
 )
 
 # 完整推薦輸出 Prompt - 給 Person 4 (Virtual Try-On Presenter)
-COMPLETE_RECOMMENDATION_PROMPT = PromptTemplate(
-    input_variables=["selected_outfit", "occasion", "weather", "user_style", "personal_color"],
-    template="""You are a fashion AI assistant. Create a complete outfit recommendation in JSON format for virtual try-on presentation.
+_COMPLETE_RECOMMENDATION_TEMPLATE = """You are a fashion AI assistant. Create a complete outfit recommendation in JSON format for virtual try-on presentation.
 
 Selected Outfit:
 {selected_outfit}
@@ -168,6 +179,9 @@ Output format (JSON):
 }}
 
 Respond ONLY with valid JSON, ensure Traditional Chinese for reasoning if needed."""
+COMPLETE_RECOMMENDATION_PROMPT = PromptTemplate(
+    input_variables=["selected_outfit", "occasion", "weather", "user_style", "personal_color"],
+    template=_COMPLETE_RECOMMENDATION_TEMPLATE,
 )
 
 
@@ -209,3 +223,42 @@ def get_outfit_recommendation_prompt_v2():
 def get_complete_recommendation_prompt():
     """Get the complete recommendation output prompt for Person 4."""
     return COMPLETE_RECOMMENDATION_PROMPT
+
+
+def format_explain_outfit_prompt(items: str, occasion: str, weather: str, user_style: str, reason: str) -> str:
+    """Filled EXPLAIN_OUTFIT_PROMPT text."""
+    return _EXPLAIN_OUTFIT_TEMPLATE.format(
+        items=items, occasion=occasion, weather=weather, user_style=user_style, reason=reason
+    )
+
+
+def format_accessory_suggestion_prompt(top_color: str, bottom_color: str, occasion: str, style: str) -> str:
+    """Filled ACCESSORY_SUGGESTION_PROMPT text."""
+    return _ACCESSORY_SUGGESTION_TEMPLATE.format(
+        top_color=top_color, bottom_color=bottom_color, occasion=occasion, style=style
+    )
+
+
+def format_style_validation_prompt(styles: str, items: str) -> str:
+    """Filled STYLE_VALIDATION_PROMPT text."""
+    return _STYLE_VALIDATION_TEMPLATE.format(styles=styles, items=items)
+
+
+def format_weather_check_prompt(temp_c, humidity, condition: str, items: str) -> str:
+    """Filled WEATHER_CHECK_PROMPT text."""
+    return _WEATHER_CHECK_TEMPLATE.format(temp_c=temp_c, humidity=humidity, condition=condition, items=items)
+
+
+def format_color_harmony_prompt(colors: str) -> str:
+    """Filled COLOR_HARMONY_PROMPT text."""
+    return _COLOR_HARMONY_TEMPLATE.format(colors=colors)
+
+
+def format_complete_recommendation_prompt(
+    selected_outfit: str, occasion: str, weather: str, user_style: str, personal_color: str
+) -> str:
+    """Filled COMPLETE_RECOMMENDATION_PROMPT text."""
+    return _COMPLETE_RECOMMENDATION_TEMPLATE.format(
+        selected_outfit=selected_outfit, occasion=occasion, weather=weather,
+        user_style=user_style, personal_color=personal_color
+    )
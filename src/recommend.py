@@ -1,11 +1,23 @@
 import json
 import os
+from functools import lru_cache
 import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
 import joblib
 from sklearn.metrics.pairwise import cosine_similarity
 
+from src.context_generator import preference_sets
+from src.json_utils import load_items
+
+# Optional: LightGBM model compiled to a native library (Treelite / TL2cgen)
+try:
+    import tl2cgen
+    import treelite
+    HAS_TL2CGEN = True
+except ImportError:
+    HAS_TL2CGEN = False
+
 # Import LLM tools
 try:
     from src.llm_chain import OutfitExplainer, create_explanation_tools
@@ -17,15 +29,42 @@ except ImportError:
 MODEL_NAME = "all-MiniLM-L6-v2"
 
 
-def load_items(path="items.json"):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_index(path="./data/items.index"):
+    """
+    Read a FAISS index, reusing the in-process copy while the file is unchanged.
+    
+    The returned index is shared between callers; search it, don't modify it.
+    """
+    return _read_index(path, os.path.getmtime(path))
 
 
-def load_index(path="./data/items.index"):
+@lru_cache(maxsize=4)
+def _read_index(path, mtime):
+    # mtime is part of the cache key so a rebuilt index file is re-read
     return faiss.read_index(path)
 
 
+def compile_model(model_path="model.joblib", lib_path="model.so", parallel_comp=32):
+    """
+    Compile the LightGBM ranker to a shared library with TL2cgen.
+    
+    The generated C code is specialized to this model's trees, which avoids
+    the generic predictor's per-node dispatch on single-row predictions.
+    The library is only rebuilt when it is older than the model.
+    
+    Returns:
+        lib_path
+    """
+    if not HAS_TL2CGEN:
+        raise ImportError("treelite and tl2cgen packages required: pip install treelite tl2cgen")
+    if os.path.exists(lib_path) and os.path.getmtime(lib_path) >= os.path.getmtime(model_path):
+        return lib_path
+    booster = joblib.load(model_path)
+    tl_model = treelite.frontend.from_lightgbm(booster)
+    tl2cgen.export_lib(tl_model, toolchain="gcc", libpath=lib_path, params={"parallel_comp": parallel_comp})
+    return lib_path
+
+
 def embed_text(texts):
     model = SentenceTransformer(MODEL_NAME)
     emb = model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
@@ -56,10 +95,13 @@ def assemble_outfits(candidates):
     return outfits
 
 
-def featurize_combo_for_model(combo, ctx):
+def featurize_combo_for_model(combo, ctx, pref_styles=None):
     # mimic features from train.py
+    # pref_styles: precomputed set of preferred styles (built once per request)
+    if pref_styles is None:
+        pref_styles = frozenset(ctx['preferences']['styles'])
     color_match = len([it['color'] for it in combo]) - len(set([it['color'] for it in combo]))
-    style_match = sum(1 for it in combo if it['style'] in ctx['preferences']['styles']) / len(combo)
+    style_match = sum(1 for it in combo if it['style'] in pref_styles) / len(combo)
     temp = ctx['weather']['temp_c']
     if temp <= 10:
         season = 'winter'
@@ -82,18 +124,20 @@ def explain_outfit(combo, ctx):
     return reasons
 
 
-def recommend(context_path="context.json", items_path="items.json", index_path="./data/items.index", model_path="model.joblib", top_n=3, use_llm=False):
+def recommend(context_path="context.json", items_path="items.json", index_path="./data/items.index", model_path="model.joblib", top_n=3, use_llm=False, compiled_model_path=None):
     items = load_items(items_path)
     index = load_index(index_path)
     with open(context_path, 'r', encoding='utf-8') as f:
         ctx = json.load(f)
     candidates, ctx_emb = retrieve_candidates(ctx, items, index, top_k=50)
     outfits = assemble_outfits(candidates)
-    # load model
-    if os.path.exists(model_path):
+    # load model (a compiled library from compile_model() takes precedence)
+    predictor = None
+    model = None
+    if compiled_model_path and HAS_TL2CGEN and os.path.exists(compiled_model_path):
+        predictor = tl2cgen.Predictor(compiled_model_path)
+    elif os.path.exists(model_path):
         model = joblib.load(model_path)
-    else:
-        model = None
     
     # Initialize LLM if requested and available
     explainer = None
@@ -103,14 +147,25 @@ def recommend(context_path="context.json", items_path="items.json", index_path="
         except ValueError as e:
             print(f"Warning: Could not initialize LLM: {e}")
     
-    scored = []
-    for o in outfits:
-        feats = featurize_combo_for_model(o, ctx)
-        score = model.predict([feats])[0] if model is not None else (feats[1] * 0.5 + feats[2] * 0.3 + feats[0] * 0.2)
-        scored.append((score, o))
-    scored.sort(key=lambda x: x[0], reverse=True)
+    pref_styles = preference_sets(ctx)["styles"]
+    # Score every candidate outfit with a single predict call on the full
+    # feature matrix (float64, the precision LightGBM splits on)
+    if not outfits:
+        # No top/bottom/shoes combination among the candidates
+        scores = np.empty(0)
+    else:
+        X = np.array([featurize_combo_for_model(o, ctx, pref_styles) for o in outfits], dtype=np.float64)
+        if predictor is not None:
+            scores = predictor.predict(tl2cgen.DMatrix(X)).ravel()
+        elif model is not None:
+            scores = np.asarray(model.predict(X)).ravel()
+        else:
+            scores = X[:, 1] * 0.5 + X[:, 2] * 0.3 + X[:, 0] * 0.2
+    # Stable descending order, so ties keep their assembly order
+    order = np.argsort(-scores, kind="stable")[:top_n]
+    scored = [(scores[i], outfits[i]) for i in order]
     recs = []
-    for rank, (s, o) in enumerate(scored[:top_n], start=1):
+    for rank, (s, o) in enumerate(scored, start=1):
         if explainer:
             reasons = explainer.explain_outfit(o, ctx['occasion'][0], ctx['weather'], ctx['preferences']['styles'])
             reasons = [r.strip() for r in reasons.split('\n') if r.strip().startswith('•')]
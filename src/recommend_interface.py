@@ -23,7 +23,7 @@ try:
     from src.data_loader import CatalogLoader
     from src.mock_context import select_context
     from src.llm_chain import OutfitExplainer
-    from src.prompts import get_complete_recommendation_prompt
+    from src.prompts import format_complete_recommendation_prompt
     HAS_MODULES = True
 except ImportError:
     HAS_MODULES = False
@@ -270,8 +270,7 @@ class OutfitRecommender:
         if self.use_llm and self.explainer:
             try:
                 # Use LLM for reasoning
-                prompt = get_complete_recommendation_prompt()
-                formatted_prompt = prompt.format(
+                formatted_prompt = format_complete_recommendation_prompt(
                     selected_outfit=json.dumps(selected_item, ensure_ascii=False),
                     occasion=context.get("occasion", {}).get("type", ""),
                     weather=context.get("weather", {}).get("condition", ""),
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Regenerate the checked-in fastjsonschema validators (src/_generated_validators).
+
+Each schema in src.schemas.SCHEMAS is compiled ahead of time with
+fastjsonschema.compile_to_code, so validate_schema can import the
+validator instead of compiling it at startup.
+
+Run after editing a schema:
+    python -m src.regen_validators
+Check that the generated code is up to date (exit code 1 if stale):
+    python -m src.regen_validators --check
+"""
+
+import sys
+from pathlib import Path
+from typing import List
+
+import fastjsonschema
+
+from src.schemas import SCHEMAS, FASTJSONSCHEMA_OPTIONS, schema_fingerprint
+
+OUTPUT_DIR = Path(__file__).parent / "_generated_validators"
+
+HEADER = '''"""Generated by `python -m src.regen_validators` from the "{name}" schema. Do not edit."""
+SCHEMA_HASH = "{fingerprint}"
+'''
+
+INIT_SOURCE = '''"""
+Ahead-of-time compiled fastjsonschema validators, one module per schema.
+Generated by `python -m src.regen_validators`; do not edit by hand.
+"""
+'''
+
+
+def generate_validator_code(name: str) -> str:
+    """Source code of the generated validator module for one schema."""
+    schema = SCHEMAS[name]
+    code = fastjsonschema.compile_to_code(schema, **FASTJSONSCHEMA_OPTIONS)
+    return HEADER.format(name=name, fingerprint=schema_fingerprint(schema)) + code
+
+
+def regenerate(check: bool = False) -> List[str]:
+    """
+    Write (or, with check=True, only compare) every generated module.
+
+    Returns:
+        Names of the files that were stale or missing
+    """
+    expected = {"__init__.py": INIT_SOURCE}
+    for name in SCHEMAS:
+        expected[f"{name}.py"] = generate_validator_code(name)
+
+    stale = []
+    for filename, source in expected.items():
+        path = OUTPUT_DIR / filename
+        if path.exists() and path.read_text(encoding="utf-8") == source:
+            continue
+        stale.append(filename)
+        if not check:
+            OUTPUT_DIR.mkdir(exist_ok=True)
+            path.write_text(source, encoding="utf-8")
+    return stale
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Regenerate compiled schema validators")
+    parser.add_argument("--check", action="store_true", help="Only report stale files; exit 1 if any")
+    args = parser.parse_args()
+
+    stale = regenerate(check=args.check)
+    if args.check:
+        if stale:
+            print(f"✗ Stale generated validators: {', '.join(stale)}")
+            print("  Run: python -m src.regen_validators")
+            sys.exit(1)
+        print("✓ Generated validators are up to date")
+    else:
+        print(f"✓ Wrote {len(stale)} file(s) to {OUTPUT_DIR}")
@@ -7,6 +7,8 @@ import joblib
 from sklearn.metrics.pairwise import cosine_similarity
 import lightgbm as lgb
 
+from src.json_utils import load_items
+
 
 def color_match_score(items):
     # simple heuristic: if any two items share same color -> +1
@@ -65,15 +67,16 @@ def build_training_data(items, contexts):
     X = []
     y = []
     for ctx in contexts:
+        pref_styles = frozenset(ctx["preferences"]["styles"])
         combos = create_candidates(items, ctx, max_cand=100)
         for combo in combos:
             # heuristic label: weighted sum of features
             s_color = color_match_score(combo)
-            s_style = style_match_score(combo, ctx["preferences"]["styles"])
+            s_style = style_match_score(combo, pref_styles)
             s_season = season_match_score(combo, ctx["weather"]["temp_c"])
             score = 0.4 * s_style + 0.3 * s_season + 0.3 * (s_color / 2.0)
             f = featurize_combo(combo, ctx_emb={
-                "styles": ctx["preferences"]["styles"],
+                "styles": pref_styles,
                 "temp_c": ctx["weather"]["temp_c"]
             })
             X.append(list(f.values()))
@@ -85,8 +88,7 @@ def build_training_data(items, contexts):
 
 def train_and_save(items_path="items.json", ctx_path="context.json", out_model="model.joblib"):
     import json
-    with open(items_path, "r", encoding="utf-8") as f:
-        items = json.load(f)
+    items = load_items(items_path)
     with open(ctx_path, "r", encoding="utf-8") as f:
         ctx = json.load(f)
     # create several context variations for training
@@ -0,0 +1,142 @@
+"""
+Regression tests for CatalogLoader embedding search.
+
+The quantized, memory-mapped, batched and query-cached search paths must
+return the same top-k items as the plain exact search. The query encoder
+is a deterministic stand-in, so no sentence-transformers model is loaded.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src import data_loader
+from src.data_loader import CatalogLoader
+
+
+N_ITEMS = 300
+DIM = 64
+TOP_K = 5
+# Catalog rows used as queries; each is followed by four near neighbours
+QUERY_ROWS = range(0, N_ITEMS - 4, 37)
+QUERIES = [f"query {i}" for i in QUERY_ROWS]
+
+
+class _FakeEncoder:
+    """Encodes "query <i>" as catalog row i plus a little fixed noise."""
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self):
+        return self.embeddings.shape[1]
+
+    def encode(self, texts, convert_to_numpy=True, batch_size=64):
+        self.encoded.extend(texts)
+        rows = [int(text.split()[-1]) for text in texts]
+        noise = np.stack([
+            np.random.default_rng(row).normal(scale=0.05, size=self.embeddings.shape[1]) for row in rows
+        ])
+        return (self.embeddings[rows] + noise).astype(np.float32)
+
+
+@pytest.fixture
+def catalog_files(tmp_path):
+    rng = np.random.default_rng(0)
+    catalog = [{"item_id": f"item_{i}", "title": f"Item {i}", "color": "navy"} for i in range(N_ITEMS)]
+    catalog_path = tmp_path / "items.json"
+    catalog_path.write_text(json.dumps(catalog), encoding="utf-8")
+    embeddings = rng.standard_normal((N_ITEMS, DIM)).astype(np.float32)
+    # Give each query row a few clearly ranked near neighbours, so top-k order
+    # is decided by real score gaps rather than near-ties between random rows
+    for row in QUERY_ROWS:
+        for offset, weight in enumerate((0.9, 0.8, 0.7, 0.6), start=1):
+            embeddings[row + offset] = weight * embeddings[row] + (1 - weight) * embeddings[row + offset]
+    embeddings_path = tmp_path / "embeddings.npy"
+    np.save(embeddings_path, embeddings)
+    return str(catalog_path), str(embeddings_path), embeddings
+
+
+@pytest.fixture
+def make_loader(catalog_files, monkeypatch):
+    """Build a CatalogLoader over the random catalog with the stand-in encoder."""
+    catalog_path, embeddings_path, embeddings = catalog_files
+    monkeypatch.setattr(data_loader, "HAS_EMBEDDINGS", True)
+    monkeypatch.setattr(data_loader, "HAS_SIMSIMD", False)
+
+    # The encoder is loaded lazily on the first search, so every loader in a
+    # test shares this one
+    encoder = _FakeEncoder(embeddings)
+    monkeypatch.setattr(data_loader, "_load_sentence_model", lambda name, **options: encoder)
+
+    def make(**kwargs):
+        return CatalogLoader(catalog_path, embeddings_path, **kwargs), encoder
+
+    return make
+
+
+def _ids(results):
+    return [item["item_id"] for item, _ in results]
+
+
+def _exact_top_k(loader):
+    return [loader.search_by_text(query, top_k=TOP_K, threshold=-1.0) for query in QUERIES]
+
+
+def test_batched_search_matches_single_queries(make_loader):
+    loader, _ = make_loader()
+    expected = _exact_top_k(loader)
+    batched = loader.search_by_texts(QUERIES, top_k=TOP_K, threshold=-1.0)
+
+    assert [_ids(r) for r in batched] == [_ids(r) for r in expected]
+    for got, want in zip(batched, expected):
+        assert [s for _, s in got] == pytest.approx([s for _, s in want], abs=1e-5)
+    assert [r[0][0]["item_id"] for r in batched] == [f"item_{q.split()[-1]}" for q in QUERIES]
+
+
+def test_quantized_search_matches_exact_top_k(make_loader):
+    exact, _ = make_loader()
+    quantized, _ = make_loader(quantize=True)
+
+    assert quantized.embeddings is None
+    assert quantized.embedding_dim == DIM
+    for got, want in zip(_exact_top_k(quantized), _exact_top_k(exact)):
+        assert _ids(got) == _ids(want)
+        assert [s for _, s in got] == pytest.approx([s for _, s in want], abs=0.02)
+
+
+def test_mmap_search_matches_in_memory(make_loader):
+    in_memory, _ = make_loader()
+    mapped, _ = make_loader(mmap_embeddings=True)
+
+    for got, want in zip(_exact_top_k(mapped), _exact_top_k(in_memory)):
+        assert _ids(got) == _ids(want)
+        assert [s for _, s in got] == pytest.approx([s for _, s in want], abs=1e-6)
+
+
+def test_query_cache_encodes_each_query_once(make_loader):
+    loader, encoder = make_loader()
+    first = loader.search_by_texts(QUERIES + QUERIES[:2], top_k=TOP_K, threshold=-1.0)
+    second = loader.search_by_texts(QUERIES, top_k=TOP_K, threshold=-1.0)
+
+    assert sorted(encoder.encoded) == sorted(QUERIES)
+    assert [_ids(r) for r in second] == [_ids(r) for r in first[: len(QUERIES)]]
+
+
+def test_get_stats_does_not_load_the_model(make_loader, monkeypatch):
+    loaded = []
+    encoder = data_loader._load_sentence_model("unused")
+    monkeypatch.setattr(data_loader, "_load_sentence_model", lambda name, **options: loaded.append(name) or encoder)
+    loader, _ = make_loader()
+
+    stats = loader.get_stats()
+    assert loaded == []
+    assert stats["has_embeddings"] is True
+    assert stats["model_checked"] is False
+
+    stats = loader.get_stats(check_model=True)
+    assert loaded == [loader.model_name]
+    assert stats["has_embeddings"] is True
+    assert stats["model_checked"] is True
@@ -0,0 +1,47 @@
+"""
+Tests for CatalogLoaderV2.filter_metadata's lowercased attribute cache.
+"""
+
+import json
+
+import pytest
+
+from src.data_loader_v2 import CatalogLoaderV2
+
+
+HOT_PARTY = {"weather": {"temperature_c": 30}, "occasion": {"type": "party"}}
+
+
+@pytest.fixture
+def loader(tmp_path):
+    path = tmp_path / "outfit_descriptions.json"
+    path.write_text(json.dumps([
+        {"category": "Coat", "material": "Cotton"},
+        {"category": "Upper", "material": "Linen"},
+        {"category": "Lower", "material": "Denim"},
+    ]), encoding="utf-8")
+    return CatalogLoaderV2(descriptions_path=str(path))
+
+
+def _materials(results):
+    return [item["material"] for item, _ in results]
+
+
+def _candidates(loader):
+    return [(item, 1.0) for item in loader.catalog.values()]
+
+
+def test_hot_weather_drops_coats(loader):
+    assert _materials(loader.filter_metadata(HOT_PARTY, _candidates(loader))) == ["Linen", "Denim"]
+
+
+def test_items_edited_in_place_are_refiltered(loader):
+    loader.catalog["outfit_1"]["material"] = "WOOL"
+
+    assert _materials(loader.filter_metadata(HOT_PARTY, _candidates(loader))) == ["Denim"]
+
+
+def test_replaced_items_use_their_own_attributes(loader):
+    loader.catalog["outfit_0"] = {"category": "Upper", "material": "Silk"}
+
+    assert _materials(loader.filter_metadata(HOT_PARTY, _candidates(loader))) == ["Silk", "Linen", "Denim"]
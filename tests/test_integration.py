@@ -0,0 +1,33 @@
+"""
+Tests for Step15InputBuilder's season inference.
+"""
+
+import math
+
+import pytest
+
+from src.integration import Step15InputBuilder
+
+
+TEMPS = [-math.inf, -5, 0, 0.5, 10, 10.01, 19.9, 20, 20.5, 35, math.inf, math.nan]
+
+
+def _reference_season(temp_c):
+    # The original threshold chain: NaN fails every comparison -> summer
+    if temp_c <= 0:
+        return "winter"
+    elif temp_c <= 10:
+        return "fall"
+    elif temp_c <= 20:
+        return "spring"
+    return "summer"
+
+
+@pytest.mark.parametrize("temp_c", TEMPS)
+def test_scalar_season_matches_threshold_rules(temp_c):
+    assert Step15InputBuilder._infer_season(temp_c) == _reference_season(temp_c)
+
+
+def test_batch_seasons_match_scalar():
+    batch = Step15InputBuilder._infer_seasons(TEMPS).tolist()
+    assert batch == [Step15InputBuilder._infer_season(t) for t in TEMPS]
@@ -0,0 +1,90 @@
+"""
+Tests for validate_schema's result cache and the AI_AGENT_FAST switch.
+"""
+
+import os
+import subprocess
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from src import schemas
+from src.schemas import validate_schema
+
+
+VALID_WEATHER = {"temp_c": 22, "condition": "sunny", "humidity": 60}
+INVALID_WEATHER = {"temp_c": 22, "condition": "foggy", "humidity": 60}
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """Run each test with an empty result cache and validation enabled."""
+    monkeypatch.setattr(schemas, "_RESULT_CACHE", OrderedDict())
+    monkeypatch.setattr(schemas, "FAST_MODE", False)
+
+
+@pytest.fixture
+def uncached_calls(monkeypatch):
+    """Record the payloads that reach the real validator (cache misses)."""
+    calls = []
+    validate = schemas._validate_uncached
+
+    def spy(data, schema_name):
+        calls.append(data)
+        return validate(data, schema_name)
+
+    monkeypatch.setattr(schemas, "_validate_uncached", spy)
+    return calls
+
+
+def test_cached_invalid_payload_stays_invalid(uncached_calls):
+    first = validate_schema(INVALID_WEATHER, "weather_context")
+    second = validate_schema(dict(INVALID_WEATHER), "weather_context")
+
+    assert first[0] is False and first[1]
+    assert second == first
+    assert len(uncached_calls) == 1
+
+
+def test_key_order_shares_a_cache_entry(uncached_calls):
+    reordered = dict(reversed(list(VALID_WEATHER.items())))
+
+    assert validate_schema(VALID_WEATHER, "weather_context") == (True, "")
+    assert validate_schema(reordered, "weather_context") == (True, "")
+    assert len(uncached_calls) == 1
+    assert len(schemas._RESULT_CACHE) == 1
+
+
+def test_valid_and_invalid_payloads_do_not_collide(uncached_calls):
+    assert validate_schema(VALID_WEATHER, "weather_context")[0] is True
+    assert validate_schema(INVALID_WEATHER, "weather_context")[0] is False
+    assert len(uncached_calls) == 2
+
+
+def test_fast_mode_skips_validation(monkeypatch, uncached_calls):
+    monkeypatch.setattr(schemas, "FAST_MODE", True)
+
+    assert validate_schema(INVALID_WEATHER, "weather_context") == (True, "")
+    assert uncached_calls == []
+
+
+def test_strict_still_rejects_invalid_data_in_fast_mode(monkeypatch):
+    monkeypatch.setattr(schemas, "FAST_MODE", True)
+
+    is_valid, error = validate_schema(INVALID_WEATHER, "weather_context", strict=True)
+    assert is_valid is False
+    assert error
+
+
+def test_fast_mode_is_read_from_the_environment():
+    code = (
+        "from src.schemas import FAST_MODE, validate_schema;"
+        "print(FAST_MODE, validate_schema({'condition': 'foggy'}, 'weather_context')[0])"
+    )
+    env = dict(os.environ, AI_AGENT_FAST="1", PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["True", "True"]